@@ -15,20 +15,24 @@ The SanTOK Walk Algorithm:
     3. Continue until energy depletes or target reached
 
 Features:
-- Weighted random walks
+- Weighted random walks (O(1) alias-table sampling)
+- Batched random walks (NumPy, thousands of walkers per step)
 - Deterministic shortest path
 - Multi-hop reasoning paths
+- K cheapest paths (Yen's algorithm)
 - Explanation generation
 """
 
-from typing import List, Dict, Any, Optional, Tuple, Set
+from typing import List, Dict, Any, Optional, Tuple, Set, Iterable, NamedTuple
 from dataclasses import dataclass, field
 from enum import Enum
+from array import array
 import random
 import math
 
 from ..graph import GraphStore, GraphNode, RelationType
 from ..graph.graph_edge import GraphEdge
+from ..graph.k_shortest_paths import k_shortest_paths
 
 
 class WalkMode(Enum):
@@ -75,6 +79,19 @@ class WalkResult:
         return "\n".join(lines)
 
 
+class AliasTable(NamedTuple):
+    """
+    Walker alias table over a node's outgoing edges.
+    
+    Slot i is taken with probability prob[i], else its alias; drawing a
+    slot uniformly and then one coin gives each edge its weighted share.
+    """
+    edges: Tuple[GraphEdge, ...]
+    prob: array         # array('d'), one float per edge
+    alias: array        # array('i'), one int per edge
+    total: float        # Sum of the edge weights (0.0: no walkable edge)
+
+
 class SanTOKGraphWalker:
     """
     SanTOK Custom Graph Walking Algorithm.
@@ -133,7 +150,8 @@ class SanTOKGraphWalker:
         self,
         graph: GraphStore,
         initial_energy: float = 10.0,
-        decay_rate: float = 0.1
+        decay_rate: float = 0.1,
+        include_inferred: bool = False
     ):
         """
         Initialize SanTOK Graph Walker.
@@ -142,10 +160,24 @@ class SanTOKGraphWalker:
             graph: GraphStore to walk
             initial_energy: Starting energy for walks
             decay_rate: Energy decay per step (added to relation cost)
+            include_inferred: Also walk the graph's inferred-edge overlay
         """
         self.graph = graph
         self.initial_energy = initial_energy
         self.decay_rate = decay_rate
+        self.include_inferred = include_inferred
+        
+        # Array-backed adjacency for random_walks, built lazily
+        self._walk_arrays: Optional[Tuple[Any, ...]] = None
+        self._walk_arrays_key: Optional[Tuple[int, Optional[int]]] = None
+        
+        # Per-node alias tables for random_walk, built lazily and dropped
+        # when the node's outgoing edges change
+        self._alias_tables: Dict[int, AliasTable] = {}
+        self._alias_version = graph.version
+        self._alias_overlay_version = graph.overlay_version
+        
+        self._stats = {"alias_builds": 0, "alias_invalidations": 0}
     
     def walk(
         self,
@@ -215,31 +247,16 @@ class SanTOKGraphWalker:
             accumulated_score=0
         ))
         
+        self._sync_alias_tables()
+        
         for _ in range(steps):
-            # Get outgoing edges
-            edges = self.graph.get_outgoing_edges(current)
-            
-            # Filter to unvisited (optional - allow revisits for random walk)
-            if not edges:
+            # Alias table over the outgoing edges (None at a dead end)
+            table = self._alias_table(current)
+            if table is None or table.total == 0:
                 break
             
-            # Choose random edge weighted by score
-            weights = [self.RELATION_SCORES.get(e.relation_type, 0.5) for e in edges]
-            total_weight = sum(weights)
-            
-            if total_weight == 0:
-                break
-            
-            # Weighted random selection
-            r = random.random() * total_weight
-            cumulative = 0
-            chosen_edge = edges[0]
-            
-            for edge, weight in zip(edges, weights):
-                cumulative += weight
-                if r <= cumulative:
-                    chosen_edge = edge
-                    break
+            # Weighted random selection, O(1) per step
+            chosen_edge = self._sample_edge(table)
             
             # Compute cost
             cost = self.RELATION_COSTS.get(chosen_edge.relation_type, 0.5) + self.decay_rate
@@ -275,6 +292,186 @@ class SanTOKGraphWalker:
             terminated_reason="steps" if len(path) > steps else "energy"
         )
     
+    def random_walks(
+        self,
+        sources: Iterable[int],
+        steps: int = 10,
+        walks_per_node: int = 1,
+        seed: Optional[int] = None
+    ) -> "numpy.ndarray":
+        """
+        Perform many random walks at once (for co-occurrence and embedding jobs).
+        
+        Transitions follow the same weights as random_walk, but all walkers
+        advance together over an array-backed (CSR) copy of the adjacency,
+        so a step costs a few NumPy operations instead of a Python loop per
+        walker. Walks are not energy-limited; they stop only at dead ends.
+        
+        Args:
+            sources: Starting node IDs
+            steps: Steps per walk
+            walks_per_node: Walks started from each source
+            seed: Seed for this call's random generator (same seed, same walks)
+            
+        Returns:
+            int64 matrix of shape (len(sources) * walks_per_node, steps + 1),
+            one walk per row (walks from a source are consecutive). After a
+            dead end, and for unknown sources, the row is padded with -1.
+        """
+        import numpy as np
+        
+        node_ids, index, indptr, targets, cumulative = self._get_walk_arrays()
+        rng = np.random.default_rng(seed)
+        
+        starts = np.array([index.get(source, -1) for source in sources], dtype=np.int64)
+        current = np.repeat(starts, walks_per_node)
+        walks = np.full((len(current), steps + 1), -1, dtype=np.int64)
+        walks[:, 0] = current
+        
+        alive = np.flatnonzero(current >= 0)
+        for step in range(1, steps + 1):
+            if not len(alive):
+                break
+            position = current[alive]
+            low, high = indptr[position], indptr[position + 1]
+            total = cumulative[high] - cumulative[low]
+            
+            # Dead ends (no edges, or only zero-weight ones) stop here
+            moving = total > 0
+            if not moving.all():
+                alive, low, high, total = alive[moving], low[moving], high[moving], total[moving]
+            
+            # Inverse-CDF sampling over the row's slice of the running sum
+            r = cumulative[low] + rng.random(len(alive)) * total
+            chosen = np.searchsorted(cumulative, r, side="right") - 1
+            np.clip(chosen, low, high - 1, out=chosen)
+            
+            current[alive] = targets[chosen]
+            walks[alive, step] = current[alive]
+        
+        # Dense indices back to node IDs
+        valid = walks >= 0
+        walks[valid] = node_ids[walks[valid]]
+        return walks
+    
+    def _transition_weight(self, edge: GraphEdge) -> float:
+        """Unnormalized probability of a random walk taking an edge."""
+        return self.RELATION_SCORES.get(edge.relation_type, 0.5) * edge.weight
+    
+    # ═══════════════════════════════════════════════════════════════════
+    # ALIAS TABLES (O(1) weighted edge sampling)
+    # ═══════════════════════════════════════════════════════════════════
+    
+    def _alias_table(self, node_id: int) -> Optional[AliasTable]:
+        """Alias table over a node's outgoing edges, built on first use."""
+        table = self._alias_tables.get(node_id)
+        if table is None:
+            edges = self.graph.get_outgoing_edges(node_id, self.include_inferred)
+            if not edges:
+                return None
+            table = self._build_alias_table(edges)
+            self._alias_tables[node_id] = table
+        return table
+    
+    def _build_alias_table(self, edges: List[GraphEdge]) -> AliasTable:
+        """Build a Walker alias table (Vose's method) over edges."""
+        weights = [self._transition_weight(edge) for edge in edges]
+        total = sum(weights)
+        n = len(edges)
+        
+        # All-zero weights: keep a uniform table, flagged by total == 0
+        scaled = [w * n / total for w in weights] if total > 0 else [1.0] * n
+        prob = array("d", [1.0]) * n
+        alias = array("i", range(n))
+        
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            low, high = small.pop(), large.pop()
+            prob[low] = scaled[low]
+            alias[low] = high
+            scaled[high] -= 1.0 - scaled[low]
+            (small if scaled[high] < 1.0 else large).append(high)
+        # Leftovers are 1.0 up to rounding and keep prob 1.0
+        
+        self._stats["alias_builds"] += 1
+        return AliasTable(tuple(edges), prob, alias, total)
+    
+    def _sample_edge(self, table: AliasTable) -> GraphEdge:
+        """Draw one edge from an alias table: one random number, no scan."""
+        x = random.random() * len(table.edges)
+        i = int(x)
+        return table.edges[i] if x - i < table.prob[i] else table.edges[table.alias[i]]
+    
+    def _sync_alias_tables(self) -> None:
+        """Drop the tables of nodes whose outgoing edges changed."""
+        if self.include_inferred and self._alias_overlay_version != self.graph.overlay_version:
+            self._alias_tables.clear()
+            self._alias_overlay_version = self.graph.overlay_version
+        
+        if self._alias_version == self.graph.version:
+            return
+        
+        changes = self.graph.changes_since(self._alias_version)
+        if changes is None:
+            self._alias_tables.clear()
+        else:
+            for _, op, item in changes:
+                if op == "add_edge" or op == "remove_edge":
+                    if self._alias_tables.pop(item.source_id, None) is not None:
+                        self._stats["alias_invalidations"] += 1
+        self._alias_version = self.graph.version
+    
+    def invalidate_alias_tables(self) -> None:
+        """Drop every alias table (e.g. after editing edge weights in place)."""
+        self._alias_tables.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get statistics."""
+        return {"alias_tables": len(self._alias_tables), **self._stats}
+    
+    def _get_walk_arrays(self) -> Tuple[Any, ...]:
+        """
+        CSR adjacency for random_walks, rebuilt when the graph changes.
+        
+        Returns:
+            (node_ids, index, indptr, targets, cumulative): node IDs by dense
+            index, node ID -> dense index, row offsets, edge targets (dense)
+            and the running sum of edge weights, with a leading 0
+        """
+        import numpy as np
+        
+        overlay = self.graph.overlay_version if self.include_inferred else None
+        key = (self.graph.version, overlay)
+        if self._walk_arrays is not None and self._walk_arrays_key == key:
+            return self._walk_arrays
+        
+        nodes = self.graph.get_all_nodes()
+        index = {node.node_id: i for i, node in enumerate(nodes)}
+        indptr = [0]
+        targets: List[int] = []
+        weights: List[float] = []
+        for node in nodes:
+            for edge in self.graph.get_outgoing_edges(node.node_id, self.include_inferred):
+                target = index.get(edge.target_id)
+                if target is not None:
+                    targets.append(target)
+                    weights.append(self._transition_weight(edge))
+            indptr.append(len(targets))
+        
+        cumulative = np.zeros(len(weights) + 1)
+        np.cumsum(weights, out=cumulative[1:])
+        
+        self._walk_arrays = (
+            np.array([node.node_id for node in nodes], dtype=np.int64),
+            index,
+            np.array(indptr, dtype=np.int64),
+            np.array(targets, dtype=np.int64),
+            cumulative,
+        )
+        self._walk_arrays_key = key
+        return self._walk_arrays
+    
     def _shortest_path(self, source: int, target: int, max_hops: int) -> WalkResult:
         """Find shortest path using BFS."""
         from collections import deque
@@ -292,7 +489,7 @@ class SanTOKGraphWalker:
             if len(node_path) >= max_hops:
                 continue
             
-            for edge in self.graph.get_outgoing_edges(current):
+            for edge in self.graph.get_outgoing_edges(current, self.include_inferred):
                 if edge.target_id not in visited:
                     visited.add(edge.target_id)
                     queue.append((
@@ -327,7 +524,7 @@ class SanTOKGraphWalker:
             if len(node_path) >= max_hops:
                 continue
             
-            for edge in self.graph.get_outgoing_edges(current):
+            for edge in self.graph.get_outgoing_edges(current, self.include_inferred):
                 if edge.target_id not in visited:
                     edge_score = self.RELATION_SCORES.get(edge.relation_type, 0.5) * edge.weight
                     new_score = -neg_score + edge_score
@@ -349,21 +546,22 @@ class SanTOKGraphWalker:
         current = source
         node_path = [source]
         edge_path: List[GraphEdge] = []
+        self._sync_alias_tables()
         
         for _ in range(max_hops * 3):  # Allow more attempts
             if current == target:
                 return self._build_result(node_path, edge_path, True, "target")
             
-            edges = self.graph.get_edges_from(current)
-            if not edges:
+            table = self._alias_table(current)
+            if table is None:
                 break
             
             # Bias toward target if visible
-            target_edges = [e for e in edges if e.target_id == target]
+            target_edges = [e for e in table.edges if e.target_id == target]
             if target_edges:
                 chosen = target_edges[0]
             else:
-                chosen = random.choice(edges)
+                chosen = self._sample_edge(table)
             
             current = chosen.target_id
             node_path.append(current)
@@ -419,6 +617,37 @@ class SanTOKGraphWalker:
             terminated_reason=reason
         )
     
+    def find_k_best_paths(
+        self,
+        source: int,
+        target: int,
+        k: int = 10
+    ) -> List[WalkResult]:
+        """
+        Find the k cheapest paths between source and target (Yen's algorithm).
+        
+        Paths are ranked by the energy a walk along them uses (relation
+        cost + decay per hop), so the first result is the cheapest walk.
+        Runs at most k * (path length) shortest-path searches.
+        
+        Args:
+            source: Starting node ID
+            target: Target node ID
+            k: Number of paths to return
+            
+        Returns:
+            Up to k WalkResults, cheapest first
+        """
+        def neighbors(node_id: int):
+            for edge in self.graph.get_outgoing_edges(node_id, self.include_inferred):
+                cost = self.RELATION_COSTS.get(edge.relation_type, 0.5) + self.decay_rate
+                yield edge.target_id, edge, cost
+        
+        return [
+            self._build_result(scored.nodes, scored.edges, True, "target")
+            for scored in k_shortest_paths(source, target, k, neighbors)
+        ]
+    
     def find_all_paths(
         self,
         source: int,
@@ -426,7 +655,12 @@ class SanTOKGraphWalker:
         max_hops: int = 5,
         max_paths: int = 10
     ) -> List[WalkResult]:
-        """Find all paths between source and target (up to limit)."""
+        """
+        Find all paths between source and target (up to limit).
+        
+        Enumerates paths by DFS, which is exponential on hub-heavy
+        graphs; find_k_best_paths returns the best ones directly.
+        """
         all_paths: List[WalkResult] = []
         
         def dfs(current: int, path: List[int], edges: List[GraphEdge], visited: Set[int]):
@@ -441,7 +675,7 @@ class SanTOKGraphWalker:
             if len(path) >= max_hops:
                 return
             
-            for edge in self.graph.get_outgoing_edges(current):
+            for edge in self.graph.get_outgoing_edges(current, self.include_inferred):
                 if edge.target_id not in visited:
                     visited.add(edge.target_id)
                     dfs(
@@ -22,7 +22,7 @@ from dataclasses import dataclass
 from collections import Counter
 import math
 
-from ..graph import GraphStore, RelationType
+from ..graph import GraphStore, RelationType, LandmarkIndex
 
 
 @dataclass
@@ -98,7 +98,8 @@ class SanTOKSimilarity:
         self,
         graph: Optional[GraphStore] = None,
         weights: Optional[Dict[str, float]] = None,
-        ngram_size: int = 3
+        ngram_size: int = 3,
+        landmarks: Optional[LandmarkIndex] = None
     ):
         """
         Initialize SanTOK Similarity.
@@ -107,10 +108,13 @@ class SanTOKSimilarity:
             graph: Optional GraphStore for graph-based similarity
             weights: Custom weights for components
             ngram_size: Size of character n-grams
+            landmarks: Optional hop-count LandmarkIndex over the graph, for
+                fast approximate relatedness of distant nodes
         """
         self.graph = graph
         self.weights = weights or self.DEFAULT_WEIGHTS.copy()
         self.ngram_size = ngram_size
+        self.landmarks = landmarks
     
     def compute(self, text_a: str, text_b: str) -> SimilarityResult:
         """
@@ -392,6 +396,7 @@ class SanTOKSimilarity:
         - Direct edge: 1.0
         - Common neighbors: 0.5-0.8
         - Path exists: 0.3-0.5
+        - Longer path (landmark estimate, if an index is set): up to 0.3
         - No connection: 0.0
         """
         if not self.graph:
@@ -420,6 +425,10 @@ class SanTOKSimilarity:
             # More common neighbors = higher relatedness
             return min(0.8, 0.5 + 0.1 * len(common))
         
+        # Landmarks prove no 2-hop path exists: skip the scan
+        if self.landmarks is not None and self.landmarks.lower_bound(node_a, node_b) > 2:
+            return self._landmark_relatedness(node_a, node_b)
+        
         # Check 2-hop path
         for neighbor in neighbors_a:
             neighbor_edges = self.graph.get_outgoing_edges(neighbor)
@@ -427,8 +436,18 @@ class SanTOKSimilarity:
                 if edge.target_id == node_b:
                     return 0.4
         
+        if self.landmarks is not None:
+            return self._landmark_relatedness(node_a, node_b)
+        
         return 0.0
     
+    def _landmark_relatedness(self, node_a: int, node_b: int) -> float:
+        """Approximate relatedness from the landmark upper bound on hop distance."""
+        hops = self.landmarks.upper_bound(node_a, node_b)
+        if hops == float("inf") or hops <= 0:
+            return 0.0
+        return min(0.3, 0.9 / hops)
+    
     def _digital_root_9(self, value: float) -> int:
         """Compute 9-centric digital root."""
         int_val = abs(int(value * 1000))
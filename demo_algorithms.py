@@ -220,13 +220,13 @@ Energy-based traversal with relation-weighted edges.
     result = walker.walk(1, 7, mode=WalkMode.WEIGHTED)
     print(result.explain())
     
-    # All paths
-    print("\n3. ALL PATHS (SanTOK → Answer):")
+    # K best paths
+    print("\n3. K BEST PATHS (SanTOK → Answer):")
     print("-" * 40)
     
-    all_paths = walker.find_all_paths(1, 7, max_hops=6)
+    best_paths = walker.find_k_best_paths(1, 7, k=3)
     
-    for i, path in enumerate(all_paths[:3]):
+    for i, path in enumerate(best_paths):
         print(f"\nPath {i+1} (score={path.total_score:.4f}):")
         nodes_str = " → ".join(s.node_text for s in path.path)
         print(f"  {nodes_str}")
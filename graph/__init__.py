@@ -8,12 +8,27 @@ Knowledge Graph implementation with:
 - GraphStore: Storage and query engine
 - RelationType: Types of relationships
 - RelationExtractor: Extract relations from text
+- ReachabilityIndex: Fast reachability along one relation
+- ReachabilityOverlay: Reachability with temporary extra edges
+- EquivalenceClasses: Union-find classes for symmetric, transitive relations
+- k_shortest_paths: K cheapest loopless paths (Yen's algorithm)
+- LandmarkIndex: Landmark (ALT) distance bounds for path queries
+- AncestorIndex: Ancestor bitsets for common / lowest common ancestor queries
 """
 
 from .graph_node import GraphNode
 from .graph_edge import GraphEdge, RelationType
 from .graph_store import GraphStore
 from .relation_extractor import RelationExtractor, ExtractedRelation
+from .reachability_index import (
+    ReachabilityIndex,
+    ReachabilityOverlay,
+    strongly_connected_components,
+)
+from .equivalence_classes import EquivalenceClasses, EquivalenceClass
+from .k_shortest_paths import k_shortest_paths, ScoredPath
+from .landmark_index import LandmarkIndex
+from .ancestor_index import AncestorIndex
 
 __all__ = [
     "GraphNode",
@@ -22,4 +37,13 @@ __all__ = [
     "RelationType",
     "RelationExtractor",
     "ExtractedRelation",
+    "ReachabilityIndex",
+    "ReachabilityOverlay",
+    "strongly_connected_components",
+    "EquivalenceClasses",
+    "EquivalenceClass",
+    "k_shortest_paths",
+    "ScoredPath",
+    "LandmarkIndex",
+    "AncestorIndex",
 ]
@@ -0,0 +1,351 @@
+"""
+AncestorIndex - Ancestor bitsets for hierarchy relations.
+
+Answers "which categories do all of these entities share?" without a
+BFS per entity. Built for IS_A / PART_OF hierarchies, where category
+summarization asks for common and lowest common ancestors of hundreds
+of nodes at once.
+
+How it works:
+- Strongly connected components are collapsed (iterative Tarjan) and
+  numbered in topological order, ancestors first: every edge goes from
+  a higher component id up to a lower one.
+- Each component stores its ancestor set as a bitset over component ids
+  (a Python int, so AND / OR run word-at-a-time in C). Ancestors have
+  low ids, so the bitsets of a shallow hierarchy stay short.
+- Common ancestors of n nodes are n - 1 ANDs. Lowest common ancestors
+  are peeled off from the highest set bit down: the highest remaining
+  component has no descendant in the set.
+
+Edge inserts that respect the numbering (a child pointing up to an
+existing or new parent) are applied incrementally from
+GraphStore.changes_since(), OR-ing the new ancestors into the
+descendants. Removals and out-of-order inserts trigger a lazy rebuild.
+"""
+
+from typing import Dict, Any, List, Set, Iterable, Tuple, FrozenSet
+from collections import defaultdict
+import weakref
+
+from .graph_edge import RelationType
+from .graph_store import GraphStore
+from .reachability_index import strongly_connected_components
+
+
+HIERARCHY_RELATIONS: FrozenSet[RelationType] = frozenset({RelationType.IS_A, RelationType.PART_OF})
+
+
+class AncestorIndex:
+    """
+    Ancestor sets of every node along hierarchy relations, as bitsets.
+    
+    Example:
+        index = AncestorIndex.shared(graph)
+        
+        index.common_ancestors([dog, cat, horse])           # node ids
+        index.lowest_common_ancestors([dog, cat, horse])    # most specific ones
+        index.is_ancestor(animal, dog)
+    """
+    
+    # One index per (graph, relations, include_inferred), shared by every component
+    _shared: "weakref.WeakKeyDictionary[GraphStore, Dict[Tuple[FrozenSet[RelationType], bool], AncestorIndex]]" = (
+        weakref.WeakKeyDictionary()
+    )
+    
+    def __init__(
+        self,
+        graph: GraphStore,
+        relations: Iterable[RelationType] = HIERARCHY_RELATIONS,
+        include_inferred: bool = False
+    ):
+        """
+        Initialize index (built lazily on first query).
+        
+        Args:
+            graph: Graph to index
+            relations: Relations whose edges point from child to parent
+            include_inferred: Also follow the graph's inferred-edge overlay
+        """
+        self.graph = graph
+        self.relations = frozenset(relations)
+        self.include_inferred = include_inferred
+        
+        self._version = -1          # Graph version the index reflects
+        self._overlay_version = -1  # Overlay version (include_inferred only)
+        self._dirty = True          # Needs a full rebuild
+        
+        # Node -> component; component -> members / DAG adjacency
+        self._comp: Dict[int, int] = {}
+        self._members: List[List[int]] = []
+        self._parents: List[Set[int]] = []
+        self._children: List[Set[int]] = []
+        
+        # Component -> bitset of ancestor components (itself included
+        # only if it lies on a cycle)
+        self._anc: List[int] = []
+        
+        # Component -> nodes on the longest chain up from it; bounds the
+        # hop distance to any ancestor (see height_bound)
+        self._up: List[int] = []
+        
+        self._stats = {
+            "queries": 0,
+            "rebuilds": 0,
+            "incremental_inserts": 0,
+            "propagations": 0,
+        }
+    
+    @classmethod
+    def shared(
+        cls,
+        graph: GraphStore,
+        relations: Iterable[RelationType] = HIERARCHY_RELATIONS,
+        include_inferred: bool = False
+    ) -> "AncestorIndex":
+        """Get the index shared by everything that uses this graph and relation set."""
+        indexes = cls._shared.get(graph)
+        if indexes is None:
+            indexes = {}
+            cls._shared[graph] = indexes
+        key = (frozenset(relations), include_inferred)
+        index = indexes.get(key)
+        if index is None:
+            index = cls(graph, key[0], include_inferred)
+            indexes[key] = index
+        return index
+    
+    # ═══════════════════════════════════════════════════════════════════
+    # QUERIES
+    # ═══════════════════════════════════════════════════════════════════
+    
+    def ancestors(self, node_id: int) -> List[int]:
+        """Every ancestor of a node (the node itself only if on a cycle)."""
+        self.sync()
+        self._stats["queries"] += 1
+        comp = self._comp.get(node_id)
+        return [] if comp is None else self._expand(self._anc[comp])
+    
+    def is_ancestor(self, ancestor_id: int, node_id: int) -> bool:
+        """Whether ancestor_id is reachable from node_id along the relations."""
+        self.sync()
+        self._stats["queries"] += 1
+        comp, anc = self._comp.get(node_id), self._comp.get(ancestor_id)
+        return comp is not None and anc is not None and bool(self._anc[comp] >> anc & 1)
+    
+    def common_ancestors(self, node_ids: Iterable[int]) -> List[int]:
+        """Ancestors shared by every node, most general first."""
+        self.sync()
+        self._stats["queries"] += 1
+        return self._expand(self._common_bits(node_ids))
+    
+    def lowest_common_ancestors(self, node_ids: Iterable[int]) -> List[int]:
+        """
+        Most specific shared ancestors.
+        
+        A common ancestor is lowest if no other common ancestor lies
+        below it. Several can exist (e.g. with multiple inheritance).
+        """
+        self.sync()
+        self._stats["queries"] += 1
+        bits = self._common_bits(node_ids)
+        
+        lowest = 0
+        while bits:
+            comp = bits.bit_length() - 1
+            lowest |= 1 << comp
+            bits &= ~(self._anc[comp] | 1 << comp)
+        return self._expand(lowest)
+    
+    def height_bound(self, node_id: int) -> int:
+        """
+        Upper bound on the hops from a node to its farthest ancestor.
+        
+        When it is within a depth limit, the limit cannot cut off any
+        ancestor and the index answer equals a depth-limited walk.
+        """
+        self.sync()
+        comp = self._comp.get(node_id)
+        if comp is None:
+            return 0
+        # On a cycle, the way back to the node itself takes one hop more
+        on_cycle = self._anc[comp] >> comp & 1
+        return self._up[comp] - 1 + on_cycle
+    
+    def _common_bits(self, node_ids: Iterable[int]) -> int:
+        bits = -1
+        for node_id in node_ids:
+            comp = self._comp.get(node_id)
+            if comp is None:
+                return 0
+            bits &= self._anc[comp]
+            if not bits:
+                return 0
+        return bits if bits != -1 else 0
+    
+    def _expand(self, bits: int) -> List[int]:
+        """Member nodes of the components in a bitset, in component order."""
+        nodes: List[int] = []
+        digits = bin(bits)[:1:-1]
+        comp = digits.find("1")
+        while comp != -1:
+            nodes.extend(self._members[comp])
+            comp = digits.find("1", comp + 1)
+        return nodes
+    
+    # ═══════════════════════════════════════════════════════════════════
+    # MAINTENANCE
+    # ═══════════════════════════════════════════════════════════════════
+    
+    def sync(self) -> None:
+        """Bring the index up to date with the graph."""
+        if self.include_inferred and self._overlay_version != self.graph.overlay_version:
+            self._dirty = True
+        
+        if not self._dirty and self._version == self.graph.version:
+            return
+        
+        if not self._dirty:
+            changes = self.graph.changes_since(self._version)
+            if changes is None:
+                self._dirty = True
+            else:
+                for _, op, item in changes:
+                    if op == "add_edge" and item.relation_type in self.relations:
+                        if self.graph.get_edge(item.edge_id) is item:
+                            self._insert(item.source_id, item.target_id)
+                    elif op == "remove_edge" and item.relation_type in self.relations:
+                        self._dirty = True
+                    if self._dirty:
+                        break
+        
+        if self._dirty:
+            self.rebuild()
+        self._version = self.graph.version
+    
+    def invalidate(self) -> None:
+        """Force a full rebuild on the next query."""
+        self._dirty = True
+    
+    def rebuild(self) -> None:
+        """Rebuild the whole index from the graph."""
+        adjacency: Dict[int, List[int]] = defaultdict(list)
+        nodes: List[int] = []
+        seen: Set[int] = set()
+        for relation in self.relations:
+            edges = self.graph.get_edges_by_type(relation)
+            if self.include_inferred:
+                edges = edges + self.graph.get_inferred_edges(relation)
+            for edge in edges:
+                adjacency[edge.source_id].append(edge.target_id)
+                for node in (edge.source_id, edge.target_id):
+                    if node not in seen:
+                        seen.add(node)
+                        nodes.append(node)
+        
+        # Tarjan emits sinks first; edges point to parents, so ancestors
+        # get the low ids
+        components = strongly_connected_components(nodes, lambda n: adjacency.get(n, ()))
+        self._members = components
+        self._comp = {node: c for c, members in enumerate(components) for node in members}
+        
+        self._parents = [set() for _ in components]
+        self._children = [set() for _ in components]
+        cyclic = [len(members) > 1 for members in components]
+        for source, targets in adjacency.items():
+            cs = self._comp[source]
+            for target in targets:
+                ct = self._comp[target]
+                if cs != ct:
+                    self._parents[cs].add(ct)
+                    self._children[ct].add(cs)
+                elif source == target:
+                    cyclic[cs] = True
+        
+        self._anc = []
+        self._up = []
+        for comp, members in enumerate(components):
+            bits = 1 << comp if cyclic[comp] else 0
+            up = 0
+            for parent in self._parents[comp]:
+                bits |= self._anc[parent] | 1 << parent
+                up = max(up, self._up[parent])
+            self._anc.append(bits)
+            self._up.append(len(members) + up)
+        
+        self._dirty = False
+        self._version = self.graph.version
+        self._overlay_version = self.graph.overlay_version
+        self._stats["rebuilds"] += 1
+    
+    def _new_comp(self, node_id: int) -> int:
+        comp = len(self._members)
+        self._comp[node_id] = comp
+        self._members.append([node_id])
+        self._parents.append(set())
+        self._children.append(set())
+        self._anc.append(0)
+        self._up.append(1)
+        return comp
+    
+    def _insert(self, child_id: int, parent_id: int) -> None:
+        """Apply one child -> parent edge, or mark the index dirty."""
+        # New nodes are numbered parent first, keeping child > parent
+        cp = self._comp.get(parent_id)
+        if cp is None:
+            cp = self._new_comp(parent_id)
+        cc = self._comp.get(child_id)
+        if cc is None:
+            cc = self._new_comp(child_id)
+        
+        if cc == cp:
+            if child_id == parent_id and not self._anc[cc] >> cc & 1:
+                # Self-loop: the node becomes its own ancestor
+                self._propagate(cc, self._anc[cc] | 1 << cc, self._up[cc])
+            self._stats["incremental_inserts"] += 1
+            return
+        
+        if cp > cc:
+            # Against the topological numbering (may close a cycle)
+            self._dirty = True
+            return
+        
+        if cp not in self._parents[cc]:
+            self._parents[cc].add(cp)
+            self._children[cp].add(cc)
+            self._propagate(
+                cc,
+                self._anc[cc] | self._anc[cp] | 1 << cp,
+                max(self._up[cc], len(self._members[cc]) + self._up[cp])
+            )
+        self._stats["incremental_inserts"] += 1
+    
+    def _propagate(self, comp: int, bits: int, up: int) -> None:
+        """Widen a component's ancestors and push the change down to its descendants."""
+        if bits == self._anc[comp] and up == self._up[comp]:
+            return
+        self._anc[comp], self._up[comp] = bits, up
+        
+        stack = [comp]
+        while stack:
+            current = stack.pop()
+            inherited = self._anc[current] | 1 << current
+            for child in self._children[current]:
+                child_bits = self._anc[child] | inherited
+                child_up = max(self._up[child], len(self._members[child]) + self._up[current])
+                if child_bits != self._anc[child] or child_up != self._up[child]:
+                    self._anc[child], self._up[child] = child_bits, child_up
+                    stack.append(child)
+                    self._stats["propagations"] += 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get statistics."""
+        return {
+            "nodes": len(self._comp),
+            "components": len(self._members),
+            "bitset_bytes": sum((bits.bit_length() + 7) // 8 for bits in self._anc),
+            **self._stats,
+        }
+    
+    def __repr__(self) -> str:
+        relations = ", ".join(sorted(r.value for r in self.relations))
+        return f"AncestorIndex({relations}, nodes={len(self._comp)}, components={len(self._members)})"
@@ -0,0 +1,266 @@
+"""
+EquivalenceClasses - Union-find classes for symmetric, transitive relations.
+
+For a relation that is both symmetric and transitive (e.g. SIMILAR_TO
+or RELATED_TO once a transitivity rule is enabled), every node in a
+connected cluster relates to every other one. Materializing that as
+pairwise facts costs O(n²) per cluster; a union-find structure
+answers "are A and B related?" in O(α(n)) with linear memory.
+
+Each class carries metadata (size, edge count, weakest and strongest
+edge weight) merged on every union, so class-level questions need no
+walk over the members.
+
+Edge inserts are applied incrementally from GraphStore.changes_since().
+Removals cannot be undone in a union-find and trigger a lazy rebuild.
+"""
+
+from typing import Dict, Any, List, Optional, Iterator
+from dataclasses import dataclass, field
+import weakref
+
+from .graph_edge import RelationType
+from .graph_store import GraphStore
+
+
+@dataclass
+class EquivalenceClass:
+    """
+    One class of mutually related nodes.
+    
+    Attributes:
+        class_id: Representative node id (changes as classes merge)
+        relation: Relation the class is closed under
+        size: Number of member nodes
+        edge_count: Base edges of the relation inside the class
+        min_weight: Weakest edge weight in the class
+        max_weight: Strongest edge weight in the class
+        members: Member node ids (unordered)
+    """
+    class_id: int
+    relation: RelationType
+    size: int = 1
+    edge_count: int = 0
+    min_weight: float = 1.0
+    max_weight: float = 0.0
+    members: List[int] = field(default_factory=list, repr=False)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "class_id": self.class_id,
+            "relation": self.relation.value,
+            "size": self.size,
+            "edge_count": self.edge_count,
+            "min_weight": self.min_weight,
+            "max_weight": self.max_weight,
+        }
+
+
+class EquivalenceClasses:
+    """
+    Union-find over the edges of one relation, read as undirected.
+    
+    Example:
+        classes = EquivalenceClasses.shared(graph, RelationType.RELATED_TO)
+        
+        classes.same_class(a, b)        # O(α(n)) membership
+        cls = classes.class_of(a)       # size, weights, members
+        
+        for cls in classes.classes(min_size=3):
+            print(cls.class_id, cls.size)
+    """
+    
+    # One structure per (graph, relation), shared by every component
+    _shared: "weakref.WeakKeyDictionary[GraphStore, Dict[RelationType, EquivalenceClasses]]" = (
+        weakref.WeakKeyDictionary()
+    )
+    
+    def __init__(self, graph: GraphStore, relation: RelationType):
+        """
+        Initialize (built lazily on first query).
+        
+        Args:
+            graph: Graph to index
+            relation: Symmetric, transitive relation
+        """
+        self.graph = graph
+        self.relation = relation
+        
+        self._version = -1          # Graph version the classes reflect
+        self._dirty = True          # Needs a full rebuild
+        
+        # node -> parent; roots map to themselves. Nodes without an
+        # edge of the relation are absent (singleton classes).
+        self._parent: Dict[int, int] = {}
+        
+        # root -> class metadata
+        self._classes: Dict[int, EquivalenceClass] = {}
+        
+        self._stats = {
+            "queries": 0,
+            "unions": 0,
+            "rebuilds": 0,
+            "incremental_inserts": 0,
+        }
+    
+    @classmethod
+    def shared(cls, graph: GraphStore, relation: RelationType) -> "EquivalenceClasses":
+        """Get the structure shared by everything that uses this graph and relation."""
+        structures = cls._shared.get(graph)
+        if structures is None:
+            structures = {}
+            cls._shared[graph] = structures
+        classes = structures.get(relation)
+        if classes is None:
+            classes = cls(graph, relation)
+            structures[relation] = classes
+        return classes
+    
+    # ═══════════════════════════════════════════════════════════════════
+    # QUERIES
+    # ═══════════════════════════════════════════════════════════════════
+    
+    def find(self, node_id: int) -> int:
+        """Representative of a node's class (the node itself if unrelated)."""
+        self.sync()
+        self._stats["queries"] += 1
+        return self._find(node_id)
+    
+    def same_class(self, a: int, b: int) -> bool:
+        """Whether a and b are related (directly or through the class)."""
+        if a == b:
+            return True
+        self.sync()
+        self._stats["queries"] += 1
+        return a in self._parent and b in self._parent and self._find(a) == self._find(b)
+    
+    def class_of(self, node_id: int) -> Optional[EquivalenceClass]:
+        """Metadata of a node's class, or None if the node has no such edge."""
+        self.sync()
+        self._stats["queries"] += 1
+        if node_id not in self._parent:
+            return None
+        return self._classes[self._find(node_id)]
+    
+    def members(self, node_id: int) -> List[int]:
+        """Every node in the same class, the node included."""
+        cls = self.class_of(node_id)
+        return list(cls.members) if cls is not None else [node_id]
+    
+    def classes(self, min_size: int = 2) -> Iterator[EquivalenceClass]:
+        """All classes with at least min_size members."""
+        self.sync()
+        for cls in self._classes.values():
+            if cls.size >= min_size:
+                yield cls
+    
+    def pair_count(self) -> int:
+        """Ordered related pairs the classes stand for (what pairwise facts would cost)."""
+        self.sync()
+        return sum(cls.size * (cls.size - 1) for cls in self._classes.values())
+    
+    def __len__(self) -> int:
+        """Number of classes (over nodes with at least one edge of the relation)."""
+        self.sync()
+        return len(self._classes)
+    
+    # ═══════════════════════════════════════════════════════════════════
+    # MAINTENANCE
+    # ═══════════════════════════════════════════════════════════════════
+    
+    def sync(self) -> None:
+        """Bring the classes up to date with the graph."""
+        if not self._dirty and self._version == self.graph.version:
+            return
+        
+        if not self._dirty:
+            changes = self.graph.changes_since(self._version)
+            if changes is None:
+                self._dirty = True
+            else:
+                for _, op, item in changes:
+                    if op == "add_edge" and item.relation_type == self.relation:
+                        self._union(item.source_id, item.target_id, item.weight)
+                        self._stats["incremental_inserts"] += 1
+                    elif op == "remove_edge" and item.relation_type == self.relation:
+                        self._dirty = True
+                        break
+        
+        if self._dirty:
+            self.rebuild()
+        self._version = self.graph.version
+    
+    def invalidate(self) -> None:
+        """Force a full rebuild on the next query."""
+        self._dirty = True
+    
+    def rebuild(self) -> None:
+        """Rebuild every class from the graph."""
+        self._parent = {}
+        self._classes = {}
+        for edge in self.graph.get_edges_by_type(self.relation):
+            self._union(edge.source_id, edge.target_id, edge.weight)
+        
+        self._dirty = False
+        self._version = self.graph.version
+        self._stats["rebuilds"] += 1
+    
+    def _find(self, node_id: int) -> int:
+        """Root of a node, with path halving."""
+        parent = self._parent
+        if node_id not in parent:
+            return node_id
+        while parent[node_id] != node_id:
+            parent[node_id] = parent[parent[node_id]]
+            node_id = parent[node_id]
+        return node_id
+    
+    def _add(self, node_id: int) -> None:
+        if node_id not in self._parent:
+            self._parent[node_id] = node_id
+            self._classes[node_id] = EquivalenceClass(
+                class_id=node_id,
+                relation=self.relation,
+                members=[node_id]
+            )
+    
+    def _union(self, a: int, b: int, weight: float) -> None:
+        """Merge the classes of a and b (union by size) for one edge."""
+        self._add(a)
+        self._add(b)
+        ra, rb = self._find(a), self._find(b)
+        
+        if ra != rb:
+            big, small = self._classes[ra], self._classes[rb]
+            if big.size < small.size:
+                ra, rb, big, small = rb, ra, small, big
+            
+            self._parent[rb] = ra
+            del self._classes[rb]
+            big.size += small.size
+            big.edge_count += small.edge_count
+            big.min_weight = min(big.min_weight, small.min_weight)
+            big.max_weight = max(big.max_weight, small.max_weight)
+            big.members.extend(small.members)
+            self._stats["unions"] += 1
+        
+        cls = self._classes[ra]
+        cls.edge_count += 1
+        cls.min_weight = min(cls.min_weight, weight)
+        cls.max_weight = max(cls.max_weight, weight)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get statistics."""
+        return {
+            "relation": self.relation.value,
+            "nodes": len(self._parent),
+            "classes": len(self._classes),
+            "largest_class": max((c.size for c in self._classes.values()), default=0),
+            **self._stats,
+        }
+    
+    def __repr__(self) -> str:
+        return (
+            f"EquivalenceClasses({self.relation.value}, nodes={len(self._parent)}, "
+            f"classes={len(self._classes)})"
+        )
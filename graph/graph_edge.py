@@ -84,6 +84,8 @@ class GraphEdge:
     - relation_type: What kind of relationship
     - weight: Strength/confidence (0.0 to 1.0)
     - evidence: Why this edge exists
+    - inferred: True for overlay edges derived by inference, in which
+      case weight is the derivation confidence and rule_id the rule
     
     Memory footprint: ~150 bytes per edge
     
@@ -112,6 +114,10 @@ class GraphEdge:
     # === METADATA ===
     created_at: datetime = field(default_factory=datetime.now)
     
+    # === PROVENANCE ===
+    inferred: bool = False                # Derived edge (inferred overlay)
+    rule_id: str = ""                     # Rule that derived it
+    
     # ═══════════════════════════════════════════════════════════════
     # MAGIC METHODS
     # ═══════════════════════════════════════════════════════════════
@@ -146,6 +152,11 @@ class GraphEdge:
         """Is this a weak relationship (weight < 0.3)?"""
         return self.weight < 0.3
     
+    @property
+    def confidence(self) -> float:
+        """Confidence of the edge (its weight)."""
+        return self.weight
+    
     @property
     def relation_name(self) -> str:
         """Get the relation type as a string."""
@@ -196,7 +207,9 @@ class GraphEdge:
             weight=max(0.0, min(1.0, new_weight)),
             evidence=self.evidence,
             properties=self.properties.copy(),
-            created_at=self.created_at
+            created_at=self.created_at,
+            inferred=self.inferred,
+            rule_id=self.rule_id
         )
     
     # ═══════════════════════════════════════════════════════════════
@@ -213,7 +226,9 @@ class GraphEdge:
             "weight": self.weight,
             "evidence": self.evidence,
             "properties": self.properties,
-            "created_at": self.created_at.isoformat() if self.created_at else None
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "inferred": self.inferred,
+            "rule_id": self.rule_id
         }
     
     @classmethod
@@ -233,7 +248,9 @@ class GraphEdge:
             weight=float(data.get("weight", 1.0)),
             evidence=str(data.get("evidence", "")),
             properties=data.get("properties", {}),
-            created_at=created_at
+            created_at=created_at,
+            inferred=bool(data.get("inferred", False)),
+            rule_id=str(data.get("rule_id", ""))
         )
     
     # ═══════════════════════════════════════════════════════════════
@@ -5,14 +5,15 @@ Pure Python implementation - NO external graph libraries.
 Provides O(1) node/edge lookup and efficient traversal.
 """
 
-from typing import Dict, List, Set, Optional, Tuple, Iterator, Any
+from typing import Dict, List, Set, Optional, Tuple, Iterator, Iterable, Any
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import defaultdict, deque
 import json
 import pickle
 
 from .graph_node import GraphNode
 from .graph_edge import GraphEdge, RelationType
+from .k_shortest_paths import k_shortest_paths
 
 
 @dataclass
@@ -23,6 +24,7 @@ class GraphStats:
     relation_type_counts: Dict[str, int] = field(default_factory=dict)
     avg_degree: float = 0.0
     isolated_nodes: int = 0
+    inferred_edge_count: int = 0
 
 
 class GraphStore:
@@ -41,6 +43,10 @@ class GraphStore:
     - _outgoing: Dict[node_id, Set[edge_id]]  # Adjacency list
     - _incoming: Dict[node_id, Set[edge_id]]  # Reverse adjacency
     - _by_type: Dict[relation_type, Set[edge_id]]  # Index by relation type
+    - _version: int  # Bumped on every node/edge mutation (cache key)
+    - _changes: deque  # Recent mutations, for incremental indexes
+    - _inferred_*: Overlay of derived edges (inferred=True), kept apart
+      from the base indices and only traversed when asked for
     
     Example:
         >>> store = GraphStore()
@@ -50,6 +56,9 @@ class GraphStore:
         >>> neighbors = store.get_neighbors(1)
     """
     
+    # Mutations kept for changes_since(); older ones force a full rebuild
+    CHANGE_LOG_SIZE = 10000
+    
     def __init__(self):
         # === PRIMARY STORAGE ===
         self._nodes: Dict[int, GraphNode] = {}
@@ -66,6 +75,31 @@ class GraphStore:
         
         # === EDGE ID GENERATOR ===
         self._next_edge_id = 1
+        
+        # === VERSION ===
+        # Bumped on every structural change; caches of derived data key on it.
+        # In-place edits of node/edge attributes are not tracked.
+        self._version = 0
+        
+        # === CHANGE LOG ===
+        # (version, op, node or edge) for the last CHANGE_LOG_SIZE mutations
+        self._changes: deque = deque(maxlen=self.CHANGE_LOG_SIZE)
+        
+        # === INFERRED OVERLAY ===
+        # Derived edges, with negative edge ids so they never clash with
+        # base edges. Not part of the structural version.
+        self._inferred_edges: Dict[int, GraphEdge] = {}
+        self._inferred_outgoing: Dict[int, Set[int]] = defaultdict(set)
+        self._inferred_incoming: Dict[int, Set[int]] = defaultdict(set)
+        self._inferred_keys: Dict[Tuple[int, int, RelationType], int] = {}
+        self._next_inferred_id = -1
+        self._inferred_tag: Optional[Tuple[int, Any]] = None
+        self._overlay_version = 0
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Unpickle, filling in attributes older pickles lack."""
+        self.__init__()
+        self.__dict__.update(state)
     
     # ═══════════════════════════════════════════════════════════════════
     # NODE OPERATIONS
@@ -84,6 +118,7 @@ class GraphStore:
         self._nodes[node.node_id] = node
         self._by_node_type[node.node_type].add(node.node_id)
         self._by_text[node.text.lower()].add(node.node_id)
+        self._record_change("add_node", node)
         return node.node_id
     
     def add_node_simple(self, node_id: int, text: str, node_type: str = "token") -> int:
@@ -142,6 +177,15 @@ class GraphStore:
         self._outgoing.pop(node_id, None)
         self._incoming.pop(node_id, None)
         
+        # Derived edges cannot outlive their endpoints
+        overlay_ids = (
+            self._inferred_outgoing.get(node_id, set())
+            | self._inferred_incoming.get(node_id, set())
+        )
+        for edge_id in overlay_ids:
+            self.remove_inferred_edge(edge_id)
+        
+        self._record_change("remove_node", node)
         return True
     
     def get_nodes_by_type(self, node_type: str) -> List[GraphNode]:
@@ -220,6 +264,7 @@ class GraphStore:
         # Update indices
         self._by_relation_type[relation_type.value].add(edge_id)
         
+        self._record_change("add_edge", edge)
         return edge_id
     
     def get_edge(self, edge_id: int) -> Optional[GraphEdge]:
@@ -270,6 +315,7 @@ class GraphStore:
         
         # Remove edge
         del self._edges[edge_id]
+        self._record_change("remove_edge", edge)
         return True
     
     def get_edges_by_type(self, relation_type: RelationType) -> List[GraphEdge]:
@@ -277,6 +323,10 @@ class GraphStore:
         edge_ids = self._by_relation_type.get(relation_type.value, set())
         return [self._edges[eid] for eid in edge_ids if eid in self._edges]
     
+    def count_edges_by_type(self, relation_type: RelationType) -> int:
+        """Number of edges of a relation type (O(1))."""
+        return len(self._by_relation_type.get(relation_type.value, ()))
+    
     def get_all_edges(self) -> List[GraphEdge]:
         """Get all edges in the graph."""
         return list(self._edges.values())
@@ -289,7 +339,8 @@ class GraphStore:
         self,
         node_id: int,
         direction: str = "outgoing",
-        relation_type: Optional[RelationType] = None
+        relation_type: Optional[RelationType] = None,
+        include_inferred: bool = False
     ) -> List[Tuple[GraphNode, GraphEdge]]:
         """
         Get neighboring nodes with connecting edges.
@@ -298,6 +349,7 @@ class GraphStore:
             node_id: Starting node
             direction: "outgoing", "incoming", or "both"
             relation_type: Filter by relation type (optional)
+            include_inferred: Also follow edges from the inferred overlay
         
         Returns:
             List of (neighbor_node, connecting_edge) tuples
@@ -306,35 +358,175 @@ class GraphStore:
         
         # Outgoing neighbors
         if direction in ("outgoing", "both"):
-            for edge_id in self._outgoing.get(node_id, set()):
-                edge = self._edges.get(edge_id)
-                if edge:
-                    if relation_type is None or edge.relation_type == relation_type:
-                        neighbor = self._nodes.get(edge.target_id)
-                        if neighbor:
-                            results.append((neighbor, edge))
+            for edge in self.get_outgoing_edges(node_id, include_inferred):
+                if relation_type is None or edge.relation_type == relation_type:
+                    neighbor = self._nodes.get(edge.target_id)
+                    if neighbor:
+                        results.append((neighbor, edge))
         
         # Incoming neighbors
         if direction in ("incoming", "both"):
-            for edge_id in self._incoming.get(node_id, set()):
-                edge = self._edges.get(edge_id)
-                if edge:
-                    if relation_type is None or edge.relation_type == relation_type:
-                        neighbor = self._nodes.get(edge.source_id)
-                        if neighbor:
-                            results.append((neighbor, edge))
+            for edge in self.get_incoming_edges(node_id, include_inferred):
+                if relation_type is None or edge.relation_type == relation_type:
+                    neighbor = self._nodes.get(edge.source_id)
+                    if neighbor:
+                        results.append((neighbor, edge))
         
         return results
     
-    def get_outgoing_edges(self, node_id: int) -> List[GraphEdge]:
-        """Get all outgoing edges from a node."""
+    def get_outgoing_edges(self, node_id: int, include_inferred: bool = False) -> List[GraphEdge]:
+        """Get all outgoing edges from a node (optionally with inferred ones)."""
         edge_ids = self._outgoing.get(node_id, set())
-        return [self._edges[eid] for eid in edge_ids if eid in self._edges]
-    
-    def get_incoming_edges(self, node_id: int) -> List[GraphEdge]:
-        """Get all incoming edges to a node."""
+        edges = [self._edges[eid] for eid in edge_ids if eid in self._edges]
+        if include_inferred:
+            overlay_ids = self._inferred_outgoing.get(node_id, ())
+            edges.extend(self._inferred_edges[eid] for eid in overlay_ids)
+        return edges
+    
+    def get_incoming_edges(self, node_id: int, include_inferred: bool = False) -> List[GraphEdge]:
+        """Get all incoming edges to a node (optionally with inferred ones)."""
         edge_ids = self._incoming.get(node_id, set())
-        return [self._edges[eid] for eid in edge_ids if eid in self._edges]
+        edges = [self._edges[eid] for eid in edge_ids if eid in self._edges]
+        if include_inferred:
+            overlay_ids = self._inferred_incoming.get(node_id, ())
+            edges.extend(self._inferred_edges[eid] for eid in overlay_ids)
+        return edges
+    
+    # ═══════════════════════════════════════════════════════════════════
+    # INFERRED OVERLAY
+    # ═══════════════════════════════════════════════════════════════════
+    
+    def add_inferred_edge(
+        self,
+        source_id: int,
+        target_id: int,
+        relation_type: RelationType,
+        confidence: float,
+        rule_id: str = "",
+        evidence: str = ""
+    ) -> Optional[int]:
+        """
+        Add a derived edge to the overlay.
+        
+        One overlay edge is kept per (source, target, relation); a
+        second derivation replaces it only with higher confidence.
+        
+        Args:
+            source_id: Source node ID
+            target_id: Target node ID
+            relation_type: Derived relation
+            confidence: Derivation confidence (stored as weight)
+            rule_id: Rule that derived the edge
+            evidence: Why the edge holds (optional)
+        
+        Returns:
+            Overlay edge id (negative), or None if a node is missing
+        """
+        if source_id not in self._nodes or target_id not in self._nodes:
+            return None
+        
+        key = (source_id, target_id, relation_type)
+        edge_id = self._inferred_keys.get(key)
+        if edge_id is not None:
+            edge = self._inferred_edges[edge_id]
+            if edge.weight < confidence:
+                edge.weight = confidence
+                edge.rule_id = rule_id
+                edge.evidence = evidence or edge.evidence
+                self._overlay_version += 1
+            return edge_id
+        
+        edge_id = self._next_inferred_id
+        self._next_inferred_id -= 1
+        
+        self._inferred_edges[edge_id] = GraphEdge(
+            edge_id=edge_id,
+            source_id=source_id,
+            target_id=target_id,
+            relation_type=relation_type,
+            weight=confidence,
+            evidence=evidence,
+            inferred=True,
+            rule_id=rule_id
+        )
+        self._inferred_outgoing[source_id].add(edge_id)
+        self._inferred_incoming[target_id].add(edge_id)
+        self._inferred_keys[key] = edge_id
+        self._overlay_version += 1
+        return edge_id
+    
+    def remove_inferred_edge(self, edge_id: int) -> bool:
+        """Remove one overlay edge. Returns True if it existed."""
+        edge = self._inferred_edges.pop(edge_id, None)
+        if edge is None:
+            return False
+        
+        self._inferred_outgoing[edge.source_id].discard(edge_id)
+        self._inferred_incoming[edge.target_id].discard(edge_id)
+        del self._inferred_keys[(edge.source_id, edge.target_id, edge.relation_type)]
+        self._overlay_version += 1
+        return True
+    
+    def set_inferred_edges(
+        self,
+        facts: Iterable[Tuple[int, int, RelationType, float, str]],
+        tag: Any = None
+    ) -> int:
+        """
+        Replace the whole overlay.
+        
+        Args:
+            facts: (source_id, target_id, relation, confidence, rule_id)
+            tag: Identifies what produced the overlay (e.g. a rule set
+                 fingerprint); see inferred_tag
+        
+        Returns:
+            Number of overlay edges
+        """
+        self.clear_inferred_edges()
+        for source_id, target_id, relation, confidence, rule_id in facts:
+            self.add_inferred_edge(source_id, target_id, relation, confidence, rule_id)
+        self._inferred_tag = (self._version, tag)
+        return len(self._inferred_edges)
+    
+    def clear_inferred_edges(self) -> None:
+        """Drop every overlay edge."""
+        self._inferred_edges.clear()
+        self._inferred_outgoing.clear()
+        self._inferred_incoming.clear()
+        self._inferred_keys.clear()
+        self._inferred_tag = None
+        self._overlay_version += 1
+    
+    def get_inferred_edge(self, edge_id: int) -> Optional[GraphEdge]:
+        """Get an overlay edge by ID. O(1)."""
+        return self._inferred_edges.get(edge_id)
+    
+    def get_inferred_edges(self, relation_type: Optional[RelationType] = None) -> List[GraphEdge]:
+        """Overlay edges, optionally of one relation type."""
+        return [
+            edge for edge in self._inferred_edges.values()
+            if relation_type is None or edge.relation_type == relation_type
+        ]
+    
+    @property
+    def inferred_edge_count(self) -> int:
+        return len(self._inferred_edges)
+    
+    @property
+    def inferred_tag(self) -> Optional[Tuple[int, Any]]:
+        """
+        (graph version, tag) the overlay was last set for, or None.
+        
+        The overlay is not updated when base edges change; producers
+        compare this to (version, tag) to decide whether to rebuild.
+        """
+        return self._inferred_tag
+    
+    @property
+    def overlay_version(self) -> int:
+        """Counter bumped on every overlay change."""
+        return self._overlay_version
     
     # ═══════════════════════════════════════════════════════════════════
     # PATH FINDING
@@ -415,6 +607,8 @@ class GraphStore:
         """
         Find all paths between two nodes using DFS.
         
+        Exponential on hub-heavy graphs; see find_k_best_paths.
+        
         Args:
             source_id: Starting node ID
             target_id: Target node ID
@@ -464,6 +658,44 @@ class GraphStore:
         dfs(source_id, [(source_id, None)], {source_id})
         return all_paths
     
+    def find_k_best_paths(
+        self,
+        source_id: int,
+        target_id: int,
+        k: int = 10
+    ) -> List[List[Tuple[GraphNode, Optional[GraphEdge]]]]:
+        """
+        Find the k shortest loopless paths (by hop count) using Yen's algorithm.
+        
+        Follows outgoing edges like find_all_paths, but returns the best
+        paths first without enumerating every path.
+        
+        Args:
+            source_id: Starting node ID
+            target_id: Target node ID
+            k: Number of paths to return
+        
+        Returns:
+            List of paths, shortest first, in the find_path format:
+            (node, edge_to_next) tuples with edge=None on the last one
+        """
+        if source_id not in self._nodes or target_id not in self._nodes:
+            return []
+        
+        def neighbors(node_id: int):
+            for edge_id in self._outgoing.get(node_id, ()):
+                edge = self._edges.get(edge_id)
+                if edge:
+                    yield edge.target_id, edge, 1.0
+        
+        paths = []
+        for scored in k_shortest_paths(source_id, target_id, k, neighbors):
+            edges: List[Optional[GraphEdge]] = list(scored.edges) + [None]
+            paths.append([
+                (self._nodes[nid], edge) for nid, edge in zip(scored.nodes, edges)
+            ])
+        return paths
+    
     # ═══════════════════════════════════════════════════════════════════
     # STATISTICS
     # ═══════════════════════════════════════════════════════════════════
@@ -485,7 +717,8 @@ class GraphStore:
             edge_count=edge_count,
             relation_type_counts=relation_counts,
             avg_degree=avg_degree,
-            isolated_nodes=isolated
+            isolated_nodes=isolated,
+            inferred_edge_count=len(self._inferred_edges)
         )
     
     @property
@@ -496,6 +729,38 @@ class GraphStore:
     def edge_count(self) -> int:
         return len(self._edges)
     
+    @property
+    def version(self) -> int:
+        """Monotonic structural version (changes whenever nodes/edges change)."""
+        return self._version
+    
+    def _record_change(self, op: str, item: Any) -> None:
+        """Bump the version and log the mutation."""
+        self._version += 1
+        if not hasattr(self, "_changes"):
+            # Graphs pickled before the change log existed
+            self._changes = deque(maxlen=self.CHANGE_LOG_SIZE)
+        self._changes.append((self._version, op, item))
+    
+    def changes_since(self, version: int) -> Optional[List[Tuple[int, str, Any]]]:
+        """
+        Mutations made after a given version, oldest first.
+        
+        Each entry is (version, op, item) with op one of "add_node",
+        "remove_node" (item is the GraphNode), "add_edge" or
+        "remove_edge" (item is the GraphEdge).
+        
+        Returns:
+            List of changes, or None if the log no longer reaches back
+            to that version (callers should rebuild from scratch)
+        """
+        if version >= self._version:
+            return []
+        changes = getattr(self, "_changes", None)
+        if not changes or changes[0][0] > version + 1:
+            return None
+        return [change for change in changes if change[0] > version]
+    
     def __len__(self) -> int:
         """Return number of nodes."""
         return len(self._nodes)
@@ -517,7 +782,8 @@ class GraphStore:
         return {
             "nodes": {str(nid): node.to_dict() for nid, node in self._nodes.items()},
             "edges": {str(eid): edge.to_dict() for eid, edge in self._edges.items()},
-            "next_edge_id": self._next_edge_id
+            "next_edge_id": self._next_edge_id,
+            "version": self._version
         }
     
     @classmethod
@@ -543,6 +809,12 @@ class GraphStore:
                 edge_id=edge.edge_id
             )
         
+        # Keep the saved version so derived state persisted with it
+        # (e.g. an inference closure) can be matched after loading. The
+        # replayed inserts are not a history of that version.
+        store._version = data.get("version", store._version)
+        store._changes.clear()
+        
         return store
     
     def save_json(self, filepath: str):
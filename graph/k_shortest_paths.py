@@ -0,0 +1,153 @@
+"""
+K shortest loopless paths (Yen's algorithm).
+
+Enumerating every simple path and sorting afterwards is exponential on
+hub-heavy graphs. Yen's algorithm finds the k cheapest loopless paths
+with at most k * (path length) shortest-path searches: each new path
+branches off ("spurs") from a prefix of the previous one, with the
+edges already used by accepted paths sharing that prefix blocked.
+
+The graph is given as a neighbor function, so the same code serves
+directed and undirected views and any edge cost model.
+"""
+
+from typing import Any, Callable, Dict, Hashable, Iterable, List, NamedTuple, Optional, Set, Tuple
+import heapq
+
+
+# (neighbor, edge, cost) as returned by a neighbor function
+Neighbor = Tuple[Hashable, Any, float]
+
+
+class ScoredPath(NamedTuple):
+    """A path found by k_shortest_paths."""
+    cost: float
+    nodes: List[Hashable]
+    edges: List[Any]
+    costs: List[float]
+
+
+def k_shortest_paths(
+    source: Hashable,
+    target: Hashable,
+    k: int,
+    neighbors: Callable[[Hashable], Iterable[Neighbor]]
+) -> List[ScoredPath]:
+    """
+    The k cheapest loopless paths from source to target.
+    
+    Args:
+        source: Start node
+        target: End node
+        k: Number of paths wanted
+        neighbors: Function returning (neighbor, edge, cost) for a node;
+            costs must be non-negative
+    
+    Returns:
+        Up to k paths, cheapest first. Costs are summed in path order.
+    """
+    if k <= 0:
+        return []
+    if source == target:
+        return [ScoredPath(0.0, [source], [], [])]
+    
+    # Memoized so edge objects stay identical between searches (blocked
+    # edges are tracked by identity)
+    adjacency: Dict[Hashable, List[Neighbor]] = {}
+    
+    def expand(node: Hashable) -> List[Neighbor]:
+        found = adjacency.get(node)
+        if found is None:
+            found = adjacency[node] = list(neighbors(node))
+        return found
+    
+    def shortest(
+        start: Hashable,
+        blocked_nodes: Set[Hashable],
+        blocked_edges: Set[int]
+    ) -> Optional[Tuple[List[Hashable], List[Any], List[float]]]:
+        """Dijkstra from start to target, avoiding blocked nodes and edges."""
+        dist = {start: 0.0}
+        parent: Dict[Hashable, Tuple[Hashable, Any, float]] = {}
+        done: Set[Hashable] = set()
+        heap = [(0.0, 0, start)]
+        sequence = 1
+        
+        while heap:
+            score, _, current = heapq.heappop(heap)
+            if current in done:
+                continue
+            done.add(current)
+            
+            if current == target:
+                nodes, edges, costs = [current], [], []
+                while current in parent:
+                    current, edge, cost = parent[current]
+                    nodes.append(current)
+                    edges.append(edge)
+                    costs.append(cost)
+                nodes.reverse()
+                edges.reverse()
+                costs.reverse()
+                return nodes, edges, costs
+            
+            for neighbor, edge, cost in expand(current):
+                if neighbor in blocked_nodes or id(edge) in blocked_edges:
+                    continue
+                new_score = score + cost
+                if new_score < dist.get(neighbor, float("inf")):
+                    dist[neighbor] = new_score
+                    parent[neighbor] = (current, edge, cost)
+                    heapq.heappush(heap, (new_score, sequence, neighbor))
+                    sequence += 1
+        
+        return None
+    
+    first = shortest(source, set(), set())
+    if first is None:
+        return []
+    
+    accepted = [ScoredPath(sum(first[2]), *first)]
+    seen = {tuple(map(id, first[1]))}
+    candidates: List[Tuple[float, int, ScoredPath]] = []
+    sequence = 0
+    
+    while len(accepted) < k:
+        previous = accepted[-1]
+        
+        previous_ids = [id(edge) for edge in previous.edges]
+        
+        for i in range(len(previous.nodes) - 1):
+            root_nodes = previous.nodes[:i + 1]
+            root_ids = previous_ids[:i]
+            
+            # Block the next edge of every accepted path sharing this root
+            # (same nodes and, in a multigraph, the same edges)
+            blocked_edges = {
+                id(path.edges[i])
+                for path in accepted
+                if len(path.edges) > i
+                and path.nodes[:i + 1] == root_nodes
+                and [id(edge) for edge in path.edges[:i]] == root_ids
+            }
+            spur = shortest(previous.nodes[i], set(root_nodes[:-1]), blocked_edges)
+            if spur is None:
+                continue
+            
+            nodes = root_nodes[:-1] + spur[0]
+            edges = previous.edges[:i] + spur[1]
+            key = tuple(map(id, edges))
+            if key in seen:
+                continue
+            seen.add(key)
+            
+            costs = previous.costs[:i] + spur[2]
+            path = ScoredPath(sum(costs), nodes, edges, costs)
+            heapq.heappush(candidates, (path.cost, sequence, path))
+            sequence += 1
+        
+        if not candidates:
+            break
+        accepted.append(heapq.heappop(candidates)[2])
+    
+    return accepted
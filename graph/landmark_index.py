@@ -0,0 +1,431 @@
+"""
+LandmarkIndex - Landmark (ALT) distance oracle.
+
+A few high-centrality nodes are picked as landmarks and the distance
+from each one to every node is stored in a compact array. By the
+triangle inequality, for any landmark L:
+
+    |d(L, a) - d(L, b)|  <=  d(a, b)  <=  d(L, a) + d(L, b)
+
+so every query gets a lower bound (an admissible, consistent A*
+heuristic) and an upper bound (a real path through L) in O(K).
+
+Edges are read in both directions, so distances "to" and "from" a
+landmark coincide and one array per landmark is enough. Edge costs
+are pluggable (hop count by default).
+
+Edge inserts are applied incrementally from GraphStore.changes_since()
+(distances only shrink, so a Dijkstra relaxation from the new edge is
+exact). A removal only invalidates the landmarks whose shortest-path
+tree used the edge; those are recomputed. Landmarks are re-selected
+once the graph has grown enough that the old choice may be poor.
+"""
+
+from typing import Dict, Any, List, Optional, Tuple, Iterator, Callable
+from array import array
+import heapq
+
+from .graph_edge import GraphEdge
+from .graph_store import GraphStore
+
+
+INF = float("inf")
+
+
+class LandmarkIndex:
+    """
+    Precomputed landmark distances for path bounds.
+    
+    Example:
+        index = LandmarkIndex(graph, num_landmarks=8)
+        
+        low, high = index.distance_bounds(a, b)
+        index.disconnected(a, b)        # True ⟹ no path at all
+        
+        # A* heuristic for PathFinder.find_best_path
+        finder.find_best_path(a, b, heuristic=index.heuristic(a, b, active=4))
+    """
+    
+    # Re-select landmarks once the node count has grown by this factor
+    RESELECT_GROWTH = 2.0
+    
+    # Slack when deciding whether a removed edge was on a shortest path
+    TIGHT_EPSILON = 1e-9
+    
+    def __init__(
+        self,
+        graph: GraphStore,
+        num_landmarks: int = 8,
+        cost: Optional[Callable[[GraphEdge], float]] = None,
+        include_inferred: bool = False
+    ):
+        """
+        Initialize (built lazily on first query).
+        
+        Args:
+            graph: Graph to index
+            num_landmarks: Number of landmarks (K)
+            cost: Non-negative edge cost (None = 1 per hop)
+            include_inferred: Also follow the graph's inferred-edge overlay
+        """
+        self.graph = graph
+        self.num_landmarks = num_landmarks
+        self.cost = cost
+        self.include_inferred = include_inferred
+        
+        self._version = -1          # Graph version the distances reflect
+        self._overlay_version = -1  # Overlay version (include_inferred only)
+        self._dirty = True          # Needs a full rebuild
+        self._selected_at = 0       # Node count when landmarks were chosen
+        
+        self._landmarks: List[int] = []
+        
+        # node -> position in the distance arrays; one array per landmark,
+        # INF where the node cannot be reached from it
+        self._slot: Dict[int, int] = {}
+        self._dist: List[array] = []
+        
+        self._stats = {
+            "queries": 0,
+            "rebuilds": 0,
+            "landmark_recomputes": 0,
+            "incremental_inserts": 0,
+            "relaxations": 0,
+        }
+    
+    # ═══════════════════════════════════════════════════════════════════
+    # QUERIES
+    # ═══════════════════════════════════════════════════════════════════
+    
+    @property
+    def landmarks(self) -> List[int]:
+        """Current landmark node ids."""
+        self.sync()
+        return list(self._landmarks)
+    
+    def lower_bound(self, a: int, b: int) -> float:
+        """
+        Lower bound on the path cost between a and b.
+        
+        Landmarks that do not reach both nodes are ignored, so the bound
+        is always finite (0.0 when nothing is known).
+        """
+        self.sync()
+        self._stats["queries"] += 1
+        sa, sb = self._slot.get(a), self._slot.get(b)
+        if sa is None or sb is None:
+            return 0.0
+        
+        bound = 0.0
+        for dist in self._dist:
+            da, db = dist[sa], dist[sb]
+            if da != INF and db != INF:
+                gap = da - db if da > db else db - da
+                if gap > bound:
+                    bound = gap
+        return bound
+    
+    def heuristic(
+        self,
+        source_id: Optional[int] = None,
+        target_id: Optional[int] = None,
+        active: Optional[int] = None
+    ) -> Callable[[int, int], float]:
+        """
+        lower_bound as a plain function over the current distances.
+        
+        Syncs once, then skips the per-call sync; use it for the length
+        of one search (e.g. as find_best_path's heuristic).
+        
+        Args:
+            source_id: Source of the search (optional)
+            target_id: Target of the search (optional)
+            active: With both endpoints given, only use the landmarks
+                giving the best bounds for that pair (cheaper per call)
+        """
+        self.sync()
+        slots = self._slot
+        dists = list(self._dist)
+        
+        if active is not None and source_id in slots and target_id in slots:
+            ss, st = slots[source_id], slots[target_id]
+            
+            def pair_bound(dist: array) -> float:
+                if dist[ss] == INF or dist[st] == INF:
+                    return 0.0
+                return abs(dist[ss] - dist[st])
+            
+            dists.sort(key=pair_bound, reverse=True)
+            dists = dists[:active]
+        
+        def bound(a: int, b: int) -> float:
+            sa, sb = slots.get(a), slots.get(b)
+            if sa is None or sb is None:
+                return 0.0
+            best = 0.0
+            for dist in dists:
+                da, db = dist[sa], dist[sb]
+                if da != INF and db != INF:
+                    gap = da - db if da > db else db - da
+                    if gap > best:
+                        best = gap
+            return best
+        
+        return bound
+    
+    def upper_bound(self, a: int, b: int) -> float:
+        """Cost of the best path through a landmark (INF if none)."""
+        self.sync()
+        self._stats["queries"] += 1
+        sa, sb = self._slot.get(a), self._slot.get(b)
+        if sa is None or sb is None:
+            return 0.0 if a == b else INF
+        
+        return min((dist[sa] + dist[sb] for dist in self._dist), default=INF)
+    
+    def distance_bounds(self, a: int, b: int) -> Tuple[float, float]:
+        """(lower, upper) bounds on the path cost between a and b."""
+        if a == b:
+            return 0.0, 0.0
+        return self.lower_bound(a, b), self.upper_bound(a, b)
+    
+    def disconnected(self, a: int, b: int) -> bool:
+        """
+        Certain that no path joins a and b.
+        
+        True when some landmark reaches exactly one of the two. False
+        means "not proven", not "connected".
+        """
+        if a == b:
+            return False
+        self.sync()
+        self._stats["queries"] += 1
+        sa, sb = self._slot.get(a), self._slot.get(b)
+        
+        for dist in self._dist:
+            reaches_a = sa is not None and dist[sa] != INF
+            reaches_b = sb is not None and dist[sb] != INF
+            if reaches_a != reaches_b:
+                return True
+        return False
+    
+    # ═══════════════════════════════════════════════════════════════════
+    # MAINTENANCE
+    # ═══════════════════════════════════════════════════════════════════
+    
+    def sync(self) -> None:
+        """Bring the distances up to date with the graph."""
+        if self.include_inferred and self._overlay_version != self.graph.overlay_version:
+            self._dirty = True
+        
+        if not self._dirty and self._version == self.graph.version:
+            return
+        
+        if not self._dirty:
+            changes = self.graph.changes_since(self._version)
+            if changes is None or self.graph.node_count >= self.RESELECT_GROWTH * max(self._selected_at, 1):
+                self._dirty = True
+            else:
+                self._apply(changes)
+        
+        if self._dirty:
+            self.rebuild()
+        self._version = self.graph.version
+    
+    def invalidate(self) -> None:
+        """Force a full rebuild (and landmark re-selection) on the next query."""
+        self._dirty = True
+    
+    def rebuild(self) -> None:
+        """Select landmarks and compute every distance array."""
+        self._slot = {}
+        self._dist = []
+        adjacency = self._adjacency()
+        self._landmarks = self._select(adjacency)
+        self._dist = [self._dijkstra(self._slot[landmark], adjacency) for landmark in self._landmarks]
+        
+        self._selected_at = self.graph.node_count
+        self._dirty = False
+        self._version = self.graph.version
+        self._overlay_version = self.graph.overlay_version
+        self._stats["rebuilds"] += 1
+    
+    def _adjacency(self) -> List[List[Tuple[int, float]]]:
+        """
+        Slot-indexed adjacency of the whole graph, with edge costs.
+        
+        Gives every current node a slot. Built once per rebuild so edge
+        costs are evaluated once, not once per landmark.
+        """
+        nodes = self.graph.get_all_nodes()
+        for node in nodes:
+            self._slot_of(node.node_id)
+        
+        adjacency: List[List[Tuple[int, float]]] = [[] for _ in range(len(self._slot))]
+        slot = self._slot
+        for node in nodes:
+            adjacency[slot[node.node_id]] = [
+                (slot[neighbor], cost) for neighbor, cost in self._neighbors(node.node_id)
+            ]
+        return adjacency
+    
+    def _select(self, adjacency: List[List[Tuple[int, float]]]) -> List[int]:
+        """
+        Highest-degree nodes, skipping direct neighbours of chosen ones.
+        
+        Adjacent hubs give almost the same bounds, so spreading the
+        landmarks out makes each one count.
+        """
+        node_ids = sorted(self._slot, key=self._slot.__getitem__)
+        ranked = sorted(range(len(node_ids)), key=lambda s: (-len(adjacency[s]), node_ids[s]))
+        
+        chosen: List[int] = []
+        near = set()
+        for slot in ranked:
+            if len(chosen) >= self.num_landmarks:
+                break
+            if slot in near:
+                continue
+            chosen.append(slot)
+            near.add(slot)
+            near.update(neighbor for neighbor, _ in adjacency[slot])
+        
+        # Small or dense graphs: fill up with the remaining hubs
+        for slot in ranked:
+            if len(chosen) >= self.num_landmarks:
+                break
+            if slot not in chosen:
+                chosen.append(slot)
+        
+        return [node_ids[slot] for slot in chosen]
+    
+    def _dijkstra(self, start: int, adjacency: List[List[Tuple[int, float]]]) -> array:
+        """Distances from one slot over a prebuilt adjacency."""
+        dist = array("d", [INF]) * len(adjacency)
+        dist[start] = 0.0
+        heap = [(0.0, start)]
+        
+        while heap:
+            score, current = heapq.heappop(heap)
+            if score > dist[current]:
+                continue
+            for neighbor, cost in adjacency[current]:
+                new_score = score + cost
+                if new_score < dist[neighbor]:
+                    dist[neighbor] = new_score
+                    heapq.heappush(heap, (new_score, neighbor))
+        
+        self._stats["landmark_recomputes"] += 1
+        return dist
+    
+    def _relax(self, dist: array, heap: List[Tuple[float, int]]) -> None:
+        """Dijkstra propagation from already-lowered seed distances."""
+        heapq.heapify(heap)
+        slot_of = self._slot_of
+        relaxations = 0
+        
+        while heap:
+            score, current = heapq.heappop(heap)
+            if score > dist[self._slot[current]]:
+                continue
+            for neighbor, cost in self._neighbors(current):
+                slot = slot_of(neighbor)
+                new_score = score + cost
+                if new_score < dist[slot]:
+                    dist[slot] = new_score
+                    heapq.heappush(heap, (new_score, neighbor))
+                    relaxations += 1
+        
+        self._stats["relaxations"] += relaxations
+    
+    def _apply(self, changes: List[Tuple[int, str, Any]]) -> None:
+        """Apply logged changes: recompute landmarks hit by removals, relax inserts."""
+        landmarks = set(self._landmarks)
+        removed: List[GraphEdge] = []
+        added: List[GraphEdge] = []
+        
+        for _, op, item in changes:
+            if op == "remove_node" and item.node_id in landmarks:
+                self._dirty = True
+                return
+            if op == "remove_edge":
+                removed.append(item)
+            elif op == "add_edge":
+                added.append(item)
+        
+        stale = [
+            i for i, dist in enumerate(self._dist)
+            if any(self._tight(dist, edge) for edge in removed)
+        ]
+        if stale:
+            adjacency = self._adjacency()
+            for i in stale:
+                self._dist[i] = self._dijkstra(self._slot[self._landmarks[i]], adjacency)
+        
+        for i, dist in enumerate(self._dist):
+            if i in stale:
+                continue
+            
+            # Inserts only shorten distances: seed Dijkstra from the new edges
+            seeds = []
+            for edge in added:
+                if self.graph.get_edge(edge.edge_id) is not edge:
+                    continue
+                cost = self._edge_cost(edge)
+                for u, v in ((edge.source_id, edge.target_id), (edge.target_id, edge.source_id)):
+                    du = self._distance(dist, u)
+                    if du + cost < self._distance(dist, v):
+                        dist[self._slot_of(v)] = du + cost
+                        seeds.append((du + cost, v))
+            if seeds:
+                self._relax(dist, seeds)
+        
+        self._stats["incremental_inserts"] += len(added)
+    
+    def _tight(self, dist: array, edge: GraphEdge) -> bool:
+        """Whether a (removed) edge may lie on one of the landmark's shortest paths."""
+        du = self._distance(dist, edge.source_id)
+        dv = self._distance(dist, edge.target_id)
+        if du == INF and dv == INF:
+            return False
+        cost = self._edge_cost(edge)
+        return (
+            du + cost <= dv + self.TIGHT_EPSILON
+            or dv + cost <= du + self.TIGHT_EPSILON
+        )
+    
+    def _distance(self, dist: array, node_id: int) -> float:
+        slot = self._slot.get(node_id)
+        return INF if slot is None else dist[slot]
+    
+    def _slot_of(self, node_id: int) -> int:
+        """Slot of a node, growing every array on first sight."""
+        slot = self._slot.get(node_id)
+        if slot is None:
+            slot = len(self._slot)
+            self._slot[node_id] = slot
+            for dist in self._dist:
+                dist.append(INF)
+        return slot
+    
+    def _neighbors(self, node_id: int) -> Iterator[Tuple[int, float]]:
+        """Neighbours in both edge directions, with edge costs."""
+        for edge in self.graph.get_outgoing_edges(node_id, self.include_inferred):
+            yield edge.target_id, self._edge_cost(edge)
+        for edge in self.graph.get_incoming_edges(node_id, self.include_inferred):
+            yield edge.source_id, self._edge_cost(edge)
+    
+    def _edge_cost(self, edge: GraphEdge) -> float:
+        return self.cost(edge) if self.cost is not None else 1.0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get statistics."""
+        return {
+            "landmarks": len(self._landmarks),
+            "nodes": len(self._slot),
+            "array_bytes": sum(d.itemsize * len(d) for d in self._dist),
+            **self._stats,
+        }
+    
+    def __repr__(self) -> str:
+        return f"LandmarkIndex(landmarks={len(self._landmarks)}, nodes={len(self._slot)})"
@@ -0,0 +1,599 @@
+"""
+ReachabilityIndex - Near-constant-time reachability for one relation.
+
+Answers "can A reach B following only R edges?" without walking the
+graph for every question. Built for hierarchy relations (IS_A,
+PART_OF, PRECEDES) where cycle checks and transitive lookups are hot.
+
+How it works:
+- Strongly connected components are collapsed (iterative Tarjan), so
+  the index also copes with graphs that already contain cycles.
+- Tree intervals on a spanning forest of the component DAG give a
+  positive certificate: B inside A's subtree ⟹ A reaches B.
+- Randomized interval labels (GRAIL) give a negative certificate:
+  B's label not inside A's label ⟹ A cannot reach B.
+- Only when neither certificate applies is a label-pruned DFS run.
+
+Edge inserts are applied incrementally from GraphStore.changes_since()
+(labels are widened up the ancestors of the new edge). Removals, and
+inserts that close a cycle, trigger a lazy rebuild.
+
+ReachabilityOverlay answers the same question for the indexed edges
+plus temporary ones (e.g. a batch of proposed edges), without touching
+the graph or the index.
+"""
+
+from typing import Dict, Any, List, Optional, Set, Tuple, Iterable, Callable, Hashable
+from collections import defaultdict
+import bisect
+import random
+import weakref
+
+from .graph_edge import GraphEdge, RelationType
+from .graph_store import GraphStore
+
+
+def strongly_connected_components(
+    nodes: Iterable[Hashable],
+    successors: Callable[[Hashable], Iterable[Hashable]]
+) -> List[List[Hashable]]:
+    """
+    Tarjan's algorithm, iterative (no recursion limit on deep graphs).
+    
+    Args:
+        nodes: Nodes to start from (all nodes of the graph)
+        successors: Function returning a node's successors
+    
+    Returns:
+        Components in reverse topological order (sinks first); each
+        component lists its nodes in discovery order
+    """
+    index: Dict[Hashable, int] = {}
+    lowlink: Dict[Hashable, int] = {}
+    on_stack: Set[Hashable] = set()
+    stack: List[Hashable] = []
+    components: List[List[Hashable]] = []
+    counter = 0
+    
+    for root in nodes:
+        if root in index:
+            continue
+        
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(successors(root)))]
+        
+        while work:
+            node, children = work[-1]
+            advanced = False
+            
+            for child in children:
+                if child not in index:
+                    index[child] = lowlink[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(successors(child))))
+                    advanced = True
+                    break
+                if child in on_stack and index[child] < lowlink[node]:
+                    lowlink[node] = index[child]
+            
+            if advanced:
+                continue
+            
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if lowlink[node] < lowlink[parent]:
+                    lowlink[parent] = lowlink[node]
+            
+            if lowlink[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                component.reverse()
+                components.append(component)
+    
+    return components
+
+
+class ReachabilityIndex:
+    """
+    Reachability index over the edges of a single relation.
+    
+    Example:
+        index = ReachabilityIndex.shared(graph, RelationType.IS_A)
+        
+        index.reaches(dog_id, animal_id)     # True via dog IS_A mammal IS_A animal
+        index.reaches(animal_id, dog_id)     # False (label check, no walk)
+        
+        # Adding the edge animal IS_A dog would close a cycle
+        creates_cycle = index.reaches(dog_id, animal_id)
+    """
+    
+    # One index per (graph, relation), shared by every component
+    _shared: "weakref.WeakKeyDictionary[GraphStore, Dict[RelationType, ReachabilityIndex]]" = (
+        weakref.WeakKeyDictionary()
+    )
+    
+    def __init__(self, graph: GraphStore, relation: RelationType, traversals: int = 3, seed: int = 0):
+        """
+        Initialize index (built lazily on first query).
+        
+        Args:
+            graph: Graph to index
+            relation: Relation whose edges are followed
+            traversals: Number of randomized interval labels
+            seed: Seed for the randomized traversals
+        """
+        self.graph = graph
+        self.relation = relation
+        self.traversals = max(1, traversals)
+        self.seed = seed
+        
+        self._version = -1          # Graph version the index reflects
+        self._dirty = True          # Needs a full rebuild
+        
+        # Node -> component, component -> members / DAG adjacency
+        self._comp: Dict[int, int] = {}
+        self._members: List[List[int]] = []
+        self._succ: List[Set[int]] = []
+        self._pred: List[Set[int]] = []
+        
+        # Spanning-forest intervals (positive certificate)
+        self._tree_pre: List[int] = []
+        self._tree_post: List[int] = []
+        
+        # Randomized labels (negative certificate), one pair per traversal
+        self._low: List[List[int]] = []
+        self._highs: List[List[int]] = []
+        self._clock = 0
+        
+        self._stats = {
+            "queries": 0,
+            "tree_hits": 0,
+            "label_rejections": 0,
+            "searches": 0,
+            "rebuilds": 0,
+            "incremental_inserts": 0,
+        }
+    
+    @classmethod
+    def shared(cls, graph: GraphStore, relation: RelationType) -> "ReachabilityIndex":
+        """Get the index shared by everything that uses this graph and relation."""
+        indexes = cls._shared.get(graph)
+        if indexes is None:
+            indexes = {}
+            cls._shared[graph] = indexes
+        index = indexes.get(relation)
+        if index is None:
+            index = cls(graph, relation)
+            indexes[relation] = index
+        return index
+    
+    # ═══════════════════════════════════════════════════════════════════
+    # QUERIES
+    # ═══════════════════════════════════════════════════════════════════
+    
+    def reaches(self, source_id: int, target_id: int) -> bool:
+        """
+        Check whether target is reachable from source along relation edges.
+        
+        A node always reaches itself.
+        """
+        self.sync()
+        self._stats["queries"] += 1
+        
+        if source_id == target_id:
+            return True
+        
+        ca = self._comp.get(source_id)
+        cb = self._comp.get(target_id)
+        if ca is None or cb is None:
+            return False
+        
+        return self._comp_reaches(ca, cb)
+    
+    def path(self, source_id: int, target_id: int) -> Optional[List[GraphEdge]]:
+        """
+        Find one path of relation edges from source to target.
+        
+        The walk only enters nodes whose labels can still reach the
+        target, so it rarely backtracks.
+        
+        Returns:
+            List of edges, [] if source == target, None if unreachable
+        """
+        if source_id == target_id:
+            return []
+        if not self.reaches(source_id, target_id):
+            return None
+        
+        cb = self._comp[target_id]
+        parent: Dict[int, Optional[GraphEdge]] = {source_id: None}
+        stack = [source_id]
+        
+        while stack:
+            node = stack.pop()
+            if node == target_id:
+                edges = []
+                while parent[node] is not None:
+                    edges.append(parent[node])
+                    node = parent[node].source_id
+                edges.reverse()
+                return edges
+            
+            for edge in self.graph.get_outgoing_edges(node):
+                if edge.relation_type != self.relation or edge.target_id in parent:
+                    continue
+                cn = self._comp.get(edge.target_id)
+                if cn is None or not self._comp_reaches(cn, cb):
+                    continue
+                parent[edge.target_id] = edge
+                stack.append(edge.target_id)
+        
+        return None
+    
+    def component_of(self, node_id: int) -> List[int]:
+        """Nodes in the same strongly connected component (cycle) as node_id."""
+        self.sync()
+        comp = self._comp.get(node_id)
+        return list(self._members[comp]) if comp is not None else [node_id]
+    
+    def overlay(self) -> "ReachabilityOverlay":
+        """Reachability over this index plus temporary edges (see ReachabilityOverlay)."""
+        return ReachabilityOverlay(self)
+    
+    def _comp_reaches(self, ca: int, cb: int) -> bool:
+        """Reachability between components."""
+        if ca == cb:
+            return True
+        
+        # Positive certificate: cb inside ca's spanning subtree
+        if self._tree_pre[ca] <= self._tree_pre[cb] and self._tree_post[cb] <= self._tree_post[ca]:
+            self._stats["tree_hits"] += 1
+            return True
+        
+        # Negative certificate: cb's label not inside ca's
+        if not self._label_contains(ca, cb):
+            self._stats["label_rejections"] += 1
+            return False
+        
+        # Label-pruned DFS over the component DAG
+        self._stats["searches"] += 1
+        visited = {ca}
+        stack = [ca]
+        while stack:
+            comp = stack.pop()
+            for child in self._succ[comp]:
+                if child == cb:
+                    return True
+                if child in visited or not self._label_contains(child, cb):
+                    continue
+                visited.add(child)
+                stack.append(child)
+        
+        return False
+    
+    def _label_contains(self, outer: int, inner: int) -> bool:
+        for low, high in zip(self._low, self._highs):
+            if low[inner] < low[outer] or high[inner] > high[outer]:
+                return False
+        return True
+    
+    # ═══════════════════════════════════════════════════════════════════
+    # MAINTENANCE
+    # ═══════════════════════════════════════════════════════════════════
+    
+    def sync(self) -> None:
+        """Bring the index up to date with the graph."""
+        if not self._dirty and self._version == self.graph.version:
+            return
+        
+        if not self._dirty:
+            changes = self.graph.changes_since(self._version)
+            if changes is None:
+                self._dirty = True
+            else:
+                for _, op, item in changes:
+                    if op == "add_edge" and item.relation_type == self.relation:
+                        self._insert(item.source_id, item.target_id)
+                    elif op == "remove_edge" and item.relation_type == self.relation:
+                        self._dirty = True
+                    if self._dirty:
+                        break
+        
+        if self._dirty:
+            self.rebuild()
+        self._version = self.graph.version
+    
+    def invalidate(self) -> None:
+        """Force a full rebuild on the next query."""
+        self._dirty = True
+    
+    def rebuild(self) -> None:
+        """Rebuild the whole index from the graph."""
+        adjacency: Dict[int, List[int]] = defaultdict(list)
+        nodes: List[int] = []
+        seen: Set[int] = set()
+        for edge in self.graph.get_edges_by_type(self.relation):
+            adjacency[edge.source_id].append(edge.target_id)
+            for node in (edge.source_id, edge.target_id):
+                if node not in seen:
+                    seen.add(node)
+                    nodes.append(node)
+        
+        components = strongly_connected_components(nodes, lambda n: adjacency.get(n, ()))
+        
+        # Number components in topological order (sources first)
+        components.reverse()
+        self._members = components
+        self._comp = {node: c for c, members in enumerate(components) for node in members}
+        
+        self._succ = [set() for _ in components]
+        self._pred = [set() for _ in components]
+        for source, targets in adjacency.items():
+            cs = self._comp[source]
+            for target in targets:
+                ct = self._comp[target]
+                if cs != ct:
+                    self._succ[cs].add(ct)
+                    self._pred[ct].add(cs)
+        
+        self._build_labels()
+        self._dirty = False
+        self._version = self.graph.version
+        self._stats["rebuilds"] += 1
+    
+    def _build_labels(self) -> None:
+        """Spanning-forest intervals and randomized labels."""
+        count = len(self._members)
+        rng = random.Random(self.seed)
+        roots = [c for c in range(count) if not self._pred[c]]
+        children = [sorted(s) for s in self._succ]
+        
+        self._low = []
+        self._highs = []
+        
+        for t in range(self.traversals):
+            order_roots = list(roots)
+            if t > 0:
+                rng.shuffle(order_roots)
+            
+            pre = [0] * count
+            post = [0] * count
+            visited = [False] * count
+            clock = 0
+            
+            for root in order_roots:
+                if visited[root]:
+                    continue
+                visited[root] = True
+                pre[root] = clock
+                clock += 1
+                kids = list(children[root])
+                if t > 0:
+                    rng.shuffle(kids)
+                work = [(root, iter(kids))]
+                
+                while work:
+                    comp, it = work[-1]
+                    advanced = False
+                    for child in it:
+                        if not visited[child]:
+                            visited[child] = True
+                            pre[child] = clock
+                            clock += 1
+                            kids = list(children[child])
+                            if t > 0:
+                                rng.shuffle(kids)
+                            work.append((child, iter(kids)))
+                            advanced = True
+                            break
+                    if not advanced:
+                        work.pop()
+                        post[comp] = clock
+                        clock += 1
+            
+            # low(c) = min over everything c reaches; components are in
+            # topological order, so sweep from sinks to sources
+            low = list(post)
+            for comp in range(count - 1, -1, -1):
+                for child in self._succ[comp]:
+                    if low[child] < low[comp]:
+                        low[comp] = low[child]
+            
+            if t == 0:
+                # First traversal is deterministic: its DFS tree doubles
+                # as the spanning forest for positive certificates
+                self._tree_pre = pre
+                self._tree_post = post
+            self._low.append(low)
+            self._highs.append(list(post))
+        
+        self._clock = clock
+    
+    def _insert(self, source_id: int, target_id: int) -> None:
+        """Apply a new relation edge incrementally."""
+        cs = self._node_comp(source_id)
+        ct = self._node_comp(target_id)
+        if cs == ct or ct in self._succ[cs]:
+            return
+        
+        # Closing a cycle merges components: rebuild instead
+        if self._comp_reaches(ct, cs):
+            self._dirty = True
+            return
+        
+        self._succ[cs].add(ct)
+        self._pred[ct].add(cs)
+        
+        # Widen labels of cs and its ancestors to contain ct's label
+        for low, high in zip(self._low, self._highs):
+            stack = [cs]
+            while stack:
+                comp = stack.pop()
+                if low[comp] <= low[ct] and high[comp] >= high[ct]:
+                    continue
+                low[comp] = min(low[comp], low[ct])
+                high[comp] = max(high[comp], high[ct])
+                stack.extend(self._pred[comp])
+        
+        self._stats["incremental_inserts"] += 1
+    
+    def _node_comp(self, node_id: int) -> int:
+        """Component of a node, creating a singleton for new nodes."""
+        comp = self._comp.get(node_id)
+        if comp is not None:
+            return comp
+        
+        comp = len(self._members)
+        self._comp[node_id] = comp
+        self._members.append([node_id])
+        self._succ.append(set())
+        self._pred.append(set())
+        
+        # Fresh interval after every existing one: contains nothing else
+        self._tree_pre.append(self._clock)
+        self._tree_post.append(self._clock + 1)
+        for low, high in zip(self._low, self._highs):
+            low.append(self._clock + 1)
+            high.append(self._clock + 1)
+        self._clock += 2
+        return comp
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics."""
+        return {
+            "relation": self.relation.value,
+            "nodes": len(self._comp),
+            "components": len(self._members),
+            **self._stats,
+        }
+    
+    def __repr__(self) -> str:
+        return (
+            f"ReachabilityIndex({self.relation.value}, nodes={len(self._comp)}, "
+            f"components={len(self._members)})"
+        )
+
+
+class ReachabilityOverlay:
+    """
+    Reachability along an indexed relation plus temporary edges.
+    
+    The index is brought up to date once and then only read. Queries
+    walk the component DAG together with the extra edges, entering a
+    component only if its label can still reach the target or the
+    source of an extra edge, so the work stays within the region the
+    extra edges can affect.
+    
+    Example:
+        overlay = ReachabilityIndex.shared(graph, RelationType.IS_A).overlay()
+        
+        for src, tgt in proposed:
+            if overlay.reaches(tgt, src):       # would close a cycle
+                continue
+            overlay.add_edge(src, tgt)
+    """
+    
+    def __init__(self, index: ReachabilityIndex):
+        """
+        Initialize overlay.
+        
+        Args:
+            index: Index of the base edges (synced now, then read-only)
+        """
+        index.sync()
+        self.index = index
+        
+        # Extra edges between keys: a component id, or ("node", id) for
+        # nodes without any indexed edge
+        self._extra: Dict[Hashable, List[Hashable]] = defaultdict(list)
+        
+        # (low, high) of the first label of every extra edge's source
+        # component, sorted, for "may reach any extra source" checks
+        self._source_labels: List[Tuple[int, int]] = []
+        self._source_comps: Set[int] = set()
+        
+        self._stats = {"queries": 0, "extra_edges": 0, "visited": 0}
+    
+    def add_edge(self, source_id: int, target_id: int) -> None:
+        """Add a temporary edge."""
+        source, target = self._key(source_id), self._key(target_id)
+        self._extra[source].append(target)
+        if isinstance(source, int) and source not in self._source_comps:
+            self._source_comps.add(source)
+            bisect.insort(self._source_labels, (self.index._low[0][source], self.index._highs[0][source]))
+        self._stats["extra_edges"] += 1
+    
+    def reaches(self, source_id: int, target_id: int) -> bool:
+        """Check whether target is reachable from source (base or extra edges)."""
+        self._stats["queries"] += 1
+        if source_id == target_id:
+            return True
+        if not self._extra:
+            return self.index.reaches(source_id, target_id)
+        
+        index = self.index
+        start, goal = self._key(source_id), self._key(target_id)
+        visited = {start}
+        stack = [start]
+        
+        while stack:
+            key = stack.pop()
+            self._stats["visited"] += 1
+            if key == goal:
+                return True
+            
+            children = list(self._extra.get(key, ()))
+            if isinstance(key, int):
+                children.extend(index._succ[key])
+            
+            for child in children:
+                if child in visited:
+                    continue
+                if isinstance(child, int) and not self._may_reach(child, goal):
+                    continue
+                visited.add(child)
+                stack.append(child)
+        
+        return False
+    
+    def _key(self, node_id: int) -> Hashable:
+        comp = self.index._comp.get(node_id)
+        return comp if comp is not None else ("node", node_id)
+    
+    def _may_reach(self, comp: int, goal: Hashable) -> bool:
+        """Whether a component can reach the goal or an extra edge (label check)."""
+        if comp == goal or comp in self._source_comps:
+            return True
+        if isinstance(goal, int) and self.index._label_contains(comp, goal):
+            return True
+        
+        # Some extra source's first label inside comp's: low in [low, high]
+        low, high = self.index._low[0][comp], self.index._highs[0][comp]
+        i = bisect.bisect_left(self._source_labels, (low, -1))
+        labels = self._source_labels
+        while i < len(labels) and labels[i][0] <= high:
+            if labels[i][1] <= high:
+                return True
+            i += 1
+        return False
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get overlay statistics."""
+        return dict(self._stats)
+    
+    def __repr__(self) -> str:
+        return (
+            f"ReachabilityOverlay({self.index.relation.value}, "
+            f"extra_edges={self._stats['extra_edges']})"
+        )
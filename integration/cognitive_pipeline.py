@@ -14,12 +14,14 @@ This is the main integration point between santok_complete and santok_cognitive.
 from typing import Dict, Any, List, Optional, Callable, Tuple
 from dataclasses import dataclass, field
 import time
+from pathlib import Path
 
 from ..graph import GraphStore, GraphNode, RelationType, RelationExtractor
 from ..trees import TreeStore, Tree
 from ..memory import UnifiedMemory, MemoryObject
 from ..reasoning import (
     InferenceEngine, 
+    InferenceCache,
     ContradictionDetector,
     HybridReasoner,
     StructuredContext,
@@ -146,10 +148,13 @@ class CognitivePipeline:
         self.embedding_bridge = EmbeddingBridge(self.memory)
         
         # Reasoning
-        self.inference_engine = InferenceEngine(self.graph)
+        self.inference_engine = InferenceEngine(
+            self.graph,
+            cache=InferenceCache.shared(self.memory)
+        )
         self.inference_engine.rules.add_builtin_rules()
         
-        self.contradiction_detector = ContradictionDetector(self.graph)
+        self.contradiction_detector = ContradictionDetector.shared(self.graph)
         self.reasoner = HybridReasoner(self.memory)
         
         # External components
@@ -304,7 +309,7 @@ class CognitivePipeline:
         # 6. Check contradictions
         contradictions = 0
         if self.config.check_contradictions:
-            cont_report = self.contradiction_detector.detect_all()
+            cont_report = self.contradiction_detector.detect_incremental()
             contradictions = len(cont_report.contradictions)
         
         # Update stats
@@ -446,12 +451,40 @@ class CognitivePipeline:
         }
     
     def save(self, directory: str) -> None:
-        """Save the pipeline state to directory."""
+        """
+        Save the pipeline state to directory.
+        
+        Besides the memory files, writes inference.pkl with the derived
+        facts of the last complete inference run (if any), so a restart
+        does not have to rerun inference.
+        """
         self.memory.save(directory)
+        self.inference_engine.save_closure(str(Path(directory) / "inference.pkl"))
     
     def load(self, directory: str) -> None:
-        """Load the pipeline state from directory."""
+        """
+        Load the pipeline state from directory.
+        
+        A saved inference closure is loaded as is when its base edges
+        match the loaded graph's, otherwise caught up with the loaded
+        graph. An LLM generator set with set_llm_generator() is kept.
+        """
         self.memory.load(directory)
+        
+        # memory.load() replaces the graph; rebind what was built on it
+        self.graph = self.memory.graph
+        self.token_bridge.graph = self.graph
+        self.inference_engine = InferenceEngine(
+            self.graph,
+            rules=self.inference_engine.rules,
+            cache=InferenceCache.shared(self.memory)
+        )
+        self.contradiction_detector = ContradictionDetector.shared(self.graph)
+        self.reasoner = HybridReasoner(self.memory)
+        if self._llm_generator is not None:
+            self.reasoner.set_generator(self._llm_generator)
+        
+        self.inference_engine.load_closure(str(Path(directory) / "inference.pkl"))
     
     def __repr__(self) -> str:
         return (
@@ -298,7 +298,8 @@ class UnifiedMemory:
         self,
         uid: str,
         relation_types: Optional[List[RelationType]] = None,
-        max_depth: int = 1
+        max_depth: int = 1,
+        include_inferred: bool = False
     ) -> List[MemoryObject]:
         """
         Find related memory objects through the graph.
@@ -307,6 +308,7 @@ class UnifiedMemory:
             uid: Starting memory object UID
             relation_types: Filter by relation types (None = all)
             max_depth: How many hops to traverse
+            include_inferred: Also follow the graph's inferred-edge overlay
             
         Returns:
             List of related MemoryObjects
@@ -322,7 +324,9 @@ class UnifiedMemory:
         for _ in range(max_depth):
             next_level = set()
             for node_id in current_level:
-                neighbors = self.graph.get_neighbors(node_id, direction="both")
+                neighbors = self.graph.get_neighbors(
+                    node_id, direction="both", include_inferred=include_inferred
+                )
                 for neighbor, edge in neighbors:
                     if relation_types and edge.relation_type not in relation_types:
                         continue
@@ -421,7 +425,8 @@ class UnifiedMemory:
         
         Creates:
         - objects.json (memory objects)
-        - graph.json (graph store)
+        - graph.json (graph store, with its version so derived state
+          saved alongside, e.g. an inference closure, can be matched)
         - trees.json (tree store)
         """
         path = Path(directory)
@@ -12,6 +12,10 @@ Core Components:
 
 Symbolic Reasoning:
 - InferenceEngine: Rule chaining, transitivity, confidence propagation
+- InferenceCache: Reuse inference results per graph version and rule set
+- RuleCompiler: Compile rules into shared per-relation join plans
+- DerivationGraph: Shared provenance for inferred facts
+- InferenceProfile: Per-rule / per-join timings and counts (EXPLAIN ANALYZE)
 - RuleBase: Inference rules (IS_A, PART_OF, CAUSES transitivity)
 - ContradictionDetector: Find conflicts in knowledge
 
@@ -25,12 +29,17 @@ Optional External Integration:
 
 # Core reasoning
 from .path_finder import PathFinder, ReasoningPath
+from .path_cache import PathCache
 from .query_engine import QueryEngine, QueryResult, QueryType
 from .explainer import Explainer, Explanation
 
 # Symbolic reasoning
 from .rule_base import RuleBase, InferenceRule, RuleType
 from .inference_engine import InferenceEngine, InferredFact, InferenceResult
+from .inference_cache import InferenceCache
+from .rule_compiler import RuleCompiler, CompiledRuleSet, JoinPlan, JoinShape
+from .derivation_graph import DerivationGraph, FactList
+from .inference_profile import InferenceProfile, JoinProfile, RuleProfile, RuleIterationProfile
 from .contradiction_detector import (
     ContradictionDetector,
     Contradiction,
@@ -54,6 +63,7 @@ __all__ = [
     # Core
     "PathFinder",
     "ReasoningPath",
+    "PathCache",
     "QueryEngine",
     "QueryResult",
     "QueryType",
@@ -67,6 +77,17 @@ __all__ = [
     "InferenceEngine",
     "InferredFact",
     "InferenceResult",
+    "InferenceCache",
+    "RuleCompiler",
+    "CompiledRuleSet",
+    "JoinPlan",
+    "JoinShape",
+    "DerivationGraph",
+    "FactList",
+    "InferenceProfile",
+    "JoinProfile",
+    "RuleProfile",
+    "RuleIterationProfile",
     "ContradictionDetector",
     "Contradiction",
     "ContradictionReport",
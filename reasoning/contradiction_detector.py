@@ -6,14 +6,21 @@ Detects:
 - Temporal conflicts (A PRECEDES B and A FOLLOWS B)
 - Type conflicts (A IS_A B and A IS_A C where B OPPOSITE_OF C)
 - Cyclical contradictions (A CAUSES B CAUSES A in non-feedback context)
+
+detect_incremental() keeps the pair / exclusion / type indexes live and
+only checks the edges changed since the previous call.
 """
 
-from typing import Dict, Any, List, Optional, Set, Tuple
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from collections import defaultdict
+import weakref
 
-from ..graph import GraphStore, GraphNode, GraphEdge, RelationType
+from ..graph import (
+    GraphStore, GraphNode, GraphEdge, RelationType, ReachabilityIndex,
+    ReachabilityOverlay, strongly_connected_components
+)
 
 
 class ContradictionType(Enum):
@@ -65,6 +72,7 @@ class ContradictionReport:
     nodes_checked: int
     edges_checked: int
     time_elapsed: float
+    complete: bool = True       # False if a time budget cut the checks short
     
     @property
     def has_contradictions(self) -> bool:
@@ -81,6 +89,7 @@ class ContradictionReport:
             "nodes_checked": self.nodes_checked,
             "edges_checked": self.edges_checked,
             "time_ms": self.time_elapsed * 1000,
+            "complete": self.complete,
             "contradictions": [c.to_dict() for c in self.contradictions],
         }
     
@@ -127,8 +136,21 @@ class ContradictionDetector:
         
         # Check if adding an edge would create contradiction
         would_conflict = detector.would_contradict(src, tgt, relation)
+        verdicts = detector.would_contradict_batch([(src, tgt, relation), ...])
+        
+        # Per-operation checks: only edges changed since the last call
+        detector = ContradictionDetector.shared(graph_store)
+        report = detector.detect_incremental()
+        
+        # Per-query checks: only around the nodes an answer uses
+        report = detector.detect_around(answer_node_ids, radius=1, deadline_ms=20)
     """
     
+    # One detector (and its live indexes) per graph
+    _shared: "weakref.WeakKeyDictionary[GraphStore, ContradictionDetector]" = (
+        weakref.WeakKeyDictionary()
+    )
+    
     # Relations that are mutually exclusive on the same pair
     EXCLUSIVE_PAIRS = [
         (RelationType.OPPOSITE_OF, RelationType.SIMILAR_TO),
@@ -161,6 +183,35 @@ class ContradictionDetector:
             graph: The knowledge graph to check
         """
         self.graph = graph
+        
+        # Live indexes for detect_incremental() (built on first call)
+        self._version = -1
+        self._pair_edges: Dict[Tuple[int, int], List[GraphEdge]] = {}
+        self._is_a_out: Dict[int, Dict[int, int]] = defaultdict(dict)      # source -> {type: edge count}
+        self._is_a_in: Dict[int, Dict[int, int]] = defaultdict(dict)       # type -> {source: edge count}
+        self._opposites: Dict[int, Dict[int, int]] = defaultdict(dict)     # a -> {b: edge count}, both ways
+        
+        # Current contradictions by category, and which keys each edge supports
+        self._exclusive: Dict[Tuple[int, int], Contradiction] = {}      # (edge id, edge id)
+        self._reflexive: Dict[int, Contradiction] = {}                  # edge id
+        self._type_conflicts: Dict[Tuple[int, int, int], Contradiction] = {}  # (source, t1 < t2)
+        self._cycles: Dict[RelationType, List[Contradiction]] = {}
+        self._cycle_edges: Dict[RelationType, Set[int]] = {}
+        self._edge_keys: Dict[int, Set[Tuple[int, int]]] = defaultdict(set)
+        self._report: Optional[List[Contradiction]] = None
+    
+    @classmethod
+    def shared(cls, graph: GraphStore) -> "ContradictionDetector":
+        """Get the detector shared by everything that checks this graph."""
+        detector = cls._shared.get(graph)
+        if detector is None:
+            detector = cls(graph)
+            cls._shared[graph] = detector
+        return detector
+    
+    def reachability(self, relation: RelationType) -> ReachabilityIndex:
+        """Reachability index for a relation (shared per graph, kept in sync)."""
+        return ReachabilityIndex.shared(self.graph, relation)
     
     def detect_all(self) -> ContradictionReport:
         """
@@ -189,6 +240,318 @@ class ContradictionDetector:
             time_elapsed=elapsed
         )
     
+    # ═══════════════════════════════════════════════════════════════════
+    # QUERY-SCOPED DETECTION
+    # ═══════════════════════════════════════════════════════════════════
+    
+    def detect_around(
+        self,
+        node_ids: Iterable[int],
+        radius: int = 1,
+        deadline_ms: Optional[float] = None
+    ) -> ContradictionReport:
+        """
+        Check only the neighborhood of some nodes (e.g. those an answer uses).
+        
+        The region is every node within radius hops of the given nodes
+        (edges followed in both directions). Exclusive pairs, reflexive
+        edges and type conflicts are checked on edges leaving region
+        nodes; cycles on the edges inside the region. Contradictions are
+        ordered by distance to the given nodes, then severity.
+        
+        Args:
+            node_ids: Nodes to check around
+            radius: Neighborhood radius in hops
+            deadline_ms: Time budget; returns what was found so far
+                (complete=False) when exceeded
+        
+        Returns:
+            ContradictionReport for the region
+        """
+        import time
+        start = time.time()
+        deadline = start + deadline_ms / 1000.0 if deadline_ms is not None else None
+        
+        distance: Dict[int, int] = {}
+        for node_id in node_ids:
+            if node_id not in distance and self.graph.has_node(node_id):
+                distance[node_id] = 0
+        
+        outgoing: Dict[int, List[GraphEdge]] = {}
+        frontier = list(distance)
+        complete = True
+        for hop in range(radius + 1):
+            next_frontier = []
+            for node_id in frontier:
+                edges = self.graph.get_outgoing_edges(node_id)
+                outgoing[node_id] = edges
+                if hop == radius:
+                    continue
+                for edge in edges + self.graph.get_incoming_edges(node_id):
+                    neighbor = edge.target_id if edge.source_id == node_id else edge.source_id
+                    if neighbor not in distance:
+                        distance[neighbor] = hop + 1
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+            if deadline is not None and time.time() >= deadline:
+                complete = False
+                break
+        
+        found: List[Tuple[int, Contradiction]] = []
+        edges_checked = 0
+        region_edges: Dict[RelationType, List[GraphEdge]] = defaultdict(list)
+        
+        for node_id, edges in outgoing.items():
+            if deadline is not None and time.time() >= deadline:
+                complete = False
+                break
+            edges_checked += len(edges)
+            hop = distance[node_id]
+            
+            by_target: Dict[int, List[GraphEdge]] = defaultdict(list)
+            types: Set[int] = set()
+            for edge in edges:
+                by_target[edge.target_id].append(edge)
+                if edge.target_id in outgoing and edge.relation_type in self.ACYCLIC_RELATIONS:
+                    region_edges[edge.relation_type].append(edge)
+                if edge.source_id == edge.target_id and edge.relation_type in self.NON_REFLEXIVE:
+                    found.append((hop, self._reflexive_contradiction(edge)))
+                if edge.relation_type == RelationType.IS_A and edge.target_id != node_id:
+                    types.add(edge.target_id)
+            
+            for target_id, pair in by_target.items():
+                for i, edge1 in enumerate(pair):
+                    for edge2 in pair[i+1:]:
+                        if self._are_exclusive(edge1.relation_type, edge2.relation_type):
+                            found.append((hop, self._exclusive_contradiction(node_id, target_id, edge1, edge2)))
+            
+            if len(types) > 1:
+                reported = set()
+                for t1 in types:
+                    for edge in self.graph.get_outgoing_edges(t1):
+                        t2 = edge.target_id
+                        if edge.relation_type != RelationType.OPPOSITE_OF or t2 not in types or t2 == t1:
+                            continue
+                        pair_key = (min(t1, t2), max(t1, t2))
+                        if pair_key not in reported:
+                            reported.add(pair_key)
+                            found.append((hop, self._type_contradiction(node_id, t1, t2)))
+        
+        if complete and not (deadline is not None and time.time() >= deadline):
+            for contradiction in self._detect_cycles(edges_by_relation=region_edges):
+                hop = min(distance[nid] for nid in contradiction.nodes)
+                found.append((hop, contradiction))
+        else:
+            complete = False
+        
+        found.sort(key=lambda item: (item[0], -item[1].severity))
+        
+        return ContradictionReport(
+            contradictions=[contradiction for _, contradiction in found],
+            nodes_checked=len(outgoing),
+            edges_checked=edges_checked,
+            time_elapsed=time.time() - start,
+            complete=complete
+        )
+    
+    # ═══════════════════════════════════════════════════════════════════
+    # INCREMENTAL DETECTION
+    # ═══════════════════════════════════════════════════════════════════
+    
+    def detect_incremental(self) -> ContradictionReport:
+        """
+        Cumulative report, checking only edges changed since the last call.
+        
+        The first call (or one after the graph's change log was
+        truncated) indexes every edge; later calls apply the added and
+        removed edges from GraphStore.changes_since() to the pair,
+        IS_A and OPPOSITE_OF indexes. Cycles of a relation are only
+        recomputed when a change closes or may break one.
+        
+        Returns:
+            ContradictionReport with every current contradiction;
+            edges_checked counts the edges examined by this call
+        """
+        import time
+        start = time.time()
+        
+        changes = self.graph.changes_since(self._version) if self._version >= 0 else None
+        if changes is None:
+            edges_checked = self._rebuild_indexes()
+        else:
+            added: List[GraphEdge] = []
+            removed: List[GraphEdge] = []
+            for _, op, edge in changes:
+                if op == "add_edge":
+                    self._index_edge(edge)
+                    added.append(edge)
+                elif op == "remove_edge":
+                    self._unindex_edge(edge)
+                    removed.append(edge)
+            self._update_cycles(added, removed)
+            edges_checked = len(added) + len(removed)
+        self._version = self.graph.version
+        
+        if self._report is None:
+            self._report = (
+                list(self._exclusive.values())
+                + list(self._reflexive.values())
+                + [c for relation in self.ACYCLIC_RELATIONS for c in self._cycles.get(relation, ())]
+                + list(self._type_conflicts.values())
+            )
+        
+        return ContradictionReport(
+            contradictions=self._report,
+            nodes_checked=self.graph.node_count,
+            edges_checked=edges_checked,
+            time_elapsed=time.time() - start
+        )
+    
+    def _rebuild_indexes(self) -> int:
+        """Index every edge from scratch. Returns the number of edges."""
+        self._pair_edges = {}
+        self._is_a_out = defaultdict(dict)
+        self._is_a_in = defaultdict(dict)
+        self._opposites = defaultdict(dict)
+        self._exclusive = {}
+        self._reflexive = {}
+        self._type_conflicts = {}
+        self._edge_keys = defaultdict(set)
+        
+        edges = self.graph.get_all_edges()
+        for edge in edges:
+            self._index_edge(edge)
+        
+        self._cycles = {}
+        self._cycle_edges = {}
+        for relation in self.ACYCLIC_RELATIONS:
+            self._recompute_cycles(relation)
+        self._report = None
+        return len(edges)
+    
+    def _index_edge(self, edge: GraphEdge) -> None:
+        """Add one edge to the indexes and record what it conflicts with."""
+        src, tgt, relation = edge.source_id, edge.target_id, edge.relation_type
+        
+        # Exclusive relations on the same pair
+        pair = self._pair_edges.setdefault((src, tgt), [])
+        for other in pair:
+            if self._are_exclusive(other.relation_type, relation):
+                key = (other.edge_id, edge.edge_id)
+                self._exclusive[key] = self._exclusive_contradiction(src, tgt, other, edge)
+                self._edge_keys[other.edge_id].add(key)
+                self._edge_keys[edge.edge_id].add(key)
+                self._report = None
+        pair.append(edge)
+        
+        if src == tgt and relation in self.NON_REFLEXIVE:
+            self._reflexive[edge.edge_id] = self._reflexive_contradiction(edge)
+            self._report = None
+        
+        # Type conflicts: new IS_A type, or new opposite pair
+        if relation == RelationType.IS_A and src != tgt:
+            types = self._is_a_out[src]
+            types[tgt] = types.get(tgt, 0) + 1
+            self._is_a_in[tgt][src] = self._is_a_in[tgt].get(src, 0) + 1
+            if types[tgt] == 1:
+                opposites = self._opposites.get(tgt, {})
+                for other in types:
+                    if other in opposites:
+                        self._add_type_conflict(src, tgt, other)
+        elif relation == RelationType.OPPOSITE_OF and src != tgt:
+            count = self._opposites[src].get(tgt, 0) + 1
+            self._opposites[src][tgt] = count
+            self._opposites[tgt][src] = count
+            if count == 1:
+                for source in self._common_sources(src, tgt):
+                    self._add_type_conflict(source, src, tgt)
+    
+    def _unindex_edge(self, edge: GraphEdge) -> None:
+        """Remove one edge from the indexes and drop what it supported."""
+        src, tgt, relation = edge.source_id, edge.target_id, edge.relation_type
+        
+        pair = self._pair_edges.get((src, tgt))
+        if pair is not None:
+            pair[:] = [e for e in pair if e.edge_id != edge.edge_id]
+            if not pair:
+                del self._pair_edges[(src, tgt)]
+        
+        for key in self._edge_keys.pop(edge.edge_id, ()):
+            self._exclusive.pop(key, None)
+            other = key[0] if key[1] == edge.edge_id else key[1]
+            keys = self._edge_keys.get(other)
+            if keys is not None:
+                keys.discard(key)
+            self._report = None
+        
+        if self._reflexive.pop(edge.edge_id, None) is not None:
+            self._report = None
+        
+        if relation == RelationType.IS_A and src != tgt:
+            types = self._is_a_out[src]
+            types[tgt] -= 1
+            self._is_a_in[tgt][src] -= 1
+            if types[tgt] == 0:
+                del types[tgt]
+                del self._is_a_in[tgt][src]
+                opposites = self._opposites.get(tgt, {})
+                for other in types:
+                    if other in opposites:
+                        self._drop_type_conflict(src, tgt, other)
+        elif relation == RelationType.OPPOSITE_OF and src != tgt:
+            count = self._opposites[src][tgt] - 1
+            if count:
+                self._opposites[src][tgt] = count
+                self._opposites[tgt][src] = count
+            else:
+                del self._opposites[src][tgt]
+                del self._opposites[tgt][src]
+                for source in self._common_sources(src, tgt):
+                    self._drop_type_conflict(source, src, tgt)
+    
+    def _common_sources(self, a: int, b: int) -> List[int]:
+        """Nodes with a direct IS_A edge to both a and b."""
+        sources_a = self._is_a_in.get(a, {})
+        sources_b = self._is_a_in.get(b, {})
+        if len(sources_a) > len(sources_b):
+            sources_a, sources_b = sources_b, sources_a
+        return [source for source in sources_a if source in sources_b]
+    
+    def _add_type_conflict(self, source: int, t1: int, t2: int) -> None:
+        key = (source, min(t1, t2), max(t1, t2))
+        if key not in self._type_conflicts:
+            self._type_conflicts[key] = self._type_contradiction(source, t1, t2)
+            self._report = None
+    
+    def _drop_type_conflict(self, source: int, t1: int, t2: int) -> None:
+        if self._type_conflicts.pop((source, min(t1, t2), max(t1, t2)), None) is not None:
+            self._report = None
+    
+    def _update_cycles(self, added: List[GraphEdge], removed: List[GraphEdge]) -> None:
+        """Recompute cycles only for relations whose cycles may have changed."""
+        for relation in self.ACYCLIC_RELATIONS:
+            cycle_edges = self._cycle_edges.get(relation, set())
+            dirty = any(edge.edge_id in cycle_edges for edge in removed)
+            if not dirty:
+                reachability = None
+                for edge in added:
+                    if edge.relation_type != relation or not self.graph.get_edge(edge.edge_id):
+                        continue
+                    if reachability is None:
+                        reachability = self.reachability(relation)
+                    # The edge closes a cycle iff its source is reachable from its target
+                    if reachability.reaches(edge.target_id, edge.source_id):
+                        dirty = True
+                        break
+            if dirty:
+                self._recompute_cycles(relation)
+    
+    def _recompute_cycles(self, relation: RelationType) -> None:
+        cycles = self._detect_cycles([relation])
+        self._cycles[relation] = cycles
+        self._cycle_edges[relation] = {eid for c in cycles for eid in c.edges}
+        self._report = None
+    
     def check_node(self, node_id: int) -> List[Contradiction]:
         """Check contradictions involving a specific node."""
         contradictions = []
@@ -275,6 +638,102 @@ class ContradictionDetector:
         
         return False, None
     
+    def would_contradict_batch(
+        self,
+        proposed_edges: Iterable[Tuple[int, int, RelationType]]
+    ) -> List[Tuple[bool, Optional[Contradiction]]]:
+        """
+        Check many proposed edges at once, as if added in order.
+        
+        Each edge is checked against the graph plus the proposed edges
+        before it that passed (rejected ones are not added). Existing
+        edges are indexed by (source, target) once per proposed source,
+        and cycle checks share one ReachabilityOverlay per acyclic
+        relation, so the cost grows with the batch and the region it
+        touches rather than with batch size × graph size.
+        
+        Args:
+            proposed_edges: (source_id, target_id, relation) tuples
+        
+        Returns:
+            One (would_contradict, Contradiction or None) per edge, in order
+        """
+        existing: Dict[int, Dict[int, List[GraphEdge]]] = {}
+        accepted: Dict[Tuple[int, int], List[Tuple[int, RelationType]]] = defaultdict(list)
+        overlays: Dict[RelationType, ReachabilityOverlay] = {}
+        verdicts: List[Tuple[bool, Optional[Contradiction]]] = []
+        
+        for position, (source_id, target_id, relation) in enumerate(proposed_edges):
+            contradiction = None
+            
+            if source_id == target_id and relation in self.NON_REFLEXIVE:
+                contradiction = Contradiction(
+                    contradiction_type=ContradictionType.ASYMMETRIC_VIOLATION,
+                    nodes=[source_id],
+                    edges=[],
+                    description=f"Cannot have {relation.value} relation to self",
+                    severity=1.0,
+                    suggestion="Remove self-referential edge"
+                )
+            
+            if contradiction is None:
+                by_target = existing.get(source_id)
+                if by_target is None:
+                    by_target = defaultdict(list)
+                    for edge in self.graph.get_outgoing_edges(source_id):
+                        by_target[edge.target_id].append(edge)
+                    existing[source_id] = by_target
+                
+                for edge in by_target.get(target_id, ()):
+                    if self._are_exclusive(relation, edge.relation_type):
+                        contradiction = Contradiction(
+                            contradiction_type=ContradictionType.DIRECT_OPPOSITE,
+                            nodes=[source_id, target_id],
+                            edges=[edge.edge_id],
+                            description=f"Would conflict with existing {edge.relation_type.value}",
+                            severity=0.9,
+                            suggestion=f"Remove existing {edge.relation_type.value} edge first"
+                        )
+                        break
+            
+            if contradiction is None:
+                for earlier, other in accepted.get((source_id, target_id), ()):
+                    if self._are_exclusive(relation, other):
+                        contradiction = Contradiction(
+                            contradiction_type=ContradictionType.DIRECT_OPPOSITE,
+                            nodes=[source_id, target_id],
+                            edges=[],
+                            description=f"Would conflict with proposed {other.value} (edge #{earlier} of the batch)",
+                            severity=0.9,
+                            suggestion="Keep only one of the conflicting proposed edges"
+                        )
+                        break
+            
+            overlay = None
+            if contradiction is None and relation in self.ACYCLIC_RELATIONS:
+                overlay = overlays.get(relation)
+                if overlay is None:
+                    overlay = self.reachability(relation).overlay()
+                    overlays[relation] = overlay
+                if overlay.reaches(target_id, source_id):
+                    contradiction = Contradiction(
+                        contradiction_type=ContradictionType.CAUSAL_CYCLE,
+                        nodes=[source_id, target_id],
+                        edges=[],
+                        description=f"Would create cycle in {relation.value} hierarchy",
+                        severity=0.85,
+                        suggestion="Check if relation direction is correct"
+                    )
+            
+            if contradiction is None:
+                accepted[(source_id, target_id)].append((position, relation))
+                if overlay is not None:
+                    overlay.add_edge(source_id, target_id)
+            
+            verdicts.append((contradiction is not None, contradiction))
+        
+        return verdicts
+    
     def _detect_exclusive_pairs(self) -> List[Contradiction]:
         """Find edges that have mutually exclusive relations on same pair."""
         contradictions = []
@@ -294,62 +753,81 @@ class ContradictionDetector:
             for i, edge1 in enumerate(edges):
                 for edge2 in edges[i+1:]:
                     if self._are_exclusive(edge1.relation_type, edge2.relation_type):
-                        src_node = self.graph.get_node(src)
-                        tgt_node = self.graph.get_node(tgt)
-                        
-                        src_name = src_node.text if src_node else f"Node({src})"
-                        tgt_name = tgt_node.text if tgt_node else f"Node({tgt})"
-                        
-                        contradictions.append(Contradiction(
-                            contradiction_type=ContradictionType.DIRECT_OPPOSITE,
-                            nodes=[src, tgt],
-                            edges=[edge1.edge_id, edge2.edge_id],
-                            description=f"'{src_name}' has both {edge1.relation_type.value} and {edge2.relation_type.value} to '{tgt_name}'",
-                            severity=0.9,
-                            suggestion="Remove one of the conflicting edges"
-                        ))
+                        contradictions.append(self._exclusive_contradiction(src, tgt, edge1, edge2))
         
         return contradictions
     
+    def _exclusive_contradiction(self, src: int, tgt: int, edge1: GraphEdge, edge2: GraphEdge) -> Contradiction:
+        src_node = self.graph.get_node(src)
+        tgt_node = self.graph.get_node(tgt)
+        
+        src_name = src_node.text if src_node else f"Node({src})"
+        tgt_name = tgt_node.text if tgt_node else f"Node({tgt})"
+        
+        return Contradiction(
+            contradiction_type=ContradictionType.DIRECT_OPPOSITE,
+            nodes=[src, tgt],
+            edges=[edge1.edge_id, edge2.edge_id],
+            description=f"'{src_name}' has both {edge1.relation_type.value} and {edge2.relation_type.value} to '{tgt_name}'",
+            severity=0.9,
+            suggestion="Remove one of the conflicting edges"
+        )
+    
     def _detect_reflexive_violations(self) -> List[Contradiction]:
         """Find self-referential edges that shouldn't exist."""
         contradictions = []
         
         for edge in self.graph.get_all_edges():
             if edge.source_id == edge.target_id and edge.relation_type in self.NON_REFLEXIVE:
-                node = self.graph.get_node(edge.source_id)
-                name = node.text if node else f"Node({edge.source_id})"
-                
-                contradictions.append(Contradiction(
-                    contradiction_type=ContradictionType.ASYMMETRIC_VIOLATION,
-                    nodes=[edge.source_id],
-                    edges=[edge.edge_id],
-                    description=f"'{name}' has {edge.relation_type.value} relation to itself",
-                    severity=0.8,
-                    suggestion="Remove self-referential edge"
-                ))
+                contradictions.append(self._reflexive_contradiction(edge))
         
         return contradictions
     
-    def _detect_cycles(self) -> List[Contradiction]:
-        """Find cycles in relations that should be acyclic."""
+    def _reflexive_contradiction(self, edge: GraphEdge) -> Contradiction:
+        node = self.graph.get_node(edge.source_id)
+        name = node.text if node else f"Node({edge.source_id})"
+        
+        return Contradiction(
+            contradiction_type=ContradictionType.ASYMMETRIC_VIOLATION,
+            nodes=[edge.source_id],
+            edges=[edge.edge_id],
+            description=f"'{name}' has {edge.relation_type.value} relation to itself",
+            severity=0.8,
+            suggestion="Remove self-referential edge"
+        )
+    
+    def _detect_cycles(
+        self,
+        relations: Optional[List[RelationType]] = None,
+        edges_by_relation: Optional[Dict[RelationType, List[GraphEdge]]] = None
+    ) -> List[Contradiction]:
+        """
+        Find cycles in relations that should be acyclic.
+        
+        Args:
+            relations: Relations to check (default: all acyclic ones)
+            edges_by_relation: Restrict each relation to these edges
+        """
         contradictions = []
         
-        for relation in self.ACYCLIC_RELATIONS:
-            cycles = self._find_cycles_for_relation(relation)
-            
-            for cycle in cycles:
+        for relation in relations or self.ACYCLIC_RELATIONS:
+            subset = edges_by_relation.get(relation, []) if edges_by_relation is not None else None
+            for nodes, edges, cycle in self._find_cycles_for_relation(relation, subset):
                 node_names = []
                 for nid in cycle:
                     node = self.graph.get_node(nid)
                     node_names.append(node.text if node else f"Node({nid})")
                 
+                if len(node_names) > 12:
+                    node_names[6:-5] = [f"... ({len(cycle) - 11} more)"]
                 cycle_str = " → ".join(node_names) + f" → {node_names[0]}"
+                if len(nodes) > len(cycle):
+                    cycle_str += f" ({len(nodes)} nodes, {len(edges)} edges involved)"
                 
                 contradictions.append(Contradiction(
                     contradiction_type=ContradictionType.CAUSAL_CYCLE,
-                    nodes=cycle,
-                    edges=[],  # Would need to track edges in cycle detection
+                    nodes=nodes,
+                    edges=edges,
                     description=f"Cycle in {relation.value}: {cycle_str}",
                     severity=0.85,
                     suggestion="Break the cycle by removing one edge"
@@ -364,10 +842,12 @@ class ContradictionDetector:
         # For each node, get all IS_A targets (direct and transitive)
         is_a_edges = self.graph.get_edges_by_type(RelationType.IS_A)
         
-        # Group by source
+        # Group by source (distinct types; self-loops are reflexive violations)
         is_a_by_source: Dict[int, List[int]] = defaultdict(list)
         for edge in is_a_edges:
-            is_a_by_source[edge.source_id].append(edge.target_id)
+            targets = is_a_by_source[edge.source_id]
+            if edge.target_id != edge.source_id and edge.target_id not in targets:
+                targets.append(edge.target_id)
         
         # Check if any types are marked as opposites
         opposite_edges = self.graph.get_edges_by_type(RelationType.OPPOSITE_OF)
@@ -381,25 +861,28 @@ class ContradictionDetector:
             for i, t1 in enumerate(targets):
                 for t2 in targets[i+1:]:
                     if (t1, t2) in opposite_pairs:
-                        src_node = self.graph.get_node(source)
-                        t1_node = self.graph.get_node(t1)
-                        t2_node = self.graph.get_node(t2)
-                        
-                        src_name = src_node.text if src_node else f"Node({source})"
-                        t1_name = t1_node.text if t1_node else f"Node({t1})"
-                        t2_name = t2_node.text if t2_node else f"Node({t2})"
-                        
-                        contradictions.append(Contradiction(
-                            contradiction_type=ContradictionType.TYPE_CONFLICT,
-                            nodes=[source, t1, t2],
-                            edges=[],
-                            description=f"'{src_name}' IS_A both '{t1_name}' and '{t2_name}', which are opposites",
-                            severity=0.95,
-                            suggestion="Review type assignments - entity cannot be two opposite types"
-                        ))
+                        contradictions.append(self._type_contradiction(source, t1, t2))
         
         return contradictions
     
+    def _type_contradiction(self, source: int, t1: int, t2: int) -> Contradiction:
+        src_node = self.graph.get_node(source)
+        t1_node = self.graph.get_node(t1)
+        t2_node = self.graph.get_node(t2)
+        
+        src_name = src_node.text if src_node else f"Node({source})"
+        t1_name = t1_node.text if t1_node else f"Node({t1})"
+        t2_name = t2_node.text if t2_node else f"Node({t2})"
+        
+        return Contradiction(
+            contradiction_type=ContradictionType.TYPE_CONFLICT,
+            nodes=[source, t1, t2],
+            edges=[],
+            description=f"'{src_name}' IS_A both '{t1_name}' and '{t2_name}', which are opposites",
+            severity=0.95,
+            suggestion="Review type assignments - entity cannot be two opposite types"
+        )
+    
     def _are_exclusive(self, rel1: RelationType, rel2: RelationType) -> bool:
         """Check if two relations are mutually exclusive."""
         for excl1, excl2 in self.EXCLUSIVE_PAIRS:
@@ -413,65 +896,88 @@ class ContradictionDetector:
         target_id: int,
         relation: RelationType
     ) -> bool:
-        """Check if adding edge would create a cycle."""
-        # DFS from target to see if we can reach source
-        visited = set()
-        stack = [target_id]
-        
-        while stack:
-            current = stack.pop()
-            if current == source_id:
-                return True
-            
-            if current in visited:
-                continue
-            visited.add(current)
-            
-            for edge in self.graph.get_outgoing_edges(current):
-                if edge.relation_type == relation:
-                    stack.append(edge.target_id)
+        """
+        Check if adding edge would create a cycle.
         
-        return False
+        The new edge closes a cycle iff source is already reachable
+        from target; answered by the relation's ReachabilityIndex.
+        """
+        return self.reachability(relation).reaches(target_id, source_id)
     
-    def _find_cycles_for_relation(self, relation: RelationType) -> List[List[int]]:
-        """Find all cycles for a specific relation type."""
-        cycles = []
-        visited = set()
+    def _find_cycles_for_relation(
+        self,
+        relation: RelationType,
+        edges: Optional[Iterable[GraphEdge]] = None
+    ) -> List[Tuple[List[int], List[int], List[int]]]:
+        """
+        Find the cyclic parts of one relation, in linear time.
         
-        edges = self.graph.get_edges_by_type(relation)
+        Every non-trivial strongly connected component (more than one
+        node, or a self-loop) is reported once, with its edges. An
+        iterative Tarjan pass is used, so deep chains are fine.
         
-        # Build adjacency list
-        adj: Dict[int, List[int]] = defaultdict(list)
+        Args:
+            relation: Relation to check
+            edges: Edges of the relation to consider (default: all)
+        
+        Returns:
+            [(member node ids, edge ids inside the component,
+              one concrete cycle through its first member), ...]
+        """
+        adj: Dict[int, List[GraphEdge]] = defaultdict(list)
+        successors: Dict[int, List[int]] = defaultdict(list)
+        if edges is None:
+            edges = self.graph.get_edges_by_type(relation)
         for edge in edges:
-            adj[edge.source_id].append(edge.target_id)
+            adj[edge.source_id].append(edge)
+            successors[edge.source_id].append(edge.target_id)
         
-        def dfs(node: int, path: List[int], path_set: Set[int]):
-            if node in path_set:
-                # Found cycle - extract it
-                cycle_start = path.index(node)
-                cycles.append(path[cycle_start:])
-                return
-            
-            if node in visited:
-                return
-            
-            path.append(node)
-            path_set.add(node)
-            
-            for neighbor in adj.get(node, []):
-                dfs(neighbor, path, path_set)
-            
-            path.pop()
-            path_set.remove(node)
-            visited.add(node)
+        components = strongly_connected_components(
+            list(adj), lambda node: successors.get(node, ())
+        )
         
-        # Start DFS from each node
-        for node in adj.keys():
-            if node not in visited:
-                dfs(node, [], set())
+        cycles = []
+        for component in components:
+            members = set(component)
+            edges = [
+                edge for node in component for edge in adj.get(node, ())
+                if edge.target_id in members
+            ]
+            if len(component) == 1 and not edges:
+                continue
+            cycles.append((
+                component,
+                [edge.edge_id for edge in edges],
+                self._cycle_through(component[0], edges)
+            ))
         
         return cycles
     
+    @staticmethod
+    def _cycle_through(start: int, edges: List[GraphEdge]) -> List[int]:
+        """Shortest cycle through start using the given (component) edges."""
+        adj: Dict[int, List[int]] = defaultdict(list)
+        for edge in edges:
+            adj[edge.source_id].append(edge.target_id)
+        
+        parent: Dict[int, int] = {}
+        frontier = [start]
+        while frontier:
+            next_frontier = []
+            for node in frontier:
+                for neighbor in adj[node]:
+                    if neighbor == start:
+                        cycle = [node]
+                        while cycle[-1] != start:
+                            cycle.append(parent[cycle[-1]])
+                        cycle.reverse()
+                        return cycle
+                    if neighbor not in parent:
+                        parent[neighbor] = node
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        return [start]
+    
     def __repr__(self) -> str:
         return f"ContradictionDetector(graph_nodes={self.graph.node_count})"
 
@@ -0,0 +1,386 @@
+"""
+DerivationGraph - Shared provenance store for inferred facts.
+
+Instead of every InferredFact carrying its own chain of
+(from, relation, to) tuples, each fact is stored once as a row of
+compact arrays:
+
+    fact id -> key, confidence, rule id, depth, premise ids
+
+Premises are integers: a base graph edge id or another fact id,
+told apart by the low bit. Rule ids are interned. Chains are only
+rebuilt, by walking premises down to base edges, when a fact is
+explained. InferredFact objects are lightweight views created on
+demand.
+"""
+
+from typing import Dict, Any, List, Optional, Sequence, Set, Tuple, Iterator
+from collections import abc
+from array import array
+import time
+
+from ..graph import GraphStore, RelationType
+
+
+FactKey = Tuple[int, int, RelationType]
+
+
+class DerivationGraph:
+    """
+    Fact store with provenance as a DAG over base edges and facts.
+    
+    Example:
+        dag = DerivationGraph(graph)
+        fid = dag.record((a, c, RelationType.IS_A), 0.81, "transitive_is_a",
+                         edge_premises=[e1.edge_id, e2.edge_id])
+        
+        dag.chain(fid)      # [(a, IS_A, b), (b, IS_A, c)]
+        dag.fact(fid)       # InferredFact view
+    """
+    
+    # Compact the premise array once this many slots (and over half of
+    # it) are left behind by replaced derivations
+    COMPACT_MIN_ORPHANED = 1024
+    
+    def __init__(self, graph: GraphStore):
+        """
+        Initialize an empty derivation graph.
+        
+        Args:
+            graph: Graph whose edge ids premises refer to
+        """
+        self.graph = graph
+        
+        # Fact rows (indexed by fact id)
+        self._keys: List[FactKey] = []
+        self._ids: Dict[FactKey, int] = {}
+        self._confidence = array("d")
+        self._rule = array("i")
+        self._depth = array("i")
+        self._timestamp = array("d")
+        self._premise_start = array("q")
+        self._premise_count = array("i")
+        
+        # Flat premise storage: edge id << 1, or fact id << 1 | 1
+        self._premises = array("q")
+        self._orphaned = 0          # Slots no fact points at any more
+        
+        # Interned rule ids
+        self._rule_ids: List[str] = []
+        self._rule_index: Dict[str, int] = {}
+        
+        # Index: node_id -> ids of facts involving this node
+        self._by_node: Dict[int, array] = {}
+    
+    # ═══════════════════════════════════════════════════════════════════
+    # RECORDING
+    # ═══════════════════════════════════════════════════════════════════
+    
+    def record(
+        self,
+        key: FactKey,
+        confidence: float,
+        rule_id: str,
+        edge_premises: Sequence[int] = (),
+        fact_premises: Sequence[int] = (),
+        depth: Optional[int] = None
+    ) -> Tuple[int, bool]:
+        """
+        Record a derivation, keeping the highest-confidence one per key.
+        
+        Args:
+            key: (source_id, target_id, relation)
+            confidence: Confidence of this derivation
+            rule_id: Rule that produced it
+            edge_premises: Base edge ids used, in chain order
+            fact_premises: Inferred fact ids used
+            depth: Chain length (defaults to the number of premises)
+        
+        Returns:
+            (fact id, whether this derivation was stored)
+        """
+        fact_id = self._ids.get(key)
+        if fact_id is not None and self._confidence[fact_id] >= confidence:
+            return fact_id, False
+        
+        rule = self._rule_index.get(rule_id)
+        if rule is None:
+            rule = len(self._rule_ids)
+            self._rule_ids.append(rule_id)
+            self._rule_index[rule_id] = rule
+        
+        premises = [eid << 1 for eid in edge_premises]
+        premises.extend(fid << 1 | 1 for fid in fact_premises)
+        count = len(premises)
+        
+        if fact_id is not None and count <= self._premise_count[fact_id]:
+            # Replaced derivation that fits: reuse its slice
+            start = self._premise_start[fact_id]
+            self._premises[start:start + count] = array("q", premises)
+            self._orphaned += self._premise_count[fact_id] - count
+        else:
+            if fact_id is not None:
+                self._orphaned += self._premise_count[fact_id]
+            start = len(self._premises)
+            self._premises.extend(premises)
+        if depth is None:
+            depth = count
+        
+        if fact_id is None:
+            fact_id = len(self._keys)
+            self._keys.append(key)
+            self._ids[key] = fact_id
+            self._confidence.append(confidence)
+            self._rule.append(rule)
+            self._depth.append(depth)
+            self._timestamp.append(time.time())
+            self._premise_start.append(start)
+            self._premise_count.append(count)
+            
+            source_id, target_id, _ = key
+            self._by_node.setdefault(source_id, array("q")).append(fact_id)
+            if target_id != source_id:
+                self._by_node.setdefault(target_id, array("q")).append(fact_id)
+        else:
+            self._confidence[fact_id] = confidence
+            self._rule[fact_id] = rule
+            self._depth[fact_id] = depth
+            self._timestamp[fact_id] = time.time()
+            self._premise_start[fact_id] = start
+            self._premise_count[fact_id] = count
+            if (self._orphaned >= self.COMPACT_MIN_ORPHANED
+                    and 2 * self._orphaned > len(self._premises)):
+                self._compact_premises()
+        
+        return fact_id, True
+    
+    def _compact_premises(self) -> None:
+        """Drop premise slots left behind by replaced derivations."""
+        premises = array("q")
+        starts, counts = self._premise_start, self._premise_count
+        for fid in range(len(self._keys)):
+            start = starts[fid]
+            starts[fid] = len(premises)
+            premises.extend(self._premises[start:start + counts[fid]])
+        self._premises = premises
+        self._orphaned = 0
+    
+    # ═══════════════════════════════════════════════════════════════════
+    # LOOKUP
+    # ═══════════════════════════════════════════════════════════════════
+    
+    def __contains__(self, key: FactKey) -> bool:
+        return key in self._ids
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def get_id(self, key: FactKey) -> Optional[int]:
+        """Fact id for a (source, target, relation) key, or None."""
+        return self._ids.get(key)
+    
+    def key(self, fact_id: int) -> FactKey:
+        return self._keys[fact_id]
+    
+    def confidence(self, fact_id: int) -> float:
+        return self._confidence[fact_id]
+    
+    def rule_id(self, fact_id: int) -> str:
+        return self._rule_ids[self._rule[fact_id]]
+    
+    def depth(self, fact_id: int) -> int:
+        return self._depth[fact_id]
+    
+    def premises(self, fact_id: int) -> List[Tuple[str, int]]:
+        """
+        Direct premises of a fact.
+        
+        Returns:
+            [("edge", edge_id) | ("fact", fact_id), ...]
+        """
+        start = self._premise_start[fact_id]
+        end = start + self._premise_count[fact_id]
+        return [
+            ("fact", p >> 1) if p & 1 else ("edge", p >> 1)
+            for p in self._premises[start:end]
+        ]
+    
+    def node_fact_ids(self, node_id: int) -> Sequence[int]:
+        """Ids of facts with node_id as source or target."""
+        return self._by_node.get(node_id, ())
+    
+    def node_count(self) -> int:
+        """Number of nodes involved in at least one fact."""
+        return len(self._by_node)
+    
+    def fact(self, fact_id: int) -> "InferredFact":
+        """Lightweight InferredFact view of a stored fact."""
+        from .inference_engine import InferredFact
+        
+        source_id, target_id, relation = self._keys[fact_id]
+        return InferredFact(
+            source_id=source_id,
+            target_id=target_id,
+            relation=relation,
+            confidence=self._confidence[fact_id],
+            rule_id=self._rule_ids[self._rule[fact_id]],
+            depth=self._depth[fact_id],
+            timestamp=self._timestamp[fact_id],
+            fact_id=fact_id,
+            derivations=self
+        )
+    
+    def facts(self) -> "FactList":
+        """All facts, as a lazy sequence of views in insertion order."""
+        return FactList(self, range(len(self._keys)))
+    
+    # ═══════════════════════════════════════════════════════════════════
+    # PROVENANCE
+    # ═══════════════════════════════════════════════════════════════════
+    
+    def chain(self, fact_id: int) -> List[Tuple[int, RelationType, int]]:
+        """
+        Rebuild the base-edge chain behind a fact.
+        
+        Fact premises are expanded recursively. Edges removed from the
+        graph since the derivation are skipped.
+        
+        Returns:
+            [(from, relation, to), ...]
+        """
+        chain = []
+        stack = [fact_id << 1 | 1]
+        
+        while stack:
+            premise = stack.pop()
+            if premise & 1:
+                fid = premise >> 1
+                start = self._premise_start[fid]
+                end = start + self._premise_count[fid]
+                # Reversed so premises are expanded in chain order
+                stack.extend(reversed(self._premises[start:end]))
+            else:
+                edge = self.graph.get_edge(premise >> 1)
+                if edge is not None:
+                    chain.append((edge.source_id, edge.relation_type, edge.target_id))
+        
+        return chain
+    
+    # ═══════════════════════════════════════════════════════════════════
+    # SERIALIZATION
+    # ═══════════════════════════════════════════════════════════════════
+    
+    _ARRAYS = (
+        "_confidence", "_rule", "_depth", "_timestamp",
+        "_premise_start", "_premise_count", "_premises",
+    )
+    
+    def to_state(self) -> Dict[str, Any]:
+        """
+        Plain, picklable state of the store (without the graph).
+        
+        Arrays are stored as bytes; the node index is rebuilt on load.
+        """
+        state = {name: getattr(self, name).tobytes() for name in self._ARRAYS}
+        state["keys"] = [(s, t, rel.value) for s, t, rel in self._keys]
+        state["rule_ids"] = list(self._rule_ids)
+        return state
+    
+    @classmethod
+    def from_state(cls, graph: GraphStore, state: Dict[str, Any]) -> "DerivationGraph":
+        """
+        Rebuild a store saved with to_state().
+        
+        Args:
+            graph: Graph whose edge ids the premises refer to
+            state: Output of to_state()
+        """
+        dag = cls(graph)
+        for name in cls._ARRAYS:
+            getattr(dag, name).frombytes(state[name])
+        
+        dag._keys = [(s, t, RelationType(rel)) for s, t, rel in state["keys"]]
+        dag._ids = {key: fid for fid, key in enumerate(dag._keys)}
+        dag._rule_ids = list(state["rule_ids"])
+        dag._rule_index = {rule_id: i for i, rule_id in enumerate(dag._rule_ids)}
+        dag._orphaned = len(dag._premises) - sum(dag._premise_count)
+        dag._index_nodes()
+        return dag
+    
+    def compact(self, drop: Set[int]) -> "DerivationGraph":
+        """
+        Copy of the store without some facts (and orphaned premises).
+        
+        Kept facts are renumbered in their original order.
+        
+        Args:
+            drop: Ids of the facts to leave out
+        """
+        keep = [fid for fid in range(len(self._keys)) if fid not in drop]
+        dag = DerivationGraph(self.graph)
+        dag._keys = [self._keys[fid] for fid in keep]
+        dag._ids = {key: fid for fid, key in enumerate(dag._keys)}
+        for name in ("_confidence", "_rule", "_depth", "_timestamp", "_premise_count"):
+            source = getattr(self, name)
+            getattr(dag, name).extend(source[fid] for fid in keep)
+        
+        premises, starts, counts = self._premises, self._premise_start, self._premise_count
+        for fid in keep:
+            start = starts[fid]
+            dag._premise_start.append(len(dag._premises))
+            dag._premises.extend(premises[start:start + counts[fid]])
+        
+        dag._rule_ids = list(self._rule_ids)
+        dag._rule_index = dict(self._rule_index)
+        dag._index_nodes()
+        return dag
+    
+    def _index_nodes(self) -> None:
+        """Rebuild the node -> fact ids index."""
+        self._by_node = {}
+        for fact_id, (source_id, target_id, _) in enumerate(self._keys):
+            self._by_node.setdefault(source_id, array("q")).append(fact_id)
+            if target_id != source_id:
+                self._by_node.setdefault(target_id, array("q")).append(fact_id)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Size of the store."""
+        arrays = [getattr(self, name) for name in self._ARRAYS]
+        return {
+            "facts": len(self._keys),
+            "premises": len(self._premises),
+            "orphaned_premises": self._orphaned,
+            "rules": len(self._rule_ids),
+            "array_bytes": sum(a.itemsize * len(a) for a in arrays),
+        }
+    
+    def __repr__(self) -> str:
+        return f"DerivationGraph(facts={len(self._keys)}, premises={len(self._premises)})"
+
+
+class FactList(abc.Sequence):
+    """
+    Read-only sequence of InferredFact views over a DerivationGraph.
+    
+    Views are built on access, so holding a result does not keep one
+    object per fact alive.
+    """
+    
+    def __init__(self, derivations: DerivationGraph, fact_ids: Sequence[int]):
+        self._derivations = derivations
+        self._fact_ids = fact_ids
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._derivations.fact(fid) for fid in self._fact_ids[index]]
+        return self._derivations.fact(self._fact_ids[index])
+    
+    def __len__(self) -> int:
+        return len(self._fact_ids)
+    
+    def __iter__(self) -> Iterator["InferredFact"]:
+        for fid in self._fact_ids:
+            yield self._derivations.fact(fid)
+    
+    def __repr__(self) -> str:
+        return f"FactList({len(self._fact_ids)} facts)"
@@ -11,10 +11,13 @@ SanTOK Cognitive does the reasoning; LLM just verbalizes.
 from typing import Dict, Any, List, Optional, Tuple, Callable
 from dataclasses import dataclass, field
 from enum import Enum
+import time
 
 from ..graph import GraphStore, GraphNode, RelationType
 from ..trees import TreeStore, Tree
 from ..memory import UnifiedMemory, MemoryObject
+from .inference_cache import InferenceCache
+from .path_cache import PathCache
 from .inference_engine import InferenceEngine, InferredFact
 from .path_finder import PathFinder, ReasoningPath
 from .query_engine import QueryEngine, QueryResult
@@ -58,6 +61,9 @@ class StructuredContext:
     # Confidence score for the context
     confidence: float = 1.0
     
+    # False if inference was cut short by the request budget
+    inference_complete: bool = True
+    
     # Suggested answer structure
     answer_hints: List[str] = field(default_factory=list)
     
@@ -149,6 +155,7 @@ class StructuredContext:
             "hierarchy": self.hierarchy,
             "contradictions": self.contradictions,
             "confidence": self.confidence,
+            "inference_complete": self.inference_complete,
             "answer_hints": self.answer_hints,
         }
 
@@ -238,12 +245,15 @@ class HybridReasoner:
         self.memory = memory
         
         # Initialize reasoning components
-        self.inference = InferenceEngine(memory.graph)
+        self.inference = InferenceEngine(
+            memory.graph,
+            cache=InferenceCache.shared(memory)
+        )
         self.inference.rules.add_builtin_rules()
         
-        self.path_finder = PathFinder(memory.graph)
+        self.path_finder = PathFinder(memory.graph, cache=PathCache.shared(memory.graph))
         self.query_engine = QueryEngine(memory)
-        self.contradiction_detector = ContradictionDetector(memory.graph)
+        self.contradiction_detector = ContradictionDetector.shared(memory.graph)
         
         # Generator function (to be set by user)
         self._generator: Optional[Callable[[str], str]] = None
@@ -256,6 +266,10 @@ class HybridReasoner:
             "include_hierarchy": True,
             "check_contradictions": True,
             "min_confidence": 0.3,
+            "inference_radius": None,      # Hops around matched nodes (None: longest rule body)
+            "max_inference_nodes": None,   # Neighborhood size budget per request
+            "contradiction_radius": 1,     # Hops around answer nodes to check
+            "contradiction_budget_ms": None,  # Time budget for those checks
         }
     
     def set_generator(self, generator_fn: Callable[[str], str]) -> None:
@@ -274,7 +288,11 @@ class HybridReasoner:
         """
         self._generator = generator_fn
     
-    def build_context(self, query: str) -> StructuredContext:
+    def build_context(
+        self,
+        query: str,
+        deadline_ms: Optional[float] = None
+    ) -> StructuredContext:
         """
         Build structured context for a query.
         
@@ -287,10 +305,14 @@ class HybridReasoner:
         
         Args:
             query: The user's query
+            deadline_ms: Request time budget; whatever is left after the
+                search is handed to inference, which then returns its
+                best partial result instead of running to fixpoint
             
         Returns:
             StructuredContext ready for the generator
         """
+        start = time.perf_counter()
         context = StructuredContext(query=query)
         
         # 1. Search for relevant facts
@@ -307,14 +329,29 @@ class HybridReasoner:
                 "uid": obj.uid,
             })
         
-        # 2. Run inference
-        inference_result = self.inference.infer_all(
-            max_iterations=50,
-            min_confidence=self.config["min_confidence"]
-        )
+        # 2. Run inference around the matched nodes (within the remaining
+        #    request budget), most relevant facts first
+        remaining_ms = None
+        if deadline_ms is not None:
+            remaining_ms = max(0.0, deadline_ms - (time.perf_counter() - start) * 1000)
+        
+        seed_ids = [obj.graph_node_id for obj in search_result.objects if obj.graph_node_id]
+        inferred_facts = []
+        
+        if seed_ids:
+            inference_result = self.inference.infer_local(
+                seed_ids,
+                radius=self.config["inference_radius"],
+                min_confidence=self.config["min_confidence"],
+                max_facts=self.config["max_inferences"],
+                max_nodes=self.config["max_inference_nodes"],
+                deadline_ms=remaining_ms
+            )
+            inferred_facts = inference_result.inferred_facts
+            context.inference_complete = inference_result.reached_fixpoint
         
         # Add relevant inferences
-        for fact in inference_result.inferred_facts[:self.config["max_inferences"]]:
+        for fact in inferred_facts:
             src_node = self.memory.graph.get_node(fact.source_id)
             tgt_node = self.memory.graph.get_node(fact.target_id)
             
@@ -363,11 +400,24 @@ class HybridReasoner:
                         "siblings": [s.content for s in siblings[:5]],
                     }
         
-        # 5. Check for contradictions
-        if self.config["check_contradictions"]:
-            report = self.contradiction_detector.detect_all()
+        # 5. Check for contradictions around the nodes the answer uses
+        if self.config["check_contradictions"] and seed_ids:
+            answer_nodes = list(seed_ids)
+            for fact in inferred_facts:
+                answer_nodes.extend((fact.source_id, fact.target_id))
+            
+            budget_ms = self.config["contradiction_budget_ms"]
+            if deadline_ms is not None:
+                remaining_ms = max(0.0, deadline_ms - (time.perf_counter() - start) * 1000)
+                budget_ms = remaining_ms if budget_ms is None else min(budget_ms, remaining_ms)
             
-            for cont in report.contradictions[:3]:  # Limit to top 3
+            report = self.contradiction_detector.detect_around(
+                answer_nodes,
+                radius=self.config["contradiction_radius"],
+                deadline_ms=budget_ms
+            )
+            
+            for cont in report.contradictions[:3]:  # Limit to top 3 (nearest first)
                 context.contradictions.append({
                     "type": cont.contradiction_type.value,
                     "description": cont.description,
@@ -396,6 +446,9 @@ class HybridReasoner:
         if context.contradictions:
             context.answer_hints.append("Note: Some knowledge may be contradictory - be cautious")
         
+        if not context.inference_complete:
+            context.answer_hints.append("Inference was cut short - derived knowledge may be incomplete")
+        
         if context.confidence < 0.5:
             context.answer_hints.append("Confidence is low - acknowledge uncertainty")
         
@@ -404,7 +457,8 @@ class HybridReasoner:
     def answer(
         self,
         query: str,
-        return_context: bool = False
+        return_context: bool = False,
+        deadline_ms: Optional[float] = None
     ) -> HybridAnswer:
         """
         Answer a query using hybrid reasoning.
@@ -412,12 +466,13 @@ class HybridReasoner:
         Args:
             query: The user's question
             return_context: If True, include full context in answer
+            deadline_ms: Time budget for building the context
             
         Returns:
             HybridAnswer with generated text and reasoning trace
         """
         # Build context
-        context = self.build_context(query)
+        context = self.build_context(query, deadline_ms=deadline_ms)
         
         # Generate answer
         if self._generator:
@@ -476,6 +531,7 @@ class HybridReasoner:
             "trees": len(self.memory.trees),
             "inference_rules": len(self.inference.rules),
             "has_generator": self._generator is not None,
+            "path_cache": self.path_finder.cache.get_stats(),
         }
     
     def __repr__(self) -> str:
@@ -0,0 +1,115 @@
+"""
+InferenceCache - Reuse inference results across questions.
+
+Full inference is expensive and its result depends only on:
+- The graph's structure (GraphStore.version)
+- The enabled rule set (RuleBase.fingerprint())
+- The run parameters (max_iterations, min_confidence)
+
+The cache keys InferenceResults on exactly that, so repeated questions
+against a static knowledge base pay for inference once. One cache is
+shared by every reasoner that wraps the same UnifiedMemory.
+"""
+
+from typing import Dict, Any, Optional, Tuple
+from collections import OrderedDict
+import weakref
+
+from ..graph import GraphStore
+from .rule_base import RuleBase
+
+
+CacheKey = Tuple[int, int, str, Tuple[Any, ...]]
+
+
+class InferenceCache:
+    """
+    Bounded LRU cache of InferenceResults.
+    
+    Keys are (graph identity, graph version, rule-set fingerprint,
+    run parameters). Any structural change to the graph or edit to the
+    rules produces a new key, so stale results are never returned; old
+    entries simply age out.
+    
+    Example:
+        cache = InferenceCache.shared(memory)
+        engine = InferenceEngine(memory.graph, cache=cache)
+        
+        engine.infer_all()   # computed
+        engine.infer_all()   # served from cache
+        
+        # After editing edges in place (not tracked by the graph version)
+        cache.invalidate()
+    """
+    
+    # One cache per UnifiedMemory (or any owner object)
+    _shared: "weakref.WeakKeyDictionary[Any, InferenceCache]" = weakref.WeakKeyDictionary()
+    
+    def __init__(self, max_entries: int = 8):
+        """
+        Initialize cache.
+        
+        Args:
+            max_entries: Maximum number of results kept (LRU eviction)
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, Any]" = OrderedDict()
+        self._stats = {"hits": 0, "misses": 0, "invalidations": 0}
+    
+    @classmethod
+    def shared(cls, owner: Any) -> "InferenceCache":
+        """
+        Get the cache shared by everything that wraps the same owner.
+        
+        Args:
+            owner: Usually the UnifiedMemory the reasoners are built on
+        """
+        cache = cls._shared.get(owner)
+        if cache is None:
+            cache = cls()
+            cls._shared[owner] = cache
+        return cache
+    
+    @staticmethod
+    def make_key(graph: GraphStore, rules: RuleBase, *params: Any) -> CacheKey:
+        """Build a cache key for a graph state, rule set and run parameters."""
+        return (id(graph), graph.version, rules.fingerprint(), params)
+    
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """Get a cached InferenceResult, or None."""
+        result = self._entries.get(key)
+        if result is None:
+            self._stats["misses"] += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self._stats["hits"] += 1
+        return result
+    
+    def put(self, key: CacheKey, result: Any) -> None:
+        """Store an InferenceResult."""
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def invalidate(self) -> None:
+        """Drop every cached result."""
+        self._entries.clear()
+        self._stats["invalidations"] += 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "entries": len(self._entries),
+            **self._stats,
+        }
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __repr__(self) -> str:
+        return (
+            f"InferenceCache(entries={len(self._entries)}, "
+            f"hits={self._stats['hits']}, misses={self._stats['misses']})"
+        )
@@ -6,15 +6,44 @@ Performs:
 - Transitive inference (IS_A, PART_OF, etc.)
 - Confidence propagation
 - Derived fact generation
+- Parallel rule evaluation over graph partitions
+- Shared provenance (derivation DAG) for all derived facts
+- Anytime inference under time / fact budgets
+- Materialized overlay of inferred edges on the graph
+- Per-rule / per-join profiling (EXPLAIN ANALYZE)
+- Best-derivation closure (max-product search)
+- Equivalence classes for symmetric + transitive relations
+- Virtual (query-time) property inheritance
+- Persisted closures with incremental catch-up
 """
 
-from typing import Dict, Any, List, Optional, Set, Tuple
+from typing import Dict, Any, Callable, Iterable, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import heapq
+import os
+import pickle
 import time
 
-from ..graph import GraphStore, GraphNode, GraphEdge, RelationType
+from ..graph import (
+    GraphStore,
+    GraphNode,
+    GraphEdge,
+    RelationType,
+    ReachabilityIndex,
+    EquivalenceClasses,
+)
 from .rule_base import RuleBase, InferenceRule, RuleType
+from .rule_compiler import RuleCompiler, CompiledRuleSet, JoinPlan, JoinShape
+from .inference_cache import InferenceCache
+from .derivation_graph import DerivationGraph, FactList
+from .inference_profile import (
+    InferenceProfile,
+    JoinProfile,
+    RuleProfile,
+    RuleIterationProfile,
+)
 
 
 @dataclass
@@ -27,6 +56,9 @@ class InferredFact:
     - The reasoning chain that produced it
     - Confidence (propagated through chain)
     - Which rule was used
+    
+    Facts produced by the engine are views over its DerivationGraph:
+    chain is None and the chain is rebuilt on demand by get_chain().
     """
     source_id: int
     target_id: int
@@ -35,12 +67,16 @@ class InferredFact:
     
     # Reasoning trace
     rule_id: str
-    chain: List[Tuple[int, RelationType, int]]  # [(from, rel, to), ...]
-    depth: int
+    chain: Optional[List[Tuple[int, RelationType, int]]] = None  # [(from, rel, to), ...]
+    depth: int = 0
     
     # Metadata
     timestamp: float = field(default_factory=time.time)
     
+    # Provenance (set on engine-produced facts)
+    fact_id: int = -1
+    derivations: Optional[DerivationGraph] = field(default=None, repr=False, compare=False)
+    
     def __hash__(self):
         return hash((self.source_id, self.target_id, self.relation))
     
@@ -58,17 +94,26 @@ class InferredFact:
             "relation": self.relation.value,
             "confidence": self.confidence,
             "rule_id": self.rule_id,
-            "chain": [(s, r.value, t) for s, r, t in self.chain],
+            "chain": [(s, r.value, t) for s, r, t in self.get_chain()],
             "depth": self.depth,
         }
     
+    def get_chain(self) -> List[Tuple[int, RelationType, int]]:
+        """The reasoning chain, rebuilt from the derivation graph if needed."""
+        if self.chain is not None:
+            return self.chain
+        if self.derivations is not None and self.fact_id >= 0:
+            return self.derivations.chain(self.fact_id)
+        return []
+    
     def explain(self) -> str:
         """Generate human-readable explanation."""
-        if not self.chain:
+        chain = self.get_chain()
+        if not chain:
             return f"Direct: {self.source_id} --{self.relation.value}--> {self.target_id}"
         
         steps = []
-        for src, rel, tgt in self.chain:
+        for src, rel, tgt in chain:
             steps.append(f"{src} --{rel.value}--> {tgt}")
         
         return (
@@ -83,18 +128,138 @@ class InferredFact:
 @dataclass
 class InferenceResult:
     """Result of running inference."""
-    inferred_facts: List[InferredFact]
+    inferred_facts: List[InferredFact]  # FactList view for engine results
     rules_applied: Dict[str, int]  # rule_id -> count
     total_iterations: int
     time_elapsed: float
+    derivations: Optional[DerivationGraph] = field(default=None, repr=False)
+    
+    # False if stopped by max_iterations or a budget (partial result)
+    reached_fixpoint: bool = True
+    
+    # Set by infer_all(profile=True)
+    profile: Optional[InferenceProfile] = field(default=None, repr=False)
+    
+    # Relations kept as equivalence classes instead of pairwise facts
+    equivalences: Dict[RelationType, EquivalenceClasses] = field(default_factory=dict, repr=False)
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        data = {
             "facts_count": len(self.inferred_facts),
             "rules_applied": self.rules_applied,
             "iterations": self.total_iterations,
             "time_ms": self.time_elapsed * 1000,
+            "reached_fixpoint": self.reached_fixpoint,
+        }
+        if self.equivalences:
+            data["equivalence_classes"] = {
+                relation.value: len(classes) for relation, classes in self.equivalences.items()
+            }
+        if self.profile is not None:
+            data["profile"] = self.profile.to_dict()
+        return data
+
+
+class _GraphSnapshot:
+    """
+    Read-only, picklable view of a GraphStore.
+    
+    Shipped once to every worker process in parallel mode. Exposes the
+    subset of the GraphStore API the rule handlers use, with adjacency
+    kept in lists so iteration order matches the parent graph exactly.
+    induced() builds the same view over a node subset (local inference).
+    """
+    
+    def __init__(self, graph: GraphStore):
+        self._edges: Dict[int, GraphEdge] = {
+            edge.edge_id: edge for edge in graph.get_all_edges()
+        }
+        self._outgoing: Dict[int, List[int]] = {
+            node_id: list(edge_ids)
+            for node_id, edge_ids in graph._outgoing.items()
+            if edge_ids
         }
+        self._by_relation_type: Dict[str, List[int]] = {
+            rel: list(edge_ids)
+            for rel, edge_ids in graph._by_relation_type.items()
+            if edge_ids
+        }
+    
+    @classmethod
+    def induced(cls, graph: GraphStore, node_ids: List[int]) -> "_GraphSnapshot":
+        """View of the subgraph induced by node_ids (edges between them only)."""
+        view = cls.__new__(cls)
+        view._edges = {}
+        view._outgoing = {}
+        view._by_relation_type = defaultdict(list)
+        
+        members = set(node_ids)
+        for node_id in node_ids:
+            for edge in graph.get_outgoing_edges(node_id):
+                if edge.target_id not in members:
+                    continue
+                view._edges[edge.edge_id] = edge
+                view._outgoing.setdefault(node_id, []).append(edge.edge_id)
+                view._by_relation_type[edge.relation_type.value].append(edge.edge_id)
+        
+        return view
+    
+    def get_edge(self, edge_id: int) -> Optional[GraphEdge]:
+        return self._edges.get(edge_id)
+    
+    def get_edges_by_type(self, relation_type: RelationType) -> List[GraphEdge]:
+        edge_ids = self._by_relation_type.get(relation_type.value, [])
+        return [self._edges[eid] for eid in edge_ids if eid in self._edges]
+    
+    def count_edges_by_type(self, relation_type: RelationType) -> int:
+        return len(self._by_relation_type.get(relation_type.value, ()))
+    
+    def get_outgoing_edges(self, node_id: int) -> List[GraphEdge]:
+        edge_ids = self._outgoing.get(node_id, [])
+        return [self._edges[eid] for eid in edge_ids if eid in self._edges]
+    
+    def has_edge_between(self, source_id: int, target_id: int,
+                         relation_type: Optional[RelationType] = None) -> bool:
+        for edge in self.get_outgoing_edges(source_id):
+            if edge.target_id == target_id:
+                if relation_type is None or edge.relation_type == relation_type:
+                    return True
+        return False
+
+
+# Candidate derivation: ((source, target, relation), confidence, premise edge ids)
+_Candidate = Tuple[Tuple[int, int, RelationType], float, Tuple[int, ...]]
+
+
+# Per-process engine bound to the snapshot (set by the pool initializer)
+_WORKER_ENGINE: Optional["InferenceEngine"] = None
+
+
+def _init_worker(snapshot: _GraphSnapshot) -> None:
+    """Pool initializer: bind a worker-local engine to the shared snapshot."""
+    global _WORKER_ENGINE
+    _WORKER_ENGINE = InferenceEngine(snapshot)
+
+
+def _evaluate_partition(
+    plans: List[JoinPlan],
+    edge_ids: List[int],
+    min_confidence: float
+) -> List[Dict[str, List["_Candidate"]]]:
+    """
+    Worker task: run the join plans of one scan relation over a partition
+    of its edges.
+    
+    Returns one {rule_id: candidate facts} dict per input edge, so the
+    parent can restore the serial scan order when merging partitions.
+    """
+    engine = _WORKER_ENGINE
+    groups = []
+    for edge_id in edge_ids:
+        out: Dict[str, List[_Candidate]] = defaultdict(list)
+        engine._evaluate_edge(plans, engine.graph.get_edge(edge_id), min_confidence, out)
+        groups.append(dict(out))
+    return groups
 
 
 class InferenceEngine:
@@ -120,36 +285,122 @@ class InferenceEngine:
         
         # Get all inferred relations for a node
         inferred = engine.get_inferred_relations(dog_id)
+        
+        # Same result, rules evaluated across CPU cores
+        result = engine.infer_all(parallel=True, max_workers=8)
+        
+        # Anytime: best facts found within 20ms
+        result = engine.infer_all(deadline_ms=20)
+        if not result.reached_fixpoint:
+            ...
+        
+        # Where does the time go?
+        print(engine.explain_analyze().report())
+        
+        # Highest-confidence derivation of every fact, full transitive depth
+        result = engine.infer_best(min_confidence=0.3)
+        
+        # Symmetric + transitive relations become union-find classes
+        engine.rules.add_equivalence_rules(RelationType.RELATED_TO)
+        engine.infer_all()
+        engine.can_infer(a, z, RelationType.RELATED_TO)   # O(α(n))
+        
+        # Inherited properties resolved at query time, not stored
+        engine = InferenceEngine(graph_store, virtual_inheritance=True)
+        
+        # Reuse results while the graph and rules are unchanged
+        engine = InferenceEngine(memory.graph, cache=InferenceCache.shared(memory))
+        
+        # Publish facts as inferred edges for PathFinder, walkers, queries
+        engine.materialize()
+        PathFinder(graph_store, include_inferred=True).find_shortest_path(a, b)
     """
     
-    def __init__(self, graph: GraphStore, rules: Optional[RuleBase] = None):
+    def __init__(
+        self,
+        graph: GraphStore,
+        rules: Optional[RuleBase] = None,
+        cache: Optional[InferenceCache] = None,
+        use_equivalence_classes: bool = True,
+        virtual_inheritance: bool = False
+    ):
         """
         Initialize inference engine.
         
         Args:
             graph: The knowledge graph to reason over
             rules: RuleBase to use (creates default if None)
+            cache: Optional InferenceCache for infer_all() results
+            use_equivalence_classes: Keep relations that are symmetric and
+                transitive as union-find classes (see equivalence_classes())
+                instead of deriving one fact per related pair
+            virtual_inheritance: Resolve inheritance rules at query time
+                from the direct parents of the queried node instead of
+                storing one fact per inherited property
         """
         self.graph = graph
         self.rules = rules or RuleBase()
+        self.cache = cache
+        self.use_equivalence_classes = use_equivalence_classes
+        self.virtual_inheritance = virtual_inheritance
+        
+        # Cache key of the result currently loaded in _derivations
+        self._state_key = None
+        
+        # Complete infer_all() result loaded in _derivations, the
+        # (max_iterations, min_confidence) it ran with, and the
+        # (graph version, rule fingerprint, mode) it reflects
+        self._closure: Optional[InferenceResult] = None
+        self._closure_params: Tuple[int, float] = (100, 0.1)
+        self._closure_key: Optional[Tuple[int, str, Tuple[bool, bool]]] = None
+        
+        # Inferred facts and their provenance (also indexes facts by node)
+        self._derivations = DerivationGraph(graph)
         
-        # Cache of inferred facts
-        self._inferred: Dict[Tuple[int, int, RelationType], InferredFact] = {}
+        # Compiled join plans, and the scans / join hash tables they share
+        # (rebuilt on every infer_all())
+        self._compiled: Optional[CompiledRuleSet] = None
+        self._compiled_mode: Tuple[bool, bool] = (False, False)
+        self._join_indexes: Dict[Tuple[Any, ...], Any] = {}
         
-        # Index: node_id -> set of inferred facts involving this node
-        self._by_node: Dict[int, Set[InferredFact]] = defaultdict(set)
+        # Transitivity rule per relation, for the compiled set above
+        self._transitive_for: Optional[CompiledRuleSet] = None
+        self._transitive_rules: Dict[RelationType, InferenceRule] = {}
+        self._joiners = {
+            JoinShape.SINGLE: self._join_single,
+            JoinShape.TWO_HOP: self._join_two_hop,
+            JoinShape.CHAIN: self._join_chain,
+        }
+        
+        # Counters of the join being profiled (None when not profiling)
+        self._join_profile: Optional[JoinProfile] = None
+        
+        # Virtual inheritance memos, valid for one graph version + rule set:
+        # (node, relation) -> {parent: (confidence, edge into it)}
+        # (node, relation) -> {target: (confidence, rule, property edge, ancestor)}
+        self._virtual_key: Optional[Tuple[int, str]] = None
+        self._ancestor_memo: Dict[Tuple[int, RelationType], Dict[int, Tuple[float, GraphEdge]]] = {}
+        self._inherited_memo: Dict[Tuple[int, RelationType], Dict[int, Tuple[float, InferenceRule, GraphEdge, int]]] = {}
         
         # Statistics
         self._stats = {
             "total_inferences": 0,
             "cache_hits": 0,
             "rules_fired": defaultdict(int),
+            "closure_warm_loads": 0,
+            "closure_catch_ups": 0,
+            "closure_rebuilds": 0,
         }
     
     def infer_all(
         self,
         max_iterations: int = 100,
-        min_confidence: float = 0.1
+        min_confidence: float = 0.1,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+        deadline_ms: Optional[float] = None,
+        max_new_facts: Optional[int] = None,
+        profile: bool = False
     ) -> InferenceResult:
         """
         Run full inference over the graph.
@@ -157,317 +408,1570 @@ class InferenceEngine:
         Applies all enabled rules until no new facts are derived
         or max_iterations is reached.
         
+        Rules are compiled into join plans (see RuleCompiler): each
+        relation is scanned once for all rules that consume it, and rules
+        with the same join shape are evaluated together. Candidate facts
+        are then merged rule by rule in priority order, keeping the first
+        rule to derive each (source, target, relation) key.
+        
+        In parallel mode every scanned relation's edges are partitioned by
+        source-node hash and evaluated in a process pool against a
+        read-only snapshot of the graph. New facts are merged and
+        deduplicated by key in this process, in rule priority order, so
+        the result is identical to the serial mode.
+        
+        With a budget (deadline_ms and/or max_new_facts) inference runs
+        anytime: rules are evaluated one join at a time, most productive
+        first (past yield per scanned edge, weighted by confidence decay),
+        and the facts found so far are returned as soon as the budget
+        runs out, with reached_fixpoint=False. Which rule is credited
+        with a fact may then differ from an unbudgeted run. Budgeted runs
+        are always serial; partial results are never cached.
+        
+        If the engine has a cache and neither the graph version nor the
+        rule set changed since a previous run with the same parameters,
+        the cached result is returned without re-running inference.
+        
+        With profile=True the run is always executed (never served from
+        the cache), joins are evaluated serially one plan at a time, and
+        result.profile holds per-join and per-rule, per-iteration
+        timings and counts (see InferenceProfile). The facts are the
+        same as in an unprofiled run.
+        
         Args:
             max_iterations: Maximum inference iterations
             min_confidence: Minimum confidence for derived facts
+            parallel: Evaluate rules in a process pool
+            max_workers: Worker processes (and partitions per relation);
+                defaults to the CPU count
+            deadline_ms: Time budget in milliseconds
+            max_new_facts: Stop after deriving this many facts
+            profile: Record an InferenceProfile in result.profile
             
         Returns:
             InferenceResult with all inferred facts
         """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = InferenceCache.make_key(
+                self.graph, self.rules, max_iterations, min_confidence, self._mode()
+            )
+            cached = None if profile else self.cache.get(cache_key)
+            if cached is not None:
+                if self._state_key != cache_key:
+                    self._load_result(cached)
+                    self._state_key = cache_key
+                self._set_closure(cached, max_iterations, min_confidence)
+                return cached
+        
         start_time = time.time()
         rules_applied = defaultdict(int)
         iteration = 0
         
-        # Clear previous inferences
-        self._inferred.clear()
-        self._by_node.clear()
+        budgeted = deadline_ms is not None or max_new_facts is not None
+        deadline = (
+            time.perf_counter() + deadline_ms / 1000.0
+            if deadline_ms is not None else None
+        )
         
-        # Get all enabled rules
-        all_rules = self.rules.get_all_enabled_rules()
+        # Clear previous inferences (earlier results keep their own DAG)
+        self._derivations = DerivationGraph(self.graph)
+        self._join_indexes.clear()
+        self._state_key = None
+        self._closure = None
         
-        # Iterate until fixpoint
+        compiled = self.compile_rules()
+        run_profile = self._new_profile(compiled, min_confidence) if profile else None
+        
+        # Rules only read base edges, so candidates are computed once
+        # and re-merged on every iteration. Budgeted runs compute them
+        # lazily, one join at a time.
+        if budgeted:
+            rule_order, plan_of = self._prioritize(compiled)
+            candidates: Dict[str, List[_Candidate]] = {}
+        elif run_profile is not None:
+            rule_order = compiled.rules
+            candidates = {}
+            for plan, join_profile in zip(compiled.plans, run_profile.joins):
+                plan_candidates, _ = self._evaluate_plan(
+                    plan, min_confidence, join_profile=join_profile
+                )
+                candidates.update(plan_candidates)
+        elif parallel:
+            rule_order = compiled.rules
+            candidates = self._evaluate_plans_parallel(
+                compiled, min_confidence, max_workers or os.cpu_count() or 1
+            )
+        else:
+            rule_order = compiled.rules
+            candidates = self._evaluate_plans(compiled, min_confidence)
+        
+        # Iterate until fixpoint (or out of budget)
         new_facts_found = True
-        while new_facts_found and iteration < max_iterations:
+        exhausted = False
+        while new_facts_found and not exhausted and iteration < max_iterations:
             new_facts_found = False
             iteration += 1
             
-            for rule in all_rules:
-                new_facts = self._apply_rule(rule, min_confidence)
+            for rule in rule_order:
+                if rule.rule_id not in candidates:
+                    join_profile = None
+                    if run_profile is not None:
+                        join_profile = run_profile.joins[run_profile.rules[rule.rule_id].join]
+                    plan_candidates, complete = self._evaluate_plan(
+                        plan_of[rule.rule_id], min_confidence, deadline, join_profile
+                    )
+                    candidates.update(plan_candidates)
+                    exhausted = not complete
+                
+                merge_start = time.perf_counter()
+                facts_before = len(self._derivations)
+                rule_candidates = candidates[rule.rule_id]
+                
+                new_facts = [
+                    candidate for candidate in rule_candidates
+                    if candidate[0] not in self._derivations
+                ]
+                
+                if max_new_facts is not None:
+                    # One candidate per key (the most confident), so
+                    # repeats within the batch don't use up the budget
+                    best: Dict[Tuple[int, int, RelationType], _Candidate] = {}
+                    for candidate in new_facts:
+                        kept = best.get(candidate[0])
+                        if kept is None or candidate[1] > kept[1]:
+                            best[candidate[0]] = candidate
+                    new_facts = list(best.values())
+                
+                fresh = len(new_facts)
+                
+                if max_new_facts is not None:
+                    # Exhausted only if facts are actually dropped
+                    room = max_new_facts - len(self._derivations)
+                    if len(new_facts) > room:
+                        new_facts = new_facts[:room]
+                        exhausted = True
                 
                 if new_facts:
                     new_facts_found = True
                     rules_applied[rule.rule_id] += len(new_facts)
+                    self._stats["rules_fired"][rule.rule_id] += len(new_facts)
                     
-                    for fact in new_facts:
-                        self._add_inferred_fact(fact)
+                    for key, confidence, premises in new_facts:
+                        self._add_inferred_fact(key, confidence, rule.rule_id, premises)
+                
+                if run_profile is not None:
+                    produced = len(self._derivations) - facts_before
+                    run_profile.rules[rule.rule_id].iterations.append(RuleIterationProfile(
+                        iteration=iteration,
+                        time_ms=(time.perf_counter() - merge_start) * 1000,
+                        candidates=len(rule_candidates),
+                        produced=produced,
+                        # Already derived, or repeated within this batch
+                        rejected_duplicate=len(rule_candidates) - fresh + len(new_facts) - produced,
+                        rejected_budget=fresh - len(new_facts)
+                    ))
+                
+                if exhausted or (deadline is not None and time.perf_counter() >= deadline):
+                    exhausted = True
+                    break
         
         elapsed = time.time() - start_time
         
-        return InferenceResult(
-            inferred_facts=list(self._inferred.values()),
+        if run_profile is not None:
+            self._finish_profile(run_profile, candidates, iteration, elapsed)
+        
+        result = InferenceResult(
+            inferred_facts=self._derivations.facts(),
             rules_applied=dict(rules_applied),
             total_iterations=iteration,
-            time_elapsed=elapsed
+            time_elapsed=elapsed,
+            derivations=self._derivations,
+            reached_fixpoint=not (new_facts_found or exhausted),
+            profile=run_profile,
+            equivalences=self._equivalences()
         )
+        
+        if cache_key is not None and result.reached_fixpoint:
+            self.cache.put(cache_key, result)
+            self._state_key = cache_key
+        if result.reached_fixpoint:
+            self._set_closure(result, max_iterations, min_confidence)
+        
+        return result
+    
+    def compile_rules(self) -> CompiledRuleSet:
+        """
+        Compile the rule base into join plans (recompiled when rules change).
+        
+        Symmetry and transitivity rules of equivalence relations are
+        left out; those relations are answered by equivalence_classes().
+        With virtual_inheritance, inheritance rules are left out too.
+        """
+        fingerprint = self.rules.fingerprint()
+        mode = self._mode()
+        if (self._compiled is None or self._compiled.fingerprint != fingerprint
+                or self._compiled_mode != mode):
+            exclude = {
+                rule.rule_id
+                for rules in self._equivalence_rules().values()
+                for rule in rules
+            }
+            exclude.update(rule.rule_id for rule in self._virtual_rules())
+            self._compiled = RuleCompiler.compile(self.rules, exclude=exclude)
+            self._compiled_mode = mode
+        return self._compiled
+    
+    def _mode(self) -> Tuple[bool, bool]:
+        """Engine options that change which facts are materialized."""
+        return (self.use_equivalence_classes, self.virtual_inheritance)
+    
+    def _equivalence_rules(self) -> Dict[RelationType, List[InferenceRule]]:
+        """Equivalence relations and their rules (none if disabled)."""
+        if not self.use_equivalence_classes:
+            return {}
+        return self.rules.get_equivalence_relations()
+    
+    def _equivalences(self) -> Dict[RelationType, EquivalenceClasses]:
+        return {
+            relation: EquivalenceClasses.shared(self.graph, relation)
+            for relation in self._equivalence_rules()
+        }
+    
+    def equivalence_classes(self, relation: RelationType) -> Optional[EquivalenceClasses]:
+        """
+        Union-find classes of a symmetric + transitive relation.
+        
+        Returns:
+            The graph's shared EquivalenceClasses for the relation, or
+            None if the enabled rules do not make it an equivalence
+        """
+        if relation not in self._equivalence_rules():
+            return None
+        return EquivalenceClasses.shared(self.graph, relation)
     
-    def _apply_rule(
+    def _dispatch_table(self, compiled: CompiledRuleSet) -> Dict[RelationType, List[JoinPlan]]:
+        """
+        Plans grouped by the relation they scan.
+        
+        Chain plans are dispatched on their pivot (rarest) relation,
+        which depends on the current graph.
+        """
+        table = compiled.dispatch_table()
+        for plan in compiled.plans:
+            if plan.shape == JoinShape.CHAIN:
+                table.setdefault(self._scan_relation(plan), []).append(plan)
+        return table
+    
+    def _prioritize(
         self,
-        rule: InferenceRule,
-        min_confidence: float
-    ) -> List[InferredFact]:
-        """Apply a single rule and return new facts."""
+        compiled: CompiledRuleSet
+    ) -> Tuple[List[InferenceRule], Dict[str, JoinPlan]]:
+        """
+        Order rules for an anytime run, most productive first.
         
-        if rule.rule_type == RuleType.TRANSITIVITY:
-            return self._apply_transitivity(rule, min_confidence)
+        A rule's score is its past yield (facts accepted from it so far,
+        plus one) per edge its join scans, weighted by its confidence
+        decay. Ties keep rule priority order.
         
-        elif rule.rule_type == RuleType.INHERITANCE:
-            return self._apply_inheritance(rule, min_confidence)
+        Returns:
+            (rules in evaluation order, rule_id -> its join plan)
+        """
+        plan_of = {}
+        cost = {}
+        for plan in compiled.plans:
+            scanned = self.graph.count_edges_by_type(self._scan_relation(plan))
+            for rule in plan.rules:
+                plan_of[rule.rule_id] = plan
+                cost[rule.rule_id] = scanned
         
-        elif rule.rule_type == RuleType.INVERSE:
-            return self._apply_inverse(rule, min_confidence)
+        fired = self._stats["rules_fired"]
+        order = sorted(
+            compiled.rules,
+            key=lambda rule: -(
+                rule.confidence_decay * (fired[rule.rule_id] + 1) / (cost[rule.rule_id] + 1)
+            )
+        )
+        return order, plan_of
+    
+    def _scan_relation(self, plan: JoinPlan) -> RelationType:
+        """Relation whose edges drive a plan (the pivot for chains)."""
+        if plan.shape == JoinShape.CHAIN:
+            pivot, _ = self._chain_plan(plan.relations)
+            return plan.relations[pivot]
+        return plan.scan_relation
+    
+    def _evaluate_plan(
+        self,
+        plan: JoinPlan,
+        min_confidence: float,
+        deadline: Optional[float] = None,
+        join_profile: Optional[JoinProfile] = None
+    ) -> Tuple[Dict[str, List[_Candidate]], bool]:
+        """
+        Compute the candidate facts of a single plan.
         
-        elif rule.rule_type == RuleType.SYMMETRY:
-            return self._apply_symmetry(rule, min_confidence)
+        Args:
+            plan: Join plan to run
+            min_confidence: Minimum confidence for derived facts
+            deadline: time.perf_counter() value to stop scanning at
+            join_profile: Counters to record the join's cost in
+            
+        Returns:
+            (rule_id -> candidate facts, whether the scan completed)
+        """
+        out: Dict[str, List[_Candidate]] = {rule.rule_id: [] for rule in plan.rules}
+        joiner = self._joiners[plan.shape]
+        complete = True
+        scanned = 0
         
-        elif rule.rule_type == RuleType.COMPOSITION:
-            return self._apply_composition(rule, min_confidence)
+        self._join_profile = join_profile
+        start = time.perf_counter()
+        try:
+            for i, edge in enumerate(self._relation_edges(self._scan_relation(plan))):
+                # Check the clock every 64 edges
+                if deadline is not None and i % 64 == 0 and time.perf_counter() >= deadline:
+                    complete = False
+                    break
+                joiner(plan, edge, min_confidence, out)
+                scanned += 1
+        finally:
+            self._join_profile = None
         
-        elif rule.rule_type == RuleType.CHAIN:
-            return self._apply_chain(rule, min_confidence)
+        if join_profile is not None:
+            join_profile.scanned_edges += scanned
+            join_profile.time_ms += (time.perf_counter() - start) * 1000
         
-        return []
+        return out, complete
     
-    def _apply_transitivity(
+    def _evaluate_plans(
         self,
-        rule: InferenceRule,
+        compiled: CompiledRuleSet,
         min_confidence: float
-    ) -> List[InferredFact]:
+    ) -> Dict[str, List[_Candidate]]:
         """
-        Apply transitive rule.
+        Compute every rule's candidate facts, one scan per relation.
         
-        If A->B and B->C exist with the antecedent relation,
-        derive A->C with the consequent relation.
+        Returns:
+            rule_id -> candidate facts (not yet deduplicated)
         """
-        if len(rule.antecedent_relations) != 2:
-            return []
+        candidates: Dict[str, List[_Candidate]] = {rule.rule_id: [] for rule in compiled.rules}
         
-        rel1, rel2 = rule.antecedent_relations
-        new_facts = []
+        for relation, plans in self._dispatch_table(compiled).items():
+            for edge in self._relation_edges(relation):
+                self._evaluate_edge(plans, edge, min_confidence, candidates)
         
-        # Get all edges of the first relation type
-        edges1 = self.graph.get_edges_by_type(rel1)
+        return candidates
+    
+    def _evaluate_plans_parallel(
+        self,
+        compiled: CompiledRuleSet,
+        min_confidence: float,
+        max_workers: int
+    ) -> Dict[str, List[_Candidate]]:
+        """
+        Compute every rule's candidate facts in a process pool.
+        
+        Each scanned relation's edges are split into max_workers
+        partitions by hash of the source node. Per-edge results are
+        reassembled in the parent's scan order, so ties between
+        equal-confidence derivations resolve exactly as in the serial mode.
+        
+        Returns:
+            rule_id -> candidate facts (not yet deduplicated)
+        """
+        candidates: Dict[str, List[_Candidate]] = {rule.rule_id: [] for rule in compiled.rules}
+        snapshot = _GraphSnapshot(self.graph)
         
-        for edge1 in edges1:
-            # Find edges that continue from edge1's target
-            mid_node = edge1.target_id
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(snapshot,)
+        ) as executor:
+            pending = []
+            ordered = []
             
-            for edge2 in self.graph.get_outgoing_edges(mid_node):
-                if edge2.relation_type != rel2:
-                    continue
-                
-                # Found a chain: edge1.source -> mid -> edge2.target
-                source = edge1.source_id
-                target = edge2.target_id
-                
-                # Skip if same node or already exists
-                if source == target:
-                    continue
+            for relation, plans in self._dispatch_table(compiled).items():
+                scan = self._relation_edges(relation)
+                partitions: Dict[int, List[int]] = defaultdict(list)
+                for index, edge in enumerate(scan):
+                    partitions[hash(edge.source_id) % max_workers].append(index)
                 
-                key = (source, target, rule.consequent_relation)
-                if key in self._inferred:
-                    continue
-                
-                if self.graph.has_edge_between(source, target, rule.consequent_relation):
+                slots: List[Optional[Dict[str, List[_Candidate]]]] = [None] * len(scan)
+                ordered.append(slots)
+                for indices in partitions.values():
+                    future = executor.submit(
+                        _evaluate_partition,
+                        plans,
+                        [scan[i].edge_id for i in indices],
+                        min_confidence
+                    )
+                    pending.append((slots, indices, future))
+            
+            for slots, indices, future in pending:
+                for index, group in zip(indices, future.result()):
+                    slots[index] = group
+        
+        for slots in ordered:
+            for group in slots:
+                for rule_id, facts in group.items():
+                    candidates[rule_id].extend(facts)
+        
+        return candidates
+    
+    def _evaluate_edge(
+        self,
+        plans: List[JoinPlan],
+        edge: GraphEdge,
+        min_confidence: float,
+        out: Dict[str, List[_Candidate]]
+    ) -> None:
+        """Run every plan that scans this edge's relation, appending to out."""
+        for plan in plans:
+            self._joiners[plan.shape](plan, edge, min_confidence, out)
+    
+    def _join_single(
+        self,
+        plan: JoinPlan,
+        edge: GraphEdge,
+        min_confidence: float,
+        out: Dict[str, List[_Candidate]]
+    ) -> None:
+        """
+        Single-edge plan (inverse, symmetry).
+        
+        If A->B exists, derive B->A with each rule's consequent relation.
+        """
+        premises = (edge.edge_id,)
+        profile = self._join_profile
+        if profile is not None:
+            profile.join_rows += 1
+        
+        for rule, consequent in zip(plan.rules, plan.consequents):
+            if self.graph.has_edge_between(edge.target_id, edge.source_id, consequent):
+                if profile is not None:
+                    profile.rejected_existing[rule.rule_id] += 1
+                continue
+            
+            confidence = edge.weight * rule.confidence_decay
+            
+            if confidence >= min_confidence:
+                out[rule.rule_id].append(
+                    ((edge.target_id, edge.source_id, consequent), confidence, premises)
+                )
+            elif profile is not None:
+                profile.rejected_min_confidence[rule.rule_id] += 1
+    
+    def _join_two_hop(
+        self,
+        plan: JoinPlan,
+        edge1: GraphEdge,
+        min_confidence: float,
+        out: Dict[str, List[_Candidate]]
+    ) -> None:
+        """
+        Two-hop hash join (transitivity, composition, inheritance).
+        
+        If A->B (first relation) and B->C (second relation) exist,
+        derive A->C with each rule's consequent relation. Inheritance is
+        the same join: A IS_A B and B has property P, so A inherits P.
+        """
+        rel2 = plan.relations[1]
+        mid_node = edge1.target_id
+        profile = self._join_profile
+        
+        # Hash table: mid node -> edges of the second relation
+        matches = self._relation_index(rel2, "source").get(mid_node, ())
+        if profile is not None:
+            profile.join_rows += len(matches)
+        
+        for edge2 in matches:
+            # Found a chain: edge1.source -> mid -> edge2.target
+            source = edge1.source_id
+            target = edge2.target_id
+            
+            # Skip if same node
+            if source == target:
+                continue
+            
+            weight = edge1.weight * edge2.weight
+            premises = (edge1.edge_id, edge2.edge_id)
+            
+            for rule, consequent in zip(plan.rules, plan.consequents):
+                if self.graph.has_edge_between(source, target, consequent):
+                    if profile is not None:
+                        profile.rejected_existing[rule.rule_id] += 1
                     continue
                 
                 # Calculate confidence
-                confidence = edge1.weight * edge2.weight * rule.confidence_decay
+                confidence = weight * rule.confidence_decay
                 
                 if confidence >= min_confidence:
-                    fact = InferredFact(
-                        source_id=source,
-                        target_id=target,
-                        relation=rule.consequent_relation,
-                        confidence=confidence,
-                        rule_id=rule.rule_id,
-                        chain=[
-                            (edge1.source_id, rel1, mid_node),
-                            (mid_node, rel2, edge2.target_id)
-                        ],
-                        depth=2
+                    out[rule.rule_id].append(
+                        ((source, target, consequent), confidence, premises)
                     )
-                    new_facts.append(fact)
-        
-        return new_facts
+                elif profile is not None:
+                    profile.rejected_min_confidence[rule.rule_id] += 1
     
-    def _apply_inheritance(
+    def _join_chain(
         self,
-        rule: InferenceRule,
-        min_confidence: float
-    ) -> List[InferredFact]:
+        plan: JoinPlan,
+        seed: GraphEdge,
+        min_confidence: float,
+        out: Dict[str, List[_Candidate]]
+    ) -> None:
         """
-        Apply inheritance rule.
+        Multi-hop chain plan, seeded from one edge of the pivot relation.
         
-        If A IS_A B and B has property P, then A inherits P.
+        Runs as a pipelined join seeded from the rarest relation (see
+        _chain_plan) and expanded one hop at a time towards both ends.
+        Confidence only decreases along the product, so a partial chain
+        is dropped as soon as its best possible completion falls below
+        min_confidence for every rule in the plan.
         """
-        if len(rule.antecedent_relations) != 2:
-            return []
+        relations = plan.relations
+        _, steps = self._chain_plan(relations)
+        decay = max(rule.confidence_decay for rule in plan.rules)
+        profile = self._join_profile
+        
+        # Upper bound on the product still to come, per remaining step
+        max_weight = []
+        for rel in relations:
+            weights = [e.weight for e in self._relation_edges(rel)]
+            max_weight.append(max(weights) if weights else 0.0)
+        remaining = [1.0] * (len(steps) + 1)
+        for i in range(len(steps) - 1, -1, -1):
+            remaining[i] = remaining[i + 1] * max_weight[steps[i][1]]
         
-        is_a_rel, prop_rel = rule.antecedent_relations
-        new_facts = []
+        if seed.weight * remaining[0] * decay < min_confidence:
+            if profile is not None:
+                profile.pruned += 1
+            return
         
-        # For each IS_A edge
-        is_a_edges = self.graph.get_edges_by_type(is_a_rel)
+        # Depth-first pipeline: (step, left, right, confidence, chain edges)
+        stack = [(0, seed.source_id, seed.target_id, seed.weight, [seed])]
         
-        for is_a_edge in is_a_edges:
-            subclass = is_a_edge.source_id
-            superclass = is_a_edge.target_id
+        while stack:
+            step, left, right, confidence, chain = stack.pop()
             
-            # Find properties of superclass
-            for prop_edge in self.graph.get_outgoing_edges(superclass):
-                if prop_edge.relation_type != prop_rel:
-                    continue
-                
-                property_target = prop_edge.target_id
-                
-                # Check if subclass already has this property
-                key = (subclass, property_target, rule.consequent_relation)
-                if key in self._inferred:
-                    continue
-                
-                if self.graph.has_edge_between(subclass, property_target, rule.consequent_relation):
+            if step == len(steps):
+                if profile is not None:
+                    profile.join_rows += 1
+                if left == right:
                     continue
                 
-                confidence = is_a_edge.weight * prop_edge.weight * rule.confidence_decay
+                premises = tuple(e.edge_id for e in chain)
                 
-                if confidence >= min_confidence:
-                    fact = InferredFact(
-                        source_id=subclass,
-                        target_id=property_target,
-                        relation=rule.consequent_relation,
-                        confidence=confidence,
-                        rule_id=rule.rule_id,
-                        chain=[
-                            (subclass, is_a_rel, superclass),
-                            (superclass, prop_rel, property_target)
-                        ],
-                        depth=2
+                for rule, consequent in zip(plan.rules, plan.consequents):
+                    if confidence * rule.confidence_decay < min_confidence:
+                        if profile is not None:
+                            profile.rejected_min_confidence[rule.rule_id] += 1
+                        continue
+                    if self.graph.has_edge_between(left, right, consequent):
+                        if profile is not None:
+                            profile.rejected_existing[rule.rule_id] += 1
+                        continue
+                    
+                    out[rule.rule_id].append(
+                        ((left, right, consequent), confidence * rule.confidence_decay, premises)
                     )
-                    new_facts.append(fact)
+                continue
+            
+            side, rel_index = steps[step]
+            bound = remaining[step + 1] * decay
+            
+            if side == "right":
+                joins = self._relation_index(relations[rel_index], "source").get(right, ())
+            else:
+                joins = self._relation_index(relations[rel_index], "target").get(left, ())
+            
+            # Reversed so the stack pops joins in index order
+            for edge in reversed(joins):
+                next_conf = confidence * edge.weight
+                if next_conf * bound < min_confidence:
+                    if profile is not None:
+                        profile.pruned += 1
+                    continue
+                if side == "right":
+                    stack.append((step + 1, left, edge.target_id, next_conf, chain + [edge]))
+                else:
+                    stack.append((step + 1, edge.source_id, right, next_conf, [edge] + chain))
+    
+    def _chain_plan(self, relations: Tuple[RelationType, ...]) -> Tuple[int, List[Tuple[str, int]]]:
+        """
+        Choose the join order for a multi-hop chain.
+        
+        Starts from the relation with the fewest edges, then repeatedly
+        extends whichever end (left or right) has the rarer next relation.
+        
+        Returns:
+            (pivot index, [(side, relation index), ...] expansion steps)
+        """
+        cache_key = ("plan", tuple(relations))
+        plan = self._join_indexes.get(cache_key)
+        if plan is not None:
+            return plan
+        
+        counts = [self.graph.count_edges_by_type(rel) for rel in relations]
+        pivot = min(range(len(relations)), key=lambda i: (counts[i], i))
+        
+        steps = []
+        lo, hi = pivot, pivot
+        while lo > 0 or hi < len(relations) - 1:
+            if hi == len(relations) - 1 or (lo > 0 and counts[lo - 1] < counts[hi + 1]):
+                lo -= 1
+                steps.append(("left", lo))
+            else:
+                hi += 1
+                steps.append(("right", hi))
         
-        return new_facts
+        self._join_indexes[cache_key] = (pivot, steps)
+        return pivot, steps
     
-    def _apply_inverse(
+    def _relation_edges(self, relation: RelationType) -> List[GraphEdge]:
+        """All edges of a relation, scanned once per infer_all() run."""
+        cache_key = (relation, "all")
+        edges = self._join_indexes.get(cache_key)
+        if edges is None:
+            edges = self.graph.get_edges_by_type(relation)
+            self._join_indexes[cache_key] = edges
+        return edges
+    
+    def _relation_index(self, relation: RelationType, key: str) -> Dict[int, List[GraphEdge]]:
+        """
+        Join hash table of a relation's edges by "source" or "target" node.
+        
+        Built once per infer_all() run and shared by every plan that
+        joins on it.
+        """
+        cache_key = (relation, key)
+        index = self._join_indexes.get(cache_key)
+        if index is None:
+            index = defaultdict(list)
+            for edge in self._relation_edges(relation):
+                node = edge.source_id if key == "source" else edge.target_id
+                index[node].append(edge)
+            self._join_indexes[cache_key] = index
+        return index
+    
+    def _new_profile(self, compiled: CompiledRuleSet, min_confidence: float) -> InferenceProfile:
+        """Empty profile with one JoinProfile per plan (same order)."""
+        run_profile = InferenceProfile(min_confidence=min_confidence)
+        for index, plan in enumerate(compiled.plans):
+            run_profile.joins.append(JoinProfile(
+                shape=plan.shape.value,
+                relations=[rel.value for rel in plan.relations],
+                rules=[rule.rule_id for rule in plan.rules],
+                input_edges={
+                    rel.value: self.graph.count_edges_by_type(rel)
+                    for rel in plan.relations
+                }
+            ))
+            for rule in plan.rules:
+                run_profile.rules[rule.rule_id] = RuleProfile(rule_id=rule.rule_id, join=index)
+        return run_profile
+    
+    def _finish_profile(
         self,
-        rule: InferenceRule,
-        min_confidence: float
-    ) -> List[InferredFact]:
+        run_profile: InferenceProfile,
+        candidates: Dict[str, List[_Candidate]],
+        iterations: int,
+        elapsed: float
+    ) -> None:
+        """Copy per-rule join counters into the rule profiles."""
+        run_profile.iterations = iterations
+        run_profile.time_ms = elapsed * 1000
+        for rule_profile in run_profile.rules.values():
+            rule_id = rule_profile.rule_id
+            join = run_profile.joins[rule_profile.join]
+            rule_profile.candidates = len(candidates.get(rule_id, ()))
+            rule_profile.rejected_min_confidence = join.rejected_min_confidence.get(rule_id, 0)
+            rule_profile.rejected_existing = join.rejected_existing.get(rule_id, 0)
+    
+    def _load_result(self, result: InferenceResult) -> None:
+        """Replace the fact cache with a previous result's facts."""
+        if result.derivations is not None:
+            self._derivations = result.derivations
+            return
+        
+        self._derivations = DerivationGraph(self.graph)
+        for fact in result.inferred_facts:
+            self._derivations.record(
+                (fact.source_id, fact.target_id, fact.relation),
+                fact.confidence,
+                fact.rule_id,
+                depth=fact.depth
+            )
+    
+    def _add_inferred_fact(
+        self,
+        key: Tuple[int, int, RelationType],
+        confidence: float,
+        rule_id: str,
+        premises: Tuple[int, ...]
+    ) -> None:
+        """Add an inferred fact (keeps the highest-confidence derivation)."""
+        _, stored = self._derivations.record(key, confidence, rule_id, edge_premises=premises)
+        if stored:
+            self._stats["total_inferences"] += 1
+    
+    @property
+    def derivations(self) -> DerivationGraph:
+        """Provenance of the currently loaded facts."""
+        return self._derivations
+    
+    def explain_analyze(
+        self,
+        max_iterations: int = 100,
+        min_confidence: float = 0.1,
+        deadline_ms: Optional[float] = None,
+        max_new_facts: Optional[int] = None
+    ) -> InferenceProfile:
         """
-        Apply inverse rule.
+        Run inference and return where its time and candidates went.
         
-        If A->B exists, derive B->A with inverse relation.
+        Same as infer_all(..., profile=True).profile; call .report() on
+        the result for a readable version.
         """
-        if len(rule.antecedent_relations) != 1:
-            return []
+        result = self.infer_all(
+            max_iterations=max_iterations,
+            min_confidence=min_confidence,
+            deadline_ms=deadline_ms,
+            max_new_facts=max_new_facts,
+            profile=True
+        )
+        return result.profile
+    
+    # ═══════════════════════════════════════════════════════════════════
+    # INFERRED-EDGE OVERLAY
+    # ═══════════════════════════════════════════════════════════════════
+    
+    def materialize(
+        self,
+        max_iterations: int = 100,
+        min_confidence: float = 0.1,
+        parallel: bool = False,
+        best: bool = False
+    ) -> int:
+        """
+        Publish the inference closure as the graph's inferred-edge overlay.
         
-        source_rel = rule.antecedent_relations[0]
-        new_facts = []
+        Every fact becomes an edge with inferred=True, its confidence as
+        weight and the deriving rule as rule_id. Traversal APIs follow
+        these edges when called with include_inferred=True, so derived
+        knowledge is computed once and shared by all consumers.
         
-        for edge in self.graph.get_edges_by_type(source_rel):
-            # Inverse: swap source and target
-            key = (edge.target_id, edge.source_id, rule.consequent_relation)
-            
-            if key in self._inferred:
-                continue
+        Nothing is recomputed while the overlay was already built from
+        the same graph version, rule set and parameters.
+        
+        Args:
+            max_iterations: Passed to infer_all()
+            min_confidence: Passed to infer_all()
+            parallel: Passed to infer_all()
+            best: Publish infer_best() facts instead
+        
+        Returns:
+            Number of inferred edges in the overlay
+        """
+        tag = (
+            "inference", self.rules.fingerprint(), max_iterations, min_confidence,
+            best, self._mode()
+        )
+        if self.graph.inferred_tag == (self.graph.version, tag):
+            return self.graph.inferred_edge_count
+        
+        if best:
+            self.infer_best(min_confidence=min_confidence)
+        else:
+            self.infer_all(
+                max_iterations=max_iterations,
+                min_confidence=min_confidence,
+                parallel=parallel
+            )
+        
+        dag = self._derivations
+        return self.graph.set_inferred_edges(
+            (
+                dag.key(fid) + (dag.confidence(fid), dag.rule_id(fid))
+                for fid in range(len(dag))
+            ),
+            tag=tag
+        )
+    
+    # ═══════════════════════════════════════════════════════════════════
+    # BEST-DERIVATION CLOSURE
+    # ═══════════════════════════════════════════════════════════════════
+    
+    def infer_best(self, min_confidence: float = 0.1) -> InferenceResult:
+        """
+        Infer the highest-confidence derivation of every fact.
+        
+        Transitivity rules are closed with a max-product search from
+        every source node, over chains of at most the rule's max_depth
+        hops. A path's confidence is the product of its edge weights
+        times the rule's decay for every hop after the first. Every
+        factor is at most 1, so a branch is dropped as soon as it can no
+        longer reach min_confidence. Facts up to max_depth deep are
+        derived (the joins of infer_all() chain two base edges).
+        
+        Other rules are evaluated by their joins. Across rules, each
+        (source, target, relation) keeps its highest-confidence
+        derivation; ties keep rule priority order. The facts replace the
+        engine's current ones and are cached like infer_all() results.
+        
+        Args:
+            min_confidence: Minimum confidence for derived facts
+        
+        Returns:
+            InferenceResult (one iteration, always at fixpoint)
+        """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = InferenceCache.make_key(
+                self.graph, self.rules, "best", min_confidence, self._mode()
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                if self._state_key != cache_key:
+                    self._load_result(cached)
+                    self._state_key = cache_key
+                    self._closure = None
+                return cached
+        
+        start_time = time.time()
+        
+        self._derivations = DerivationGraph(self.graph)
+        self._join_indexes.clear()
+        self._state_key = None
+        self._closure = None
+        
+        compiled = self.compile_rules()
+        closure_rules = {
+            rule.rule_id for rule in compiled.rules
+            if self._transitive_rule(rule.consequent_relation) is rule
+        }
+        
+        # Joins only for plans with at least one non-closure rule
+        candidates: Dict[str, List[_Candidate]] = {}
+        for plan in compiled.plans:
+            if any(rule.rule_id not in closure_rules for rule in plan.rules):
+                plan_candidates, _ = self._evaluate_plan(plan, min_confidence)
+                candidates.update(plan_candidates)
+        
+        for rule in compiled.rules:
+            if rule.rule_id in closure_rules:
+                derived = self._best_closure(rule, min_confidence)
+            else:
+                derived = candidates.get(rule.rule_id, ())
             
-            if self.graph.has_edge_between(edge.target_id, edge.source_id, rule.consequent_relation):
-                continue
+            for key, confidence, premises in derived:
+                self._add_inferred_fact(key, confidence, rule.rule_id, premises)
+        
+        # Credit each fact to the rule of its winning derivation
+        rules_applied: Dict[str, int] = defaultdict(int)
+        for fact_id in range(len(self._derivations)):
+            rules_applied[self._derivations.rule_id(fact_id)] += 1
+        for rule_id, count in rules_applied.items():
+            self._stats["rules_fired"][rule_id] += count
+        
+        result = InferenceResult(
+            inferred_facts=self._derivations.facts(),
+            rules_applied=dict(rules_applied),
+            total_iterations=1,
+            time_elapsed=time.time() - start_time,
+            derivations=self._derivations,
+            equivalences=self._equivalences()
+        )
+        
+        if cache_key is not None:
+            self.cache.put(cache_key, result)
+            self._state_key = cache_key
+        
+        return result
+    
+    def _best_closure(self, rule: InferenceRule, min_confidence: float) -> List[_Candidate]:
+        """
+        Best derivations of a transitivity rule, one search per source.
+        
+        Chains are limited to the rule's max_depth hops (see _best_paths).
+        
+        Returns:
+            Candidates for every (source, target) at depth >= 2 that is
+            not already a base edge, with their best chain as premises
+        """
+        relation = rule.consequent_relation
+        successors = self._relation_index(relation, "source")
+        
+        def expand(node: int) -> Iterable[GraphEdge]:
+            return successors.get(node, ())
+        
+        out: List[_Candidate] = []
+        for source in list(successors):
+            best, labels = self._best_paths(
+                source, expand, rule.confidence_decay, rule.max_depth, min_confidence
+            )
+            for node, (confidence, hops) in best.items():
+                if hops < 2 or self.graph.has_edge_between(source, node, relation):
+                    continue
+                chain = tuple(edge.edge_id for edge in self._best_chain(node, best, labels))
+                out.append(((source, node, relation), confidence, chain))
+        
+        return out
+    
+    def _best_paths(
+        self,
+        source: int,
+        successors: Callable[[int], Iterable[GraphEdge]],
+        decay: float,
+        max_depth: int,
+        min_confidence: float
+    ) -> Tuple[Dict[int, Tuple[float, int]], List[Dict[int, GraphEdge]]]:
+        """
+        Most confident paths of at most max_depth hops from a source.
+        
+        A path's confidence is the product of its edge weights times the
+        decay for every hop after the first. Layer h relaxes only the
+        nodes improved at layer h - 1 (Bellman-Ford by hop count), so the
+        result is exact under the hop limit, where a plain max-product
+        Dijkstra could settle a node through a long path and lose a
+        shorter, weaker one that reaches further. Every factor is at most
+        1, so branches that can no longer reach min_confidence are cut.
+        
+        Returns:
+            (node -> (confidence, hops of its best path), per-layer maps of
+            node -> edge into it; see _best_chain)
+        """
+        best: Dict[int, Tuple[float, int]] = {}
+        labels: List[Dict[int, GraphEdge]] = [{}]
+        frontier = {source: 1.0}
+        
+        for hops in range(1, max_depth + 1):
+            # The first hop carries no decay, but any fact through it will
+            factor = decay if hops > 1 else 1.0
+            bound = 1.0 if hops > 1 else decay
             
-            confidence = edge.weight * rule.confidence_decay
+            layer: Dict[int, Tuple[float, GraphEdge]] = {}
+            for node, confidence in frontier.items():
+                for edge in successors(node):
+                    target = edge.target_id
+                    if target == source:
+                        continue
+                    next_conf = confidence * factor * edge.weight
+                    if next_conf * bound < min_confidence:
+                        continue
+                    if (next_conf > best.get(target, (0.0,))[0]
+                            and next_conf > layer.get(target, (0.0,))[0]):
+                        layer[target] = (next_conf, edge)
+            if not layer:
+                break
             
-            if confidence >= min_confidence:
-                fact = InferredFact(
-                    source_id=edge.target_id,
-                    target_id=edge.source_id,
-                    relation=rule.consequent_relation,
-                    confidence=confidence,
-                    rule_id=rule.rule_id,
-                    chain=[(edge.source_id, source_rel, edge.target_id)],
-                    depth=1
-                )
-                new_facts.append(fact)
+            labels.append({target: edge for target, (_, edge) in layer.items()})
+            for target, (confidence, _) in layer.items():
+                best[target] = (confidence, hops)
+            frontier = {target: confidence for target, (confidence, _) in layer.items()}
         
-        return new_facts
+        return best, labels
     
-    def _apply_symmetry(
+    def _best_chain(
         self,
-        rule: InferenceRule,
-        min_confidence: float
+        node: int,
+        best: Dict[int, Tuple[float, int]],
+        labels: List[Dict[int, GraphEdge]]
+    ) -> List[GraphEdge]:
+        """Edges of a node's best path found by _best_paths, in order."""
+        chain = []
+        hops = best[node][1]
+        while hops:
+            edge = labels[hops][node]
+            chain.append(edge)
+            node = edge.source_id
+            hops -= 1
+        chain.reverse()
+        return chain
+    
+    # ═══════════════════════════════════════════════════════════════════
+    # VIRTUAL INHERITANCE
+    # ═══════════════════════════════════════════════════════════════════
+    
+    def inherited_relations(
+        self,
+        node_id: int,
+        relation: Optional[RelationType] = None,
+        min_confidence: float = 0.1
     ) -> List[InferredFact]:
         """
-        Apply symmetry rule.
+        Properties a node inherits from its parents, resolved on demand.
+        
+        For an inheritance rule H(A,B), P(B,C) ⟹ P'(A,C) each direct H
+        parent's P edges are inherited, exactly like the materialized
+        join (rules read base edges only, so derived H facts do not
+        feed inheritance). Results are memoized per (node, relation)
+        until the graph or the rules change, so memory grows with the
+        nodes queried, not with taxonomy depth × width.
         
-        If A->B exists, derive B->A with same relation.
+        Works with or without virtual_inheritance; in the default mode
+        the same facts are also materialized.
+        
+        Args:
+            node_id: Node to resolve
+            relation: Inherited relation (None = every inheritance rule)
+            min_confidence: Minimum confidence
+        
+        Returns:
+            InferredFact views with explicit chains (not stored)
         """
-        if len(rule.antecedent_relations) != 1:
+        relations = [relation] if relation is not None else self._virtual_relations(all_rules=True)
+        facts = []
+        for rel in relations:
+            for target, entry in self._inherited(node_id, rel, all_rules=True).items():
+                if entry[0] >= min_confidence:
+                    facts.append(self._inherited_fact(node_id, target, rel, entry))
+        return facts
+    
+    def _virtual_rules(self, all_rules: bool = False) -> List[InferenceRule]:
+        """Inheritance rules resolved at query time."""
+        if not (self.virtual_inheritance or all_rules):
             return []
+        return [
+            rule for rule in self.rules.get_all_enabled_rules()
+            if rule.rule_type == RuleType.INHERITANCE
+            and len(rule.antecedent_relations) == 2
+            and rule.consequent_relation is not None
+        ]
+    
+    def _virtual_relations(self, all_rules: bool = False) -> List[RelationType]:
+        relations = []
+        for rule in self._virtual_rules(all_rules):
+            if rule.consequent_relation not in relations:
+                relations.append(rule.consequent_relation)
+        return relations
+    
+    def _sync_virtual(self) -> None:
+        """Drop the memos when the graph or the rules changed."""
+        key = (self.graph.version, self.rules.fingerprint())
+        if key != self._virtual_key:
+            self._ancestor_memo.clear()
+            self._inherited_memo.clear()
+            self._virtual_key = key
+    
+    def _ancestors(self, node_id: int, relation: RelationType) -> Dict[int, Tuple[float, GraphEdge]]:
+        """
+        Direct parents of a node along one relation (memoized).
         
-        rel = rule.antecedent_relations[0]
-        new_facts = []
+        Only base edges count, matching the materialized inheritance
+        join, which reads base edges only.
         
-        for edge in self.graph.get_edges_by_type(rel):
-            # Check if reverse already exists
-            key = (edge.target_id, edge.source_id, rel)
-            
-            if key in self._inferred:
-                continue
-            
-            if self.graph.has_edge_between(edge.target_id, edge.source_id, rel):
+        Returns:
+            parent -> (weight of the strongest edge to it, that edge)
+        """
+        key = (node_id, relation)
+        memo = self._ancestor_memo.get(key)
+        if memo is not None:
+            return memo
+        
+        memo = {}
+        for edge in self.graph.get_outgoing_edges(node_id):
+            if edge.relation_type != relation or edge.target_id == node_id:
                 continue
+            if edge.weight > memo.get(edge.target_id, (-1.0,))[0]:
+                memo[edge.target_id] = (edge.weight, edge)
+        
+        self._ancestor_memo[key] = memo
+        return memo
+    
+    def _inherited(
+        self,
+        node_id: int,
+        relation: RelationType,
+        all_rules: bool = False
+    ) -> Dict[int, Tuple[float, InferenceRule, GraphEdge, int]]:
+        """
+        Properties of one relation a node inherits (memoized).
+        
+        Returns:
+            target -> (confidence, rule, property edge, ancestor)
+        """
+        rules = [r for r in self._virtual_rules(all_rules) if r.consequent_relation == relation]
+        if not rules:
+            return {}
+        
+        self._sync_virtual()
+        key = (node_id, relation)
+        memo = self._inherited_memo.get(key)
+        if memo is not None:
+            return memo
+        
+        memo = {}
+        for rule in rules:
+            hierarchy, prop = rule.antecedent_relations
+            for ancestor, (confidence, _) in self._ancestors(node_id, hierarchy).items():
+                for edge in self.graph.get_outgoing_edges(ancestor):
+                    if edge.relation_type != prop or edge.target_id == node_id:
+                        continue
+                    target = edge.target_id
+                    inherited = confidence * edge.weight * rule.confidence_decay
+                    if inherited <= memo.get(target, (0.0,))[0]:
+                        continue
+                    if self.graph.has_edge_between(node_id, target, relation):
+                        continue
+                    memo[target] = (inherited, rule, edge, ancestor)
+        
+        self._inherited_memo[key] = memo
+        return memo
+    
+    def _inherited_into(self, node_id: int) -> List[Tuple[int, RelationType, Tuple[float, InferenceRule, GraphEdge, int]]]:
+        """
+        Virtual facts with node_id as target: children of every node
+        holding a property edge into it.
+        
+        Returns:
+            [(source, relation, memo entry), ...]
+        """
+        results = []
+        seen = set()
+        for rule in self._virtual_rules():
+            hierarchy, prop = rule.antecedent_relations
+            relation = rule.consequent_relation
             
-            confidence = edge.weight * rule.confidence_decay
-            
-            if confidence >= min_confidence:
-                fact = InferredFact(
-                    source_id=edge.target_id,
-                    target_id=edge.source_id,
-                    relation=rel,
-                    confidence=confidence,
-                    rule_id=rule.rule_id,
-                    chain=[(edge.source_id, rel, edge.target_id)],
-                    depth=1
-                )
-                new_facts.append(fact)
+            for edge in self.graph.get_incoming_edges(node_id):
+                if edge.relation_type != prop:
+                    continue
+                
+                # Direct children of the property holder along the hierarchy
+                for child_edge in self.graph.get_incoming_edges(edge.source_id):
+                    child = child_edge.source_id
+                    if child_edge.relation_type != hierarchy or (child, relation) in seen:
+                        continue
+                    entry = self._inherited(child, relation).get(node_id)
+                    if entry is not None:
+                        seen.add((child, relation))
+                        results.append((child, relation, entry))
+        return results
+    
+    def _inherited_fact(
+        self,
+        source_id: int,
+        target_id: int,
+        relation: RelationType,
+        entry: Tuple[float, InferenceRule, GraphEdge, int]
+    ) -> InferredFact:
+        """InferredFact view of a virtual inheritance, with its chain."""
+        confidence, rule, prop_edge, ancestor = entry
+        hierarchy = rule.antecedent_relations[0]
+        ancestors = self._ancestors(source_id, hierarchy)
+        
+        chain = [(prop_edge.source_id, prop_edge.relation_type, prop_edge.target_id)]
+        step = ancestor
+        while step != source_id:
+            edge = ancestors[step][1]
+            chain.append((edge.source_id, edge.relation_type, edge.target_id))
+            step = edge.source_id
+        chain.reverse()
         
-        return new_facts
+        return InferredFact(
+            source_id=source_id,
+            target_id=target_id,
+            relation=relation,
+            confidence=confidence,
+            rule_id=rule.rule_id,
+            chain=chain,
+            depth=len(chain)
+        )
+    
+    # ═══════════════════════════════════════════════════════════════════
+    # LOCAL (QUERY-SCOPED) INFERENCE
+    # ═══════════════════════════════════════════════════════════════════
     
-    def _apply_composition(
+    def infer_local(
         self,
-        rule: InferenceRule,
-        min_confidence: float
-    ) -> List[InferredFact]:
-        """Apply composition rule (same as transitivity but for mixed relations)."""
-        return self._apply_transitivity(rule, min_confidence)
+        seed_node_ids: List[int],
+        radius: Optional[int] = None,
+        min_confidence: float = 0.1,
+        max_facts: Optional[int] = None,
+        max_nodes: Optional[int] = None,
+        deadline_ms: Optional[float] = None
+    ) -> InferenceResult:
+        """
+        Run inference only around a set of seed nodes.
+        
+        Rules are applied to the subgraph induced by the k-hop
+        neighborhood of the seeds (edges followed in both directions), so
+        the cost depends on the neighborhood, not on the whole graph.
+        Derived facts are ranked by proximity to the seeds, then
+        confidence. The engine's global facts are left untouched.
+        
+        Args:
+            seed_node_ids: Nodes the query matched
+            radius: Neighborhood radius in hops (default: the longest
+                compiled rule body, so every derivation starting at a
+                seed fits inside the neighborhood)
+            min_confidence: Minimum confidence for derived facts
+            max_facts: Keep only the top-ranked facts
+            max_nodes: Stop growing the neighborhood at this many nodes
+            deadline_ms: Time budget; returns partial results when exceeded
+        
+        Returns:
+            InferenceResult with ranked facts (reached_fixpoint=False if
+            the neighborhood, a radius shorter than a rule body, or the
+            time budget cut the run short)
+        """
+        start_time = time.time()
+        deadline = (
+            time.perf_counter() + deadline_ms / 1000.0
+            if deadline_ms is not None else None
+        )
+        
+        body_length = self.compile_rules().max_body_length
+        if radius is None:
+            radius = body_length
+        
+        distance, truncated = self._neighborhood(seed_node_ids, radius, max_nodes)
+        if not truncated and radius < body_length:
+            # Rule bodies may run past the edge of the neighborhood
+            truncated = self._extends_beyond(distance, radius)
+        winners, rules_applied, complete = self._local_winners(distance, min_confidence, deadline)
+        
+        # Rank by proximity, then confidence; only the kept facts are stored
+        def rank(key: Tuple[int, int, RelationType]) -> Tuple[int, float]:
+            proximity = min(distance[key[0]], distance[key[1]])
+            return (proximity, -winners[key][1])
+        
+        ranked = sorted(winners, key=rank)
+        if max_facts is not None:
+            ranked = ranked[:max_facts]
+        
+        derivations = DerivationGraph(self.graph)
+        for key in ranked:
+            rule_id, confidence, premises = winners[key]
+            derivations.record(key, confidence, rule_id, edge_premises=premises)
+        
+        return InferenceResult(
+            inferred_facts=derivations.facts(),
+            rules_applied=dict(rules_applied),
+            total_iterations=1,
+            time_elapsed=time.time() - start_time,
+            derivations=derivations,
+            reached_fixpoint=complete and not truncated
+        )
     
-    def _apply_chain(
+    def _local_winners(
         self,
-        rule: InferenceRule,
-        min_confidence: float
-    ) -> List[InferredFact]:
-        """Apply custom chain rule (multi-hop)."""
-        if len(rule.antecedent_relations) < 2:
-            return []
+        node_ids: Dict[int, int],
+        min_confidence: float,
+        deadline: Optional[float] = None
+    ) -> Tuple[Dict[Tuple[int, int, RelationType], Tuple[str, float, Tuple[int, ...]]], Dict[str, int], bool]:
+        """
+        Evaluate the compiled plans on the subgraph induced by node_ids.
         
-        # For now, handle 2-hop chains
-        if len(rule.antecedent_relations) == 2:
-            return self._apply_transitivity(rule, min_confidence)
+        Returns:
+            (key -> (rule_id, confidence, premises) of the winning
+            derivation, rules_applied, whether every plan completed)
+        """
+        local = InferenceEngine(
+            _GraphSnapshot.induced(self.graph, list(node_ids)),
+            rules=self.rules,
+            use_equivalence_classes=self.use_equivalence_classes,
+            virtual_inheritance=self.virtual_inheritance
+        )
+        compiled = self.compile_rules()
+        local._compiled = compiled
+        local._compiled_mode = self._compiled_mode
         
-        # TODO: Support longer chains
-        return []
+        rules_applied = defaultdict(int)
+        candidates: Dict[str, List[_Candidate]] = {}
+        complete = True
+        
+        for plan in compiled.plans:
+            plan_candidates, complete = local._evaluate_plan(plan, min_confidence, deadline)
+            candidates.update(plan_candidates)
+            if not complete:
+                break
+        
+        # Merge in rule priority order with the same dedup as infer_all()
+        winners: Dict[Tuple[int, int, RelationType], Tuple[str, float, Tuple[int, ...]]] = {}
+        for rule in compiled.rules:
+            batch = {}
+            for key, confidence, premises in candidates.get(rule.rule_id, ()):
+                if key in winners:
+                    continue
+                rules_applied[rule.rule_id] += 1
+                best = batch.get(key)
+                if best is None or confidence > best[1]:
+                    batch[key] = (rule.rule_id, confidence, premises)
+            winners.update(batch)
+        
+        return winners, rules_applied, complete
+    
+    def _extends_beyond(self, distance: Dict[int, int], radius: int) -> bool:
+        """Whether any node at the edge of a neighborhood has an edge leaving it."""
+        for node_id, hop in distance.items():
+            if hop < radius:
+                continue
+            edges = self.graph.get_outgoing_edges(node_id) + self.graph.get_incoming_edges(node_id)
+            for edge in edges:
+                if edge.source_id not in distance or edge.target_id not in distance:
+                    return True
+        return False
+    
+    def _neighborhood(
+        self,
+        seed_node_ids: List[int],
+        radius: int,
+        max_nodes: Optional[int] = None
+    ) -> Tuple[Dict[int, int], bool]:
+        """
+        Breadth-first k-hop neighborhood, ignoring edge direction.
+        
+        Returns:
+            (node_id -> hop distance in BFS order, whether max_nodes cut it short)
+        """
+        distance: Dict[int, int] = {}
+        for node_id in seed_node_ids:
+            if node_id not in distance and self.graph.has_node(node_id):
+                distance[node_id] = 0
+        
+        frontier = list(distance)
+        for hop in range(1, radius + 1):
+            next_frontier = []
+            for node_id in frontier:
+                edges = self.graph.get_outgoing_edges(node_id) + self.graph.get_incoming_edges(node_id)
+                for edge in edges:
+                    neighbor = edge.target_id if edge.source_id == node_id else edge.source_id
+                    if neighbor in distance:
+                        continue
+                    if max_nodes is not None and len(distance) >= max_nodes:
+                        return distance, True
+                    distance[neighbor] = hop
+                    next_frontier.append(neighbor)
+            frontier = next_frontier
+        
+        return distance, False
+    
+    # ═══════════════════════════════════════════════════════════════════
+    # CLOSURE PERSISTENCE
+    # ═══════════════════════════════════════════════════════════════════
+    
+    CLOSURE_FORMAT = 1
+    
+    # Catch-up touching more of the graph than this recomputes instead
+    CATCH_UP_MAX_FRACTION = 0.5
+    
+    def _set_closure(self, result: InferenceResult, max_iterations: int, min_confidence: float) -> None:
+        """Remember a complete infer_all() result as the current closure."""
+        self._closure = result
+        self._closure_params = (max_iterations, min_confidence)
+        self._closure_key = (self.graph.version, self.rules.fingerprint(), self._mode())
+    
+    def save_closure(self, filepath: str) -> bool:
+        """
+        Persist the derived fact store of the last complete infer_all().
+        
+        The closure is first caught up with the graph, then saved with
+        the graph version, rule fingerprint and run parameters it was
+        computed with, and the base edges it was computed against.
+        
+        Args:
+            filepath: Output file (pickle)
+        
+        Returns:
+            False if no complete closure is loaded (nothing written)
+        """
+        result = self.catch_up()
+        if result is None:
+            return False
+        
+        graph_version, fingerprint, mode = self._closure_key
+        state = {
+            "format": self.CLOSURE_FORMAT,
+            "graph_version": graph_version,
+            "fingerprint": fingerprint,
+            "mode": mode,
+            "params": self._closure_params,
+            "rules_applied": dict(result.rules_applied),
+            "total_iterations": result.total_iterations,
+            "edges": {
+                edge.edge_id: (edge.source_id, edge.target_id, edge.relation_type.value, edge.weight)
+                for edge in self.graph.get_all_edges()
+            },
+            "derivations": self._derivations.to_state(),
+        }
+        with open(filepath, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        return True
+    
+    def load_closure(self, filepath: str) -> Optional[InferenceResult]:
+        """
+        Warm-load a closure saved with save_closure().
+        
+        The saved base edges are compared with the graph's by edge id
+        and contents. If none differ, the fact store is used as is (no
+        joins run); otherwise the closure is caught up around the changed
+        edges (see catch_up()). The graph version alone is not trusted,
+        since a different graph can reach the same mutation count. If the
+        rule set or the engine mode changed, inference is rerun with the
+        saved parameters.
+        
+        Args:
+            filepath: File written by save_closure()
+        
+        Returns:
+            The loaded InferenceResult, or None if the file is missing or
+            in an unknown format
+        """
+        try:
+            with open(filepath, "rb") as f:
+                state = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        if not isinstance(state, dict) or state.get("format") != self.CLOSURE_FORMAT:
+            return None
+        
+        max_iterations, min_confidence = state["params"]
+        if state["fingerprint"] != self.rules.fingerprint() or tuple(state["mode"]) != self._mode():
+            self._stats["closure_rebuilds"] += 1
+            return self.infer_all(max_iterations, min_confidence)
+        
+        self._derivations = DerivationGraph.from_state(self.graph, state["derivations"])
+        self._join_indexes.clear()
+        self._state_key = None
+        
+        result = InferenceResult(
+            inferred_facts=self._derivations.facts(),
+            rules_applied=state["rules_applied"],
+            total_iterations=state["total_iterations"],
+            time_elapsed=0.0,
+            derivations=self._derivations,
+            equivalences=self._equivalences()
+        )
+        self._closure = result
+        self._closure_params = (max_iterations, min_confidence)
+        self._closure_key = (state["graph_version"], state["fingerprint"], self._mode())
+        
+        # Base edges added, removed or changed since the save
+        saved = state["edges"]
+        seeds: Set[int] = set()
+        for edge in self.graph.get_all_edges():
+            signature = saved.pop(edge.edge_id, None)
+            if signature != (edge.source_id, edge.target_id, edge.relation_type.value, edge.weight):
+                seeds.update((edge.source_id, edge.target_id))
+                if signature is not None:
+                    seeds.update(signature[:2])
+        for source_id, target_id, _, _ in saved.values():
+            seeds.update((source_id, target_id))
+        
+        if not seeds:
+            self._stats["closure_warm_loads"] += 1
+            self._closure_key = (self.graph.version, state["fingerprint"], self._mode())
+            self._cache_closure(result)
+            return result
+        
+        return self._catch_up(seeds)
     
-    def _add_inferred_fact(self, fact: InferredFact) -> None:
-        """Add an inferred fact to the cache."""
-        key = (fact.source_id, fact.target_id, fact.relation)
+    def catch_up(self) -> Optional[InferenceResult]:
+        """
+        Bring the current closure up to date with the graph.
+        
+        Uses the graph's change log to find the edges added or removed
+        since the closure was computed and re-derives only the facts
+        around them. Falls back to a full infer_all() with the closure's
+        parameters when the log no longer reaches back, the rules or
+        mode changed, or the change touches too much of the graph.
+        
+        Returns:
+            Up-to-date InferenceResult, or None if no complete
+            infer_all() result is loaded
+        """
+        if self._closure is None:
+            return None
+        
+        graph_version, fingerprint, mode = self._closure_key
+        if fingerprint != self.rules.fingerprint() or mode != self._mode():
+            self._stats["closure_rebuilds"] += 1
+            return self.infer_all(*self._closure_params)
+        if graph_version == self.graph.version:
+            return self._closure
+        
+        changes = self.graph.changes_since(graph_version)
+        if changes is None:
+            self._stats["closure_rebuilds"] += 1
+            return self.infer_all(*self._closure_params)
+        
+        seeds: Set[int] = set()
+        for _, op, item in changes:
+            if op in ("add_edge", "remove_edge"):
+                seeds.update((item.source_id, item.target_id))
+        return self._catch_up(seeds)
+    
+    def _catch_up(self, seeds: Set[int]) -> InferenceResult:
+        """
+        Re-derive the closure around the endpoints of changed edges.
+        
+        Rules only read base edges, and every derivation of a fact is a
+        chain of at most L edges (L = longest rule body) starting or
+        ending at the fact's source. A changed edge can therefore only
+        affect facts with both endpoints within L hops of it, and all
+        derivations of such a fact lie within 2L hops. Those facts are
+        recomputed on the 2L-hop neighborhood; the rest are kept.
+        """
+        start_time = time.time()
+        max_iterations, min_confidence = self._closure_params
+        compiled = self.compile_rules()
+        reach = compiled.max_body_length
+        
+        region, _ = self._neighborhood(list(seeds), reach)
+        scope, _ = self._neighborhood(list(seeds), 2 * reach)
+        if len(scope) > self.CATCH_UP_MAX_FRACTION * max(self.graph.node_count, 1):
+            self._stats["closure_rebuilds"] += 1
+            return self.infer_all(max_iterations, min_confidence)
         
-        # Keep highest confidence version
-        if key in self._inferred:
-            if self._inferred[key].confidence >= fact.confidence:
-                return
+        old = self._derivations
+        stale: Set[int] = set()
+        for node_id in seeds:
+            if node_id in region:
+                continue
+            # Removed node: its facts go with it
+            stale.update(old.node_fact_ids(node_id))
+        for node_id in region:
+            for fact_id in old.node_fact_ids(node_id):
+                source_id, target_id, _ = old.key(fact_id)
+                if source_id in region and target_id in region:
+                    stale.add(fact_id)
+        
+        winners, _, _ = self._local_winners(scope, min_confidence)
+        
+        # Kept facts, then the recomputed ones (earlier results keep their own DAG)
+        self._derivations = old.compact(stale)
+        self._join_indexes.clear()
+        self._state_key = None
+        for key, (rule_id, confidence, premises) in winners.items():
+            if key[0] in region and key[1] in region:
+                self._add_inferred_fact(key, confidence, rule_id, premises)
+        
+        rules_applied: Dict[str, int] = defaultdict(int)
+        for fact_id in range(len(self._derivations)):
+            rules_applied[self._derivations.rule_id(fact_id)] += 1
         
-        self._inferred[key] = fact
-        self._by_node[fact.source_id].add(fact)
-        self._by_node[fact.target_id].add(fact)
-        self._stats["total_inferences"] += 1
+        result = InferenceResult(
+            inferred_facts=self._derivations.facts(),
+            rules_applied=dict(rules_applied),
+            total_iterations=1,
+            time_elapsed=time.time() - start_time,
+            derivations=self._derivations,
+            equivalences=self._equivalences()
+        )
+        self._stats["closure_catch_ups"] += 1
+        self._set_closure(result, max_iterations, min_confidence)
+        self._cache_closure(result)
+        return result
+    
+    def _cache_closure(self, result: InferenceResult) -> None:
+        """Serve the closure from the cache for its run parameters."""
+        if self.cache is not None:
+            cache_key = InferenceCache.make_key(
+                self.graph, self.rules, *self._closure_params, self._mode()
+            )
+            self.cache.put(cache_key, result)
+            self._state_key = cache_key
     
     def can_infer(
         self,
@@ -479,40 +1983,262 @@ class InferenceEngine:
         """
         Check if a relation can be inferred between two nodes.
         
+        Looks at inferred facts, then direct edges. For equivalence
+        relations (symmetric + transitive), membership in the same class
+        counts: a reversed direct edge scores its weight times the
+        symmetry decay, other pairs the most confident path inside the
+        class. For other relations with an enabled transitivity rule,
+        any path of that relation of at most the rule's max_depth hops
+        counts: the relation's ReachabilityIndex rejects unreachable
+        pairs in near-constant time, and the fact is built from the most
+        confident path (confidence decays once per extra hop).
+        
         Returns:
             (can_infer, InferredFact or None)
         """
-        key = (source_id, target_id, relation)
+        fact_id = self._derivations.get_id((source_id, target_id, relation))
         
         # Check cache
-        if key in self._inferred:
-            fact = self._inferred[key]
-            if fact.confidence >= min_confidence:
+        if fact_id is not None:
+            if self._derivations.confidence(fact_id) >= min_confidence:
                 self._stats["cache_hits"] += 1
-                return True, fact
+                return True, self._derivations.fact(fact_id)
         
         # Check direct edge
         if self.graph.has_edge_between(source_id, target_id, relation):
             return True, None
         
+        # Check equivalence class membership
+        equivalence = self._equivalence_rules().get(relation)
+        if equivalence is not None:
+            fact = self._equivalence_fact(source_id, target_id, relation, equivalence)
+            if fact is not None and fact.confidence >= min_confidence:
+                return True, fact
+            return False, None
+        
+        # Check virtual inheritance
+        inherited = self._inherited(source_id, relation).get(target_id)
+        if inherited is not None and inherited[0] >= min_confidence:
+            return True, self._inherited_fact(source_id, target_id, relation, inherited)
+        
+        # Check transitive reachability
+        rule = self._transitive_rule(relation)
+        if (rule is not None and source_id != target_id
+                and ReachabilityIndex.shared(self.graph, relation).reaches(source_id, target_id)):
+            def successors(node_id: int) -> Iterable[GraphEdge]:
+                for edge in self.graph.get_outgoing_edges(node_id):
+                    if edge.relation_type == relation:
+                        yield edge
+            
+            best, labels = self._best_paths(
+                source_id, successors, rule.confidence_decay, rule.max_depth, min_confidence
+            )
+            if target_id in best:
+                path = self._best_chain(target_id, best, labels)
+                return True, InferredFact(
+                    source_id=source_id,
+                    target_id=target_id,
+                    relation=relation,
+                    confidence=best[target_id][0],
+                    rule_id=rule.rule_id,
+                    chain=[(e.source_id, e.relation_type, e.target_id) for e in path],
+                    depth=len(path)
+                )
+        
         return False, None
     
+    def _equivalence_fact(
+        self,
+        source_id: int,
+        target_id: int,
+        relation: RelationType,
+        rules: List[InferenceRule]
+    ) -> Optional[InferredFact]:
+        """Fact for two members of an equivalence class, or None."""
+        if source_id == target_id:
+            return None
+        
+        classes = EquivalenceClasses.shared(self.graph, relation)
+        if not classes.same_class(source_id, target_id):
+            return None
+        
+        direct = self._equivalence_neighbors(source_id, relation)
+        paths = (
+            {} if target_id in direct
+            else self._equivalence_paths(source_id, relation, rules[1].confidence_decay, target_id)
+        )
+        return self._equivalence_path_fact(source_id, target_id, relation, rules, direct, paths)
+    
+    def _equivalence_neighbors(self, node_id: int, relation: RelationType) -> Dict[int, GraphEdge]:
+        """Strongest edge of the relation to each direct neighbor, either direction."""
+        strongest: Dict[int, GraphEdge] = {}
+        for edge in self.graph.get_outgoing_edges(node_id) + self.graph.get_incoming_edges(node_id):
+            if edge.relation_type != relation:
+                continue
+            neighbor = edge.target_id if edge.source_id == node_id else edge.source_id
+            if neighbor != node_id and (neighbor not in strongest or edge.weight > strongest[neighbor].weight):
+                strongest[neighbor] = edge
+        return strongest
+    
+    def _equivalence_paths(
+        self,
+        source_id: int,
+        relation: RelationType,
+        decay: float,
+        target_id: Optional[int] = None
+    ) -> Dict[int, Tuple[float, Optional[GraphEdge]]]:
+        """
+        Most confident paths from a node through its equivalence class.
+        
+        Edges are read as undirected and a path scores the product of
+        edge weight x decay over its edges, so a max-product Dijkstra
+        finds the best one (stops early once target_id is settled).
+        
+        Returns:
+            node -> (score, last edge of its best path)
+        """
+        best: Dict[int, Tuple[float, Optional[GraphEdge]]] = {source_id: (1.0, None)}
+        done: Set[int] = set()
+        heap = [(-1.0, 0, source_id)]
+        sequence = 1
+        
+        while heap:
+            neg_score, _, current = heapq.heappop(heap)
+            if current in done:
+                continue
+            done.add(current)
+            if current == target_id:
+                break
+            
+            for neighbor, edge in self._equivalence_neighbors(current, relation).items():
+                score = -neg_score * edge.weight * decay
+                if neighbor not in done and score > best.get(neighbor, (-1.0, None))[0]:
+                    best[neighbor] = (score, edge)
+                    heapq.heappush(heap, (-score, sequence, neighbor))
+                    sequence += 1
+        
+        return best
+    
+    def _equivalence_path_fact(
+        self,
+        origin: int,
+        other: int,
+        relation: RelationType,
+        rules: List[InferenceRule],
+        direct: Dict[int, GraphEdge],
+        paths: Dict[int, Tuple[float, Optional[GraphEdge]]],
+        reverse: bool = False
+    ) -> Optional[InferredFact]:
+        """
+        Fact between origin and another member of its class.
+        
+        A direct edge (in either direction) scores its weight times the
+        symmetry decay. Otherwise the best path from _equivalence_paths
+        scores its edge weights times the transitivity decay once per
+        hop beyond the first, as for transitive reachability.
+        
+        Args:
+            origin: Node the direct edges and paths were computed from
+            other: The other member
+            relation: Equivalence relation
+            rules: [symmetry rule, transitivity rule]
+            direct: _equivalence_neighbors(origin, relation)
+            paths: _equivalence_paths(origin, ...) (unused for direct neighbors)
+            reverse: Build the fact other -> origin instead
+        """
+        symmetric, transitive = rules
+        edge = direct.get(other)
+        if edge is not None:
+            rule, path = symmetric, [edge]
+            confidence = edge.weight * symmetric.confidence_decay
+        else:
+            if other not in paths:
+                return None
+            rule, path, node = transitive, [], other
+            while node != origin:
+                edge = paths[node][1]
+                path.append(edge)
+                node = edge.target_id if edge.source_id == node else edge.source_id
+            path.reverse()
+            confidence = transitive.confidence_decay ** (len(path) - 1)
+            for edge in path:
+                confidence *= edge.weight
+        
+        if reverse:
+            path.reverse()
+        return InferredFact(
+            source_id=other if reverse else origin,
+            target_id=origin if reverse else other,
+            relation=relation,
+            confidence=confidence,
+            rule_id=rule.rule_id,
+            chain=[(e.source_id, e.relation_type, e.target_id) for e in path],
+            depth=len(path)
+        )
+    
+    def _transitive_rule(self, relation: RelationType) -> Optional[InferenceRule]:
+        """Enabled transitivity rule for a relation, if any (cached per compiled rule set)."""
+        compiled = self.compile_rules()
+        if self._transitive_for is not compiled:
+            self._transitive_rules = {}
+            for rule in compiled.rules:
+                consequent = rule.consequent_relation
+                if (rule.rule_type == RuleType.TRANSITIVITY
+                        and list(rule.antecedent_relations) == [consequent, consequent]):
+                    self._transitive_rules.setdefault(consequent, rule)
+            self._transitive_for = compiled
+        return self._transitive_rules.get(relation)
+    
     def get_inferred_relations(
         self,
         node_id: int,
-        direction: str = "both"
+        direction: str = "both",
+        min_confidence: float = 0.1
     ) -> List[InferredFact]:
         """
         Get all inferred relations for a node.
         
+        Members of the node's equivalence classes are listed as
+        class-level facts, and with virtual_inheritance the node's
+        inherited properties (confidence >= min_confidence) are resolved
+        from its direct parents. Both are built on demand, not stored.
+        
         Args:
             node_id: The node to query
             direction: "outgoing", "incoming", or "both"
+            min_confidence: Threshold for virtual inherited facts
         """
-        facts = self._by_node.get(node_id, set())
+        facts = [self._derivations.fact(fid) for fid in self._derivations.node_fact_ids(node_id)]
+        
+        if direction in ("outgoing", "both"):
+            for relation in self._virtual_relations():
+                for target, entry in self._inherited(node_id, relation).items():
+                    if entry[0] >= min_confidence and (node_id, target, relation) not in self._derivations:
+                        facts.append(self._inherited_fact(node_id, target, relation, entry))
+        if direction in ("incoming", "both"):
+            for source, relation, entry in self._inherited_into(node_id):
+                if entry[0] >= min_confidence and (source, node_id, relation) not in self._derivations:
+                    facts.append(self._inherited_fact(source, node_id, relation, entry))
+        
+        for relation, rules in self._equivalence_rules().items():
+            members = EquivalenceClasses.shared(self.graph, relation).members(node_id)
+            if len(members) < 2:
+                continue
+            # One search from the node serves every member
+            direct = self._equivalence_neighbors(node_id, relation)
+            paths = self._equivalence_paths(node_id, relation, rules[1].confidence_decay)
+            for member in members:
+                if member == node_id:
+                    continue
+                if direction in ("outgoing", "both") and not self.graph.has_edge_between(node_id, member, relation):
+                    facts.append(self._equivalence_path_fact(node_id, member, relation, rules, direct, paths))
+                if direction in ("incoming", "both") and not self.graph.has_edge_between(member, node_id, relation):
+                    facts.append(self._equivalence_path_fact(
+                        node_id, member, relation, rules, direct, paths, reverse=True
+                    ))
         
         if direction == "both":
-            return list(facts)
+            return facts
         elif direction == "outgoing":
             return [f for f in facts if f.source_id == node_id]
         else:
@@ -576,11 +2302,15 @@ class InferenceEngine:
         target_id: int,
         relation: RelationType
     ) -> str:
-        """Get human-readable explanation for an inference."""
-        key = (source_id, target_id, relation)
+        """
+        Get human-readable explanation for an inference.
+        
+        The chain is rebuilt from the derivation graph on demand.
+        """
+        fact_id = self._derivations.get_id((source_id, target_id, relation))
         
-        if key in self._inferred:
-            fact = self._inferred[key]
+        if fact_id is not None:
+            fact = self._derivations.fact(fact_id)
             
             # Get node names
             source = self.graph.get_node(source_id)
@@ -592,7 +2322,7 @@ class InferenceEngine:
             explanation = f"'{source_name}' {relation.value} '{target_name}'\n\n"
             explanation += f"Reasoning:\n"
             
-            for i, (src, rel, tgt) in enumerate(fact.chain):
+            for i, (src, rel, tgt) in enumerate(fact.get_chain()):
                 src_node = self.graph.get_node(src)
                 tgt_node = self.graph.get_node(tgt)
                 src_name = src_node.text if src_node else f"Node({src})"
@@ -610,22 +2340,41 @@ class InferenceEngine:
     def get_stats(self) -> Dict[str, Any]:
         """Get inference statistics."""
         return {
-            "total_inferences": len(self._inferred),
+            "total_inferences": len(self._derivations),
             "cache_hits": self._stats["cache_hits"],
             "rules_fired": dict(self._stats["rules_fired"]),
-            "nodes_with_inferences": len(self._by_node),
+            "closure": {
+                "loaded": self._closure is not None,
+                "graph_version": self._closure_key[0] if self._closure is not None else None,
+                "warm_loads": self._stats["closure_warm_loads"],
+                "catch_ups": self._stats["closure_catch_ups"],
+                "rebuilds": self._stats["closure_rebuilds"],
+            },
+            "nodes_with_inferences": self._derivations.node_count(),
+            "derivations": self._derivations.get_stats(),
+            "virtual_inheritance": {
+                "ancestor_entries": len(self._ancestor_memo),
+                "inherited_entries": len(self._inherited_memo),
+            },
         }
     
     def clear_cache(self) -> None:
         """Clear the inference cache."""
-        self._inferred.clear()
-        self._by_node.clear()
+        self._derivations = DerivationGraph(self.graph)
+        self._join_indexes.clear()
+        self._state_key = None
+        self._closure = None
+        self._ancestor_memo.clear()
+        self._inherited_memo.clear()
         self._stats = {
             "total_inferences": 0,
             "cache_hits": 0,
             "rules_fired": defaultdict(int),
+            "closure_warm_loads": 0,
+            "closure_catch_ups": 0,
+            "closure_rebuilds": 0,
         }
     
     def __repr__(self) -> str:
-        return f"InferenceEngine(inferred={len(self._inferred)}, rules={len(self.rules)})"
+        return f"InferenceEngine(inferred={len(self._derivations)}, rules={len(self.rules)})"
 
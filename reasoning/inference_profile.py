@@ -0,0 +1,227 @@
+"""
+InferenceProfile - EXPLAIN ANALYZE for inference runs.
+
+A profiled run (InferenceEngine.infer_all(profile=True)) records:
+
+- Per join plan: input edge counts per relation, probe edges scanned,
+  join rows produced (fan-out), partial chains pruned, wall time
+- Per rule: candidates emitted, candidates rejected by min_confidence
+  or because the edge already exists in the graph
+- Per rule and iteration: merge wall time, facts produced, candidates
+  rejected as duplicates or by the fact budget
+
+Join work happens once per run (iteration 1); later iterations only
+re-merge candidates, which shows up as duplicate rejections.
+"""
+
+from typing import Dict, Any, List
+from dataclasses import dataclass, field
+from collections import defaultdict
+
+
+@dataclass
+class JoinProfile:
+    """
+    Cost of one join plan.
+    
+    Attributes:
+        shape: Join shape ("single", "two_hop", "chain")
+        relations: Antecedent relations, in chain order
+        rules: Rules evaluated by this join
+        input_edges: relation -> number of edges of that relation
+        scanned_edges: Probe edges scanned
+        join_rows: Rows produced by the join, before any filter
+        pruned: Partial chains dropped by the confidence bound
+        time_ms: Wall time of the join
+        rejected_min_confidence: rule_id -> rows below min_confidence
+        rejected_existing: rule_id -> rows already present as base edges
+    """
+    shape: str
+    relations: List[str]
+    rules: List[str]
+    input_edges: Dict[str, int] = field(default_factory=dict)
+    scanned_edges: int = 0
+    join_rows: int = 0
+    pruned: int = 0
+    time_ms: float = 0.0
+    rejected_min_confidence: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    rejected_existing: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    
+    @property
+    def fan_out(self) -> float:
+        """Join rows per scanned edge."""
+        return self.join_rows / self.scanned_edges if self.scanned_edges else 0.0
+    
+    @property
+    def label(self) -> str:
+        return f"[{self.shape}] " + " ∘ ".join(self.relations)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "shape": self.shape,
+            "relations": self.relations,
+            "rules": self.rules,
+            "input_edges": self.input_edges,
+            "scanned_edges": self.scanned_edges,
+            "join_rows": self.join_rows,
+            "fan_out": self.fan_out,
+            "pruned": self.pruned,
+            "time_ms": self.time_ms,
+            "rejected_min_confidence": dict(self.rejected_min_confidence),
+            "rejected_existing": dict(self.rejected_existing),
+        }
+
+
+@dataclass
+class RuleIterationProfile:
+    """One rule's merge step in one iteration."""
+    iteration: int
+    time_ms: float
+    candidates: int
+    produced: int
+    rejected_duplicate: int
+    rejected_budget: int = 0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "iteration": self.iteration,
+            "time_ms": self.time_ms,
+            "candidates": self.candidates,
+            "produced": self.produced,
+            "rejected_duplicate": self.rejected_duplicate,
+            "rejected_budget": self.rejected_budget,
+        }
+
+
+@dataclass
+class RuleProfile:
+    """
+    Everything one rule cost and produced during a run.
+    
+    Attributes:
+        rule_id: Rule
+        join: Index of the rule's join in InferenceProfile.joins
+            (join time is shared by every rule of that join)
+        candidates: Candidates emitted by the join
+        rejected_min_confidence: Join rows below min_confidence
+        rejected_existing: Join rows already present as base edges
+        iterations: Merge steps, one per iteration the rule ran in
+    """
+    rule_id: str
+    join: int
+    candidates: int = 0
+    rejected_min_confidence: int = 0
+    rejected_existing: int = 0
+    iterations: List[RuleIterationProfile] = field(default_factory=list)
+    
+    @property
+    def produced(self) -> int:
+        return sum(step.produced for step in self.iterations)
+    
+    @property
+    def rejected_duplicate(self) -> int:
+        return sum(step.rejected_duplicate for step in self.iterations)
+    
+    @property
+    def rejected_budget(self) -> int:
+        return sum(step.rejected_budget for step in self.iterations)
+    
+    @property
+    def merge_ms(self) -> float:
+        return sum(step.time_ms for step in self.iterations)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "rule_id": self.rule_id,
+            "join": self.join,
+            "candidates": self.candidates,
+            "produced": self.produced,
+            "rejected_min_confidence": self.rejected_min_confidence,
+            "rejected_existing": self.rejected_existing,
+            "rejected_duplicate": self.rejected_duplicate,
+            "rejected_budget": self.rejected_budget,
+            "merge_ms": self.merge_ms,
+            "iterations": [step.to_dict() for step in self.iterations],
+        }
+
+
+@dataclass
+class InferenceProfile:
+    """
+    Structured profile of one inference run.
+    
+    Example:
+        result = engine.infer_all(profile=True)
+        print(result.profile.report())
+        
+        slowest = max(result.profile.joins, key=lambda j: j.time_ms)
+    """
+    min_confidence: float
+    joins: List[JoinProfile] = field(default_factory=list)
+    rules: Dict[str, RuleProfile] = field(default_factory=dict)
+    iterations: int = 0
+    time_ms: float = 0.0
+    
+    def rule(self, rule_id: str) -> RuleProfile:
+        return self.rules[rule_id]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "min_confidence": self.min_confidence,
+            "iterations": self.iterations,
+            "time_ms": self.time_ms,
+            "joins": [join.to_dict() for join in self.joins],
+            "rules": [rule.to_dict() for rule in self.rules.values()],
+        }
+    
+    def report(self) -> str:
+        """Readable EXPLAIN ANALYZE-style report."""
+        join_ms = sum(join.time_ms for join in self.joins)
+        lines = [
+            f"Inference profile: {self.time_ms:.2f} ms, {self.iterations} iterations, "
+            f"min_confidence={self.min_confidence}",
+            f"Joins ({join_ms:.2f} ms):",
+        ]
+        
+        for join in sorted(self.joins, key=lambda j: -j.time_ms):
+            inputs = ", ".join(f"{rel}={n}" for rel, n in join.input_edges.items())
+            lines.append(
+                f"  {join.label}: {join.time_ms:.2f} ms, scanned={join.scanned_edges}, "
+                f"rows={join.join_rows}, fan-out={join.fan_out:.2f}"
+                + (f", pruned={join.pruned}" if join.pruned else "")
+            )
+            lines.append(f"      inputs: {inputs}")
+            lines.append(f"      rules: {', '.join(join.rules)}")
+        
+        lines.append("Rules:")
+        lines.append(
+            f"  {'rule':<28}{'cand':>8}{'prod':>8}{'<conf':>8}{'exists':>8}"
+            f"{'dup':>8}{'budget':>8}{'merge ms':>10}"
+        )
+        for rule in self.rules.values():
+            lines.append(
+                f"  {rule.rule_id[:27]:<28}{rule.candidates:>8}{rule.produced:>8}"
+                f"{rule.rejected_min_confidence:>8}{rule.rejected_existing:>8}"
+                f"{rule.rejected_duplicate:>8}{rule.rejected_budget:>8}{rule.merge_ms:>10.2f}"
+            )
+        
+        lines.append("Per iteration (rules that produced facts):")
+        for it in range(1, self.iterations + 1):
+            produced = [
+                (rule.rule_id, step)
+                for rule in self.rules.values()
+                for step in rule.iterations
+                if step.iteration == it and step.produced
+            ]
+            total = sum(step.produced for _, step in produced)
+            lines.append(f"  #{it}: {total} facts")
+            for rule_id, step in produced:
+                lines.append(
+                    f"      {rule_id}: +{step.produced} of {step.candidates} "
+                    f"({step.time_ms:.2f} ms)"
+                )
+        
+        return "\n".join(lines)
+    
+    def __str__(self) -> str:
+        return self.report()
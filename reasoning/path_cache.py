@@ -0,0 +1,140 @@
+"""
+PathCache - Reuse path query results across questions.
+
+Popular entities show up in many questions, so reasoners keep asking
+PathFinder for the same pairs. A path result depends only on:
+- The query (kind, endpoints, relation filter, depth limit)
+- The graph's structure (GraphStore.version)
+- The inferred-edge overlay, when it is followed (overlay_version)
+
+The cache keys results on exactly that, so a structural change never
+returns a stale path; old entries simply age out. It is bounded both
+by entry count and by an estimate of its own memory use.
+"""
+
+from typing import Dict, Any, Optional, Tuple
+from collections import OrderedDict
+import weakref
+
+from ..graph import GraphStore
+
+
+PathKey = Tuple[Any, ...]
+
+# Returned by get() when a key is not cached (None is a valid result)
+MISS = object()
+
+
+class PathCache:
+    """
+    Bounded LRU cache of PathFinder results.
+    
+    Caches find_shortest_path, find_best_path and find_common_ancestors,
+    including "no path" answers.
+    
+    Example:
+        cache = PathCache.shared(graph)
+        finder = PathFinder(graph, cache=cache)
+        
+        finder.find_best_path(a, b)     # computed
+        finder.find_best_path(a, b)     # served from cache
+        
+        cache.get_stats()               # hits, misses, evictions, bytes
+    """
+    
+    # One cache per graph
+    _shared: "weakref.WeakKeyDictionary[GraphStore, PathCache]" = weakref.WeakKeyDictionary()
+    
+    # Estimated bytes per entry, and per node/edge reference it holds
+    ENTRY_BYTES = 400
+    REFERENCE_BYTES = 16
+    
+    def __init__(self, max_entries: int = 4096, max_bytes: int = 8 * 1024 * 1024):
+        """
+        Initialize cache.
+        
+        Args:
+            max_entries: Maximum number of results kept (LRU eviction)
+            max_bytes: Memory bound (estimated; nodes and edges are shared
+                with the graph, so only the cache's own containers count)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[PathKey, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+    
+    @classmethod
+    def shared(cls, graph: GraphStore) -> "PathCache":
+        """Get the cache shared by every PathFinder over this graph."""
+        cache = cls._shared.get(graph)
+        if cache is None:
+            cache = cls()
+            cls._shared[graph] = cache
+        return cache
+    
+    @staticmethod
+    def make_key(graph: GraphStore, include_inferred: bool, kind: str, *params: Any) -> PathKey:
+        """Build a cache key for a query against the current graph state."""
+        overlay = graph.overlay_version if include_inferred else None
+        return (id(graph), graph.version, overlay, kind, params)
+    
+    def get(self, key: PathKey) -> Any:
+        """Get a cached result, or MISS."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats["misses"] += 1
+            return MISS
+        
+        self._entries.move_to_end(key)
+        self._stats["hits"] += 1
+        return entry[0]
+    
+    def put(self, key: PathKey, result: Any) -> None:
+        """Store a result (a ReasoningPath, a node list or None)."""
+        size = self._estimate(result)
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old[1]
+        
+        self._entries[key] = (result, size)
+        self._bytes += size
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._bytes -= evicted
+            self._stats["evictions"] += 1
+    
+    def invalidate(self) -> None:
+        """Drop every cached result (e.g. after editing edge weights in place)."""
+        self._entries.clear()
+        self._bytes = 0
+        self._stats["invalidations"] += 1
+    
+    def _estimate(self, result: Any) -> int:
+        if result is None:
+            return self.ENTRY_BYTES
+        if isinstance(result, list):
+            return self.ENTRY_BYTES + self.REFERENCE_BYTES * len(result)
+        references = len(result.nodes) + len(result.edges)
+        return self.ENTRY_BYTES + self.REFERENCE_BYTES * references + len(result.explanation)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+            **self._stats,
+        }
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __repr__(self) -> str:
+        return (
+            f"PathCache(entries={len(self._entries)}, "
+            f"hits={self._stats['hits']}, misses={self._stats['misses']})"
+        )
@@ -5,12 +5,14 @@ Uses graph traversal + tree hierarchy to find
 meaningful paths between concepts.
 """
 
-from typing import Dict, Any, Optional, List, Set
+from typing import Dict, Any, Optional, List, Set, Tuple, Callable, FrozenSet
 from dataclasses import dataclass, field
 from collections import deque
 import heapq
 
-from ..graph import GraphStore, GraphNode, GraphEdge, RelationType
+from ..graph import GraphStore, GraphNode, GraphEdge, RelationType, LandmarkIndex, AncestorIndex
+from ..graph.k_shortest_paths import k_shortest_paths
+from .path_cache import PathCache, MISS
 
 
 @dataclass
@@ -47,8 +49,10 @@ class PathFinder:
     
     Supports:
     - Shortest path (BFS)
-    - Weighted path (Dijkstra)
+    - Weighted path (bidirectional Dijkstra, optional A* / landmarks)
+    - K best loopless paths (Yen)
     - All paths up to max depth
+    - Common / lowest common ancestors (bitset index)
     - Constrained paths (by relation type)
     
     Example:
@@ -62,8 +66,14 @@ class PathFinder:
         
         # Find weighted best path
         path = finder.find_best_path(node1, node2)
+        
+        # Find the 3 best explanations
+        paths = finder.find_k_best_paths(node1, node2, k=3)
     """
     
+    # Landmarks used per A* search (those bounding the endpoints best)
+    ACTIVE_LANDMARKS = 4
+    
     # Relation weights for path scoring (lower = preferred)
     RELATION_WEIGHTS = {
         RelationType.IS_A: 0.5,
@@ -85,14 +95,50 @@ class PathFinder:
         RelationType.DEPENDS_ON: 0.7,
     }
     
-    def __init__(self, graph: GraphStore):
+    def __init__(
+        self,
+        graph: GraphStore,
+        include_inferred: bool = False,
+        landmarks: Optional[LandmarkIndex] = None,
+        cache: Optional[PathCache] = None
+    ):
         """
         Initialize PathFinder.
         
         Args:
             graph: The GraphStore to search in
+            include_inferred: Also follow the graph's inferred-edge overlay
+                (see InferenceEngine.materialize)
+            landmarks: Optional landmark index built with this finder's
+                edge costs (see use_landmarks), used for A* bounds
+            cache: Optional result cache for shortest/best paths and
+                common ancestors (e.g. PathCache.shared(graph))
         """
         self.graph = graph
+        self.include_inferred = include_inferred
+        self.landmarks = landmarks
+        self.cache = cache
+    
+    def use_landmarks(self, num_landmarks: int = 8) -> LandmarkIndex:
+        """
+        Attach a landmark (ALT) index matching this finder's edge costs.
+        
+        find_best_path then runs as bidirectional A* and answers
+        provably disconnected pairs without searching.
+        
+        Args:
+            num_landmarks: Number of landmarks
+        
+        Returns:
+            The index (built lazily, kept in sync with the graph)
+        """
+        self.landmarks = LandmarkIndex(
+            self.graph,
+            num_landmarks=num_landmarks,
+            cost=self._edge_cost,
+            include_inferred=self.include_inferred
+        )
+        return self.landmarks
     
     def find_shortest_path(
         self,
@@ -111,6 +157,28 @@ class PathFinder:
         Returns:
             ReasoningPath or None if no path exists
         """
+        key = None
+        if self.cache is not None:
+            key = self.cache.make_key(
+                self.graph, self.include_inferred, "shortest",
+                source_id, target_id, self._filter_key(relation_types)
+            )
+            cached = self.cache.get(key)
+            if cached is not MISS:
+                return self._copy_path(cached)
+        
+        path = self._find_shortest_path(source_id, target_id, relation_types)
+        if key is not None:
+            self.cache.put(key, self._copy_path(path))
+        return path
+    
+    def _find_shortest_path(
+        self,
+        source_id: int,
+        target_id: int,
+        relation_types: Optional[List[RelationType]] = None
+    ) -> Optional[ReasoningPath]:
+        """BFS behind find_shortest_path (uncached)."""
         if source_id == target_id:
             node = self.graph.get_node(source_id)
             if node:
@@ -125,7 +193,7 @@ class PathFinder:
             current_id, path, edges = queue.popleft()
             
             # Get neighbors via outgoing edges
-            for edge in self.graph.get_outgoing_edges(current_id):
+            for edge in self.graph.get_outgoing_edges(current_id, self.include_inferred):
                 if relation_types and edge.relation_type not in relation_types:
                     continue
                 
@@ -154,7 +222,7 @@ class PathFinder:
                     ))
             
             # Also check incoming edges (bidirectional search)
-            for edge in self.graph.get_incoming_edges(current_id):
+            for edge in self.graph.get_incoming_edges(current_id, self.include_inferred):
                 if relation_types and edge.relation_type not in relation_types:
                     continue
                 
@@ -187,84 +255,227 @@ class PathFinder:
         self,
         source_id: int,
         target_id: int,
-        relation_types: Optional[List[RelationType]] = None
+        relation_types: Optional[List[RelationType]] = None,
+        heuristic: Optional[Callable[[int, int], float]] = None
     ) -> Optional[ReasoningPath]:
         """
-        Find best weighted path using Dijkstra's algorithm.
+        Find best weighted path using bidirectional Dijkstra.
+        
+        Both frontiers keep a distance map and parent pointers, so each
+        node is settled once per side and the path is rebuilt only once,
+        from the node where the searches meet. With a heuristic this
+        becomes bidirectional A* (average potentials).
         
         Args:
             source_id: Starting node ID
             target_id: Target node ID
             relation_types: Allowed relation types (None = all)
+            heuristic: Optional lower bound heuristic(a, b) on the path
+                cost between two nodes; must be admissible and consistent
+                for the result to stay optimal. Defaults to the landmark
+                bound when a landmark index is attached.
             
         Returns:
             ReasoningPath with lowest score
         """
+        key = None
+        if self.cache is not None and heuristic is None:
+            key = self.cache.make_key(
+                self.graph, self.include_inferred, "best",
+                source_id, target_id, self._filter_key(relation_types)
+            )
+            cached = self.cache.get(key)
+            if cached is not MISS:
+                return self._copy_path(cached)
+        
+        path = self._find_best_path(source_id, target_id, relation_types, heuristic)
+        if key is not None:
+            self.cache.put(key, self._copy_path(path))
+        return path
+    
+    def _find_best_path(
+        self,
+        source_id: int,
+        target_id: int,
+        relation_types: Optional[List[RelationType]] = None,
+        heuristic: Optional[Callable[[int, int], float]] = None
+    ) -> Optional[ReasoningPath]:
+        """Bidirectional search behind find_best_path (uncached)."""
         if source_id == target_id:
             node = self.graph.get_node(source_id)
             if node:
                 return ReasoningPath(nodes=[node], edges=[], score=0)
             return None
         
-        # Priority queue: (score, node_id, path, edges)
-        heap = [(0.0, source_id, [source_id], [])]
-        visited = set()
+        if heuristic is None and self.landmarks is not None:
+            if self.landmarks.disconnected(source_id, target_id):
+                return None
+            heuristic = self.landmarks.heuristic(source_id, target_id, self.ACTIVE_LANDMARKS)
+        
+        allowed = frozenset(relation_types) if relation_types else None
+        adjacency: Dict[int, List[Tuple[int, GraphEdge, float]]] = {}
+        
+        potentials: Dict[int, float] = {}
         
-        while heap:
-            score, current_id, path, edges = heapq.heappop(heap)
+        def potential(node_id: int) -> float:
+            # Forward potential; the backward search uses its negation
+            if heuristic is None:
+                return 0.0
+            value = potentials.get(node_id)
+            if value is None:
+                value = (heuristic(node_id, target_id) - heuristic(source_id, node_id)) / 2
+                potentials[node_id] = value
+            return value
+        
+        # Per side (0 = from source, 1 = from target): distance map,
+        # parent pointers (node -> (previous node, edge)), settled set and
+        # a heap of (key, sequence, node) - the sequence number breaks ties
+        # so edges are never compared.
+        dist = ({source_id: 0.0}, {target_id: 0.0})
+        parents: Tuple[Dict[int, Tuple[int, GraphEdge]], ...] = ({}, {})
+        settled: Tuple[Set[int], Set[int]] = (set(), set())
+        heaps = ([(potential(source_id), 0, source_id)], [(-potential(target_id), 1, target_id)])
+        signs = (1.0, -1.0)
+        sequence = 2
+        
+        best = float("inf")
+        meeting = None
+        
+        while heaps[0] and heaps[1]:
+            if heaps[0][0][0] + heaps[1][0][0] >= best:
+                break
             
-            if current_id in visited:
+            side = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+            _, _, current_id = heapq.heappop(heaps[side])
+            if current_id in settled[side]:
                 continue
-            visited.add(current_id)
+            settled[side].add(current_id)
             
-            if current_id == target_id:
-                nodes = [self.graph.get_node(nid) for nid in path]
-                return ReasoningPath(
-                    nodes=[n for n in nodes if n],
-                    edges=edges,
-                    score=score,
-                    explanation=self._generate_explanation(
-                        [n for n in nodes if n], edges
-                    )
-                )
+            own, other = dist[side], dist[1 - side]
+            heap, parent, sign = heaps[side], parents[side], signs[side]
+            score = own[current_id]
             
-            # Explore neighbors via outgoing
-            for edge in self.graph.get_outgoing_edges(current_id):
-                if relation_types and edge.relation_type not in relation_types:
-                    continue
-                
-                neighbor_id = edge.target_id
-                if neighbor_id not in visited:
-                    edge_weight = self.RELATION_WEIGHTS.get(
-                        edge.relation_type, 1.0
-                    ) * edge.weight
-                    
-                    heapq.heappush(heap, (
-                        score + edge_weight,
-                        neighbor_id,
-                        path + [neighbor_id],
-                        edges + [edge]
-                    ))
+            neighbors = adjacency.get(current_id)
+            if neighbors is None:
+                neighbors = adjacency[current_id] = self._weighted_neighbors(current_id, allowed)
             
-            # Also check incoming
-            for edge in self.graph.get_incoming_edges(current_id):
-                if relation_types and edge.relation_type not in relation_types:
-                    continue
-                
-                neighbor_id = edge.source_id
-                if neighbor_id not in visited:
-                    edge_weight = self.RELATION_WEIGHTS.get(
-                        edge.relation_type, 1.0
-                    ) * edge.weight
+            for neighbor_id, edge, edge_weight in neighbors:
+                new_score = score + edge_weight
+                if new_score < own.get(neighbor_id, float("inf")):
+                    own[neighbor_id] = new_score
+                    parent[neighbor_id] = (current_id, edge)
+                    heapq.heappush(heap, (new_score + sign * potential(neighbor_id), sequence, neighbor_id))
+                    sequence += 1
                     
-                    heapq.heappush(heap, (
-                        score + edge_weight,
-                        neighbor_id,
-                        path + [neighbor_id],
-                        edges + [edge]
-                    ))
+                    if neighbor_id in other and new_score + other[neighbor_id] < best:
+                        best = new_score + other[neighbor_id]
+                        meeting = neighbor_id
         
-        return None
+        if meeting is None:
+            return None
+        
+        # Walk the parent pointers out from the meeting node
+        path = [meeting]
+        edges: List[GraphEdge] = []
+        node_id = meeting
+        while node_id in parents[0]:
+            node_id, edge = parents[0][node_id]
+            path.append(node_id)
+            edges.append(edge)
+        path.reverse()
+        edges.reverse()
+        
+        node_id = meeting
+        while node_id in parents[1]:
+            node_id, edge = parents[1][node_id]
+            path.append(node_id)
+            edges.append(edge)
+        
+        # Summed in path order, as a one-directional search would
+        score = 0.0
+        for edge in edges:
+            score += self._edge_cost(edge)
+        
+        nodes = [self.graph.get_node(nid) for nid in path]
+        return ReasoningPath(
+            nodes=[n for n in nodes if n],
+            edges=edges,
+            score=score,
+            explanation=self._generate_explanation(
+                [n for n in nodes if n], edges
+            )
+        )
+    
+    def _edge_cost(self, edge: GraphEdge) -> float:
+        """Cost of traversing an edge (relation weight x edge weight)."""
+        return self.RELATION_WEIGHTS.get(edge.relation_type, 1.0) * edge.weight
+    
+    def _weighted_neighbors(
+        self,
+        node_id: int,
+        allowed: Optional[FrozenSet[RelationType]] = None
+    ) -> List[Tuple[int, GraphEdge, float]]:
+        """
+        Adjacency lookup for weighted search, edges read in both directions.
+        
+        Args:
+            node_id: Node to expand
+            allowed: Allowed relation types (None = all)
+        
+        Returns:
+            [(neighbor_id, edge, cost), ...], outgoing edges first
+        """
+        neighbors = []
+        for edge in self.graph.get_outgoing_edges(node_id, self.include_inferred):
+            if allowed is None or edge.relation_type in allowed:
+                neighbors.append((edge.target_id, edge, self._edge_cost(edge)))
+        for edge in self.graph.get_incoming_edges(node_id, self.include_inferred):
+            if allowed is None or edge.relation_type in allowed:
+                neighbors.append((edge.source_id, edge, self._edge_cost(edge)))
+        return neighbors
+    
+    def find_k_best_paths(
+        self,
+        source_id: int,
+        target_id: int,
+        k: int = 5,
+        relation_types: Optional[List[RelationType]] = None
+    ) -> List[ReasoningPath]:
+        """
+        Find the k best loopless weighted paths (Yen's algorithm).
+        
+        Uses the same edge costs as find_best_path, whose result is the
+        first path returned. Runs at most k * (path length) shortest-path
+        searches instead of enumerating every path.
+        
+        Args:
+            source_id: Starting node ID
+            target_id: Target node ID
+            k: Number of paths wanted
+            relation_types: Allowed relation types (None = all)
+            
+        Returns:
+            Up to k ReasoningPaths, best (lowest score) first
+        """
+        allowed = frozenset(relation_types) if relation_types else None
+        found = k_shortest_paths(
+            source_id, target_id, k,
+            lambda node_id: self._weighted_neighbors(node_id, allowed)
+        )
+        
+        paths = []
+        for scored in found:
+            nodes = [self.graph.get_node(nid) for nid in scored.nodes]
+            valid_nodes = [n for n in nodes if n]
+            if not valid_nodes:
+                continue
+            paths.append(ReasoningPath(
+                nodes=valid_nodes,
+                edges=scored.edges,
+                score=scored.cost,
+                explanation=self._generate_explanation(valid_nodes, scored.edges)
+            ))
+        return paths
     
     def find_all_paths(
         self,
@@ -276,6 +487,9 @@ class PathFinder:
         """
         Find all paths up to max_depth.
         
+        Enumerates every simple path, which is exponential on dense
+        graphs; prefer find_k_best_paths when only the best few are needed.
+        
         Args:
             source_id: Starting node ID
             target_id: Target node ID
@@ -314,7 +528,7 @@ class PathFinder:
                 return
             
             # Explore outgoing
-            for edge in self.graph.get_outgoing_edges(current_id):
+            for edge in self.graph.get_outgoing_edges(current_id, self.include_inferred):
                 if relation_types and edge.relation_type not in relation_types:
                     continue
                 
@@ -331,7 +545,7 @@ class PathFinder:
                     visited.remove(neighbor_id)
             
             # Explore incoming
-            for edge in self.graph.get_incoming_edges(current_id):
+            for edge in self.graph.get_incoming_edges(current_id, self.include_inferred):
                 if relation_types and edge.relation_type not in relation_types:
                     continue
                 
@@ -363,9 +577,36 @@ class PathFinder:
         
         Useful for finding shared concepts/categories.
         """
+        key = None
+        if self.cache is not None:
+            key = self.cache.make_key(
+                self.graph, self.include_inferred, "ancestors",
+                tuple(node_ids), max_depth
+            )
+            cached = self.cache.get(key)
+            if cached is not MISS:
+                return list(cached)
+        
+        ancestors = self._find_common_ancestors(node_ids, max_depth)
+        if key is not None:
+            self.cache.put(key, list(ancestors))
+        return ancestors
+    
+    def _find_common_ancestors(
+        self,
+        node_ids: List[int],
+        max_depth: int = 5
+    ) -> List[GraphNode]:
+        """Ancestor lookup behind find_common_ancestors (uncached)."""
         if not node_ids:
             return []
         
+        # The bitset index is exact whenever the depth limit cannot bind
+        index = AncestorIndex.shared(self.graph, include_inferred=self.include_inferred)
+        if all(index.height_bound(nid) <= max_depth + 1 for nid in node_ids):
+            nodes = (self.graph.get_node(nid) for nid in index.common_ancestors(node_ids))
+            return [node for node in nodes if node]
+        
         # Get ancestors for each node
         ancestors_sets = []
         
@@ -381,7 +622,7 @@ class PathFinder:
                 visited.add(current_id)
                 
                 # Look for IS_A and PART_OF relations going up
-                for edge in self.graph.get_outgoing_edges(current_id):
+                for edge in self.graph.get_outgoing_edges(current_id, self.include_inferred):
                     if edge.relation_type in [RelationType.IS_A, RelationType.PART_OF]:
                         ancestors.add(edge.target_id)
                         queue.append((edge.target_id, depth + 1))
@@ -402,6 +643,44 @@ class PathFinder:
             if self.graph.get_node(nid)
         ]
     
+    def find_lowest_common_ancestors(self, node_ids: List[int]) -> List[GraphNode]:
+        """
+        Find the most specific categories shared by all nodes.
+        
+        Follows IS_A and PART_OF without a depth limit, using the shared
+        ancestor bitset index.
+        
+        Args:
+            node_ids: Nodes to summarize (any number)
+        
+        Returns:
+            Lowest common ancestors (several with multiple inheritance)
+        """
+        if not node_ids:
+            return []
+        index = AncestorIndex.shared(self.graph, include_inferred=self.include_inferred)
+        nodes = (self.graph.get_node(nid) for nid in index.lowest_common_ancestors(node_ids))
+        return [node for node in nodes if node]
+    
+    @staticmethod
+    def _filter_key(relation_types: Optional[List[RelationType]]) -> Optional[Tuple[str, ...]]:
+        """Hashable, order-independent form of a relation filter."""
+        if not relation_types:
+            return None
+        return tuple(sorted({rt.value for rt in relation_types}))
+    
+    @staticmethod
+    def _copy_path(path: Optional[ReasoningPath]) -> Optional[ReasoningPath]:
+        """Copy of a path, so cached results are never shared with callers."""
+        if path is None:
+            return None
+        return ReasoningPath(
+            nodes=list(path.nodes),
+            edges=list(path.edges),
+            score=path.score,
+            explanation=path.explanation
+        )
+    
     def _generate_explanation(
         self,
         nodes: List[GraphNode],
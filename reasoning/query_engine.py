@@ -124,7 +124,8 @@ class QueryEngine:
         uid: str,
         relation_type: Optional[RelationType] = None,
         direction: str = "both",
-        limit: int = 10
+        limit: int = 10,
+        include_inferred: bool = False
     ) -> QueryResult:
         """
         Find objects related to a given object.
@@ -134,6 +135,7 @@ class QueryEngine:
             relation_type: Filter by relation type
             direction: "outgoing", "incoming", or "both"
             limit: Maximum results
+            include_inferred: Also follow the graph's inferred-edge overlay
             
         Returns:
             QueryResult with related objects
@@ -156,11 +158,11 @@ class QueryEngine:
         
         # Get outgoing relations
         if direction in ["outgoing", "both"]:
-            for edge in self.memory.graph.get_edges_from(obj.graph_node_id):
+            for edge in self.memory.graph.get_outgoing_edges(obj.graph_node_id, include_inferred):
                 if relation_type and edge.relation_type != relation_type:
                     continue
                 
-                target_node = self.memory.graph.get_node(edge.to_id)
+                target_node = self.memory.graph.get_node(edge.target_id)
                 if target_node:
                     target_uid = target_node.properties.get("memory_uid")
                     if target_uid and target_uid not in seen_uids:
@@ -171,11 +173,11 @@ class QueryEngine:
         
         # Get incoming relations
         if direction in ["incoming", "both"]:
-            for edge in self.memory.graph.get_edges_to(obj.graph_node_id):
+            for edge in self.memory.graph.get_incoming_edges(obj.graph_node_id, include_inferred):
                 if relation_type and edge.relation_type != relation_type:
                     continue
                 
-                source_node = self.memory.graph.get_node(edge.from_id)
+                source_node = self.memory.graph.get_node(edge.source_id)
                 if source_node:
                     source_uid = source_node.properties.get("memory_uid")
                     if source_uid and source_uid not in seen_uids:
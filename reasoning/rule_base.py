@@ -11,6 +11,8 @@ Each rule has:
 from typing import Dict, Any, List, Optional, Callable, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+import hashlib
+import json
 
 from ..graph import RelationType
 
@@ -102,10 +104,16 @@ class RuleBase:
         
         # Get rules that involve IS_A
         is_a_rules = rules.get_rules_for_relation(RelationType.IS_A)
+        
+        # RELATED_TO as an equivalence (symmetric + transitive)
+        rules.add_equivalence_rules(RelationType.RELATED_TO)
     """
     
     def __init__(self):
         self.rules: Dict[str, InferenceRule] = {}
+        
+        # Last fingerprint and the rule state it was computed from
+        self._fingerprint: Optional[Tuple[Tuple[Any, ...], str]] = None
     
     def add_rule(self, rule: InferenceRule) -> None:
         """Add a rule to the base."""
@@ -138,11 +146,99 @@ class RuleBase:
                 result.append(rule)
         return result
     
+    def get_equivalence_relations(self) -> Dict[RelationType, List[InferenceRule]]:
+        """
+        Relations that are both symmetric and transitive under the enabled rules.
+        
+        Returns:
+            relation -> [symmetry rule, transitivity rule]
+        """
+        symmetric = {}
+        for rule in self.get_rules_by_type(RuleType.SYMMETRY):
+            if len(rule.antecedent_relations) == 1:
+                symmetric.setdefault(rule.antecedent_relations[0], rule)
+        
+        result = {}
+        for rule in self.get_rules_by_type(RuleType.TRANSITIVITY):
+            relation = rule.consequent_relation
+            if (relation in symmetric and relation not in result
+                    and list(rule.antecedent_relations) == [relation, relation]):
+                result[relation] = [symmetric[relation], rule]
+        return result
+    
+    def add_equivalence_rules(
+        self,
+        relation: RelationType,
+        confidence_decay: float = 0.9,
+        priority: int = 90
+    ) -> List[InferenceRule]:
+        """
+        Make a relation symmetric and transitive.
+        
+        Adds symmetric_<relation> (unless present) and
+        transitive_<relation>. The InferenceEngine then keeps the
+        relation as equivalence classes instead of pairwise facts.
+        
+        Returns:
+            [symmetry rule, transitivity rule]
+        """
+        name = relation.value
+        symmetry = self.rules.get(f"symmetric_{name}")
+        if symmetry is None:
+            symmetry = InferenceRule(
+                rule_id=f"symmetric_{name}",
+                rule_type=RuleType.SYMMETRY,
+                name=f"Symmetric {name.upper()}",
+                description=f"If A {name.upper()} B, then B {name.upper()} A",
+                antecedent_relations=[relation],
+                consequent_relation=relation,
+                confidence_decay=1.0,
+                priority=priority
+            )
+            self.add_rule(symmetry)
+        
+        transitivity = InferenceRule(
+            rule_id=f"transitive_{name}",
+            rule_type=RuleType.TRANSITIVITY,
+            name=f"Transitive {name.upper()}",
+            description=f"If A {name.upper()} B and B {name.upper()} C, then A {name.upper()} C",
+            antecedent_relations=[relation, relation],
+            consequent_relation=relation,
+            confidence_decay=confidence_decay,
+            priority=priority
+        )
+        self.add_rule(transitivity)
+        return [symmetry, transitivity]
+    
     def get_all_enabled_rules(self) -> List[InferenceRule]:
         """Get all enabled rules, sorted by priority (highest first)."""
         enabled = [r for r in self.rules.values() if r.enabled]
         return sorted(enabled, key=lambda r: -r.priority)
     
+    def fingerprint(self) -> str:
+        """
+        Stable digest of the enabled rule set.
+        
+        Changes whenever a rule is added, removed, enabled/disabled or
+        edited, so it can key caches of inference results. The digest is
+        recomputed only when the rules' fields changed since the last call.
+        """
+        state = tuple(
+            tuple(tuple(v) if isinstance(v, list) else v for v in vars(rule).values())
+            for rule in self.rules.values()
+        )
+        cached = getattr(self, "_fingerprint", None)
+        if cached is not None and cached[0] == state:
+            return cached[1]
+        
+        payload = json.dumps(
+            [r.to_dict() for r in sorted(self.get_all_enabled_rules(), key=lambda r: r.rule_id)],
+            sort_keys=True
+        )
+        digest = hashlib.sha1(payload.encode("utf-8")).hexdigest()
+        self._fingerprint = (state, digest)
+        return digest
+    
     def add_builtin_rules(self) -> None:
         """Add all built-in inference rules."""
         
@@ -412,6 +508,13 @@ class RuleBase:
                 RelationType.CAUSES,
                 confidence_decay=0.7
             )
+            
+            # Chains may have any length (joined from the rarest relation)
+            rule = rules.create_custom_rule(
+                "uses_enables_cause_chain",
+                [RelationType.USES, RelationType.ENABLES, RelationType.CAUSES],
+                RelationType.CAUSES
+            )
         """
         rule = InferenceRule(
             rule_id=rule_id,
@@ -0,0 +1,192 @@
+"""
+RuleCompiler - Compile a RuleBase into join plans.
+
+Instead of dispatching every rule separately, rules are grouped by
+the shape of the join they need:
+
+- SINGLE:  R(A,B) ⟹ R'(B,A)                  (inverse, symmetry)
+- TWO_HOP: R1(A,B), R2(B,C) ⟹ R'(A,C)         (transitivity, composition,
+                                               inheritance, 2-hop chains)
+- CHAIN:   R1(A,B), ..., Rn(Y,Z) ⟹ R'(A,Z)    (custom N-hop chains)
+
+Rules with the same shape and antecedent relations form one JoinPlan
+and are evaluated together from a single join. Plans are dispatched
+by the relation they scan, so every relation is scanned once per run
+no matter how many rules consume it.
+"""
+
+from typing import Dict, Any, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
+from enum import Enum
+
+from ..graph import RelationType
+from .rule_base import RuleBase, InferenceRule, RuleType
+
+
+class JoinShape(Enum):
+    """Join shapes a rule can compile to."""
+    SINGLE = "single"       # One edge, reversed
+    TWO_HOP = "two_hop"     # Hash join on the middle node
+    CHAIN = "chain"         # Pipelined N-way join
+
+
+# Rule types that derive facts, and the join each one needs
+RULE_SHAPES = {
+    RuleType.INVERSE: JoinShape.SINGLE,
+    RuleType.SYMMETRY: JoinShape.SINGLE,
+    RuleType.TRANSITIVITY: JoinShape.TWO_HOP,
+    RuleType.COMPOSITION: JoinShape.TWO_HOP,
+    RuleType.INHERITANCE: JoinShape.TWO_HOP,
+    RuleType.CHAIN: JoinShape.CHAIN,
+}
+
+
+@dataclass
+class JoinPlan:
+    """
+    One join shared by every rule with the same shape and antecedents.
+    
+    Attributes:
+        shape: Join shape
+        relations: Antecedent relations, in chain order
+        rules: Rules evaluated by this join (priority order)
+        consequents: Relation each rule derives (parallel to rules)
+    """
+    shape: JoinShape
+    relations: Tuple[RelationType, ...]
+    rules: List[InferenceRule] = field(default_factory=list)
+    consequents: List[RelationType] = field(default_factory=list)
+    
+    @property
+    def scan_relation(self) -> RelationType:
+        """Relation whose edges drive the join (chains pick a pivot at run time)."""
+        return self.relations[0]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "shape": self.shape.value,
+            "relations": [r.value for r in self.relations],
+            "rules": [r.rule_id for r in self.rules],
+            "consequents": [r.value for r in self.consequents],
+        }
+
+
+@dataclass
+class CompiledRuleSet:
+    """
+    A RuleBase compiled into join plans.
+    
+    Attributes:
+        rules: Derivation rules in priority order (the merge order)
+        plans: Join plans
+        fingerprint: RuleBase.fingerprint() at compile time
+    """
+    rules: List[InferenceRule]
+    plans: List[JoinPlan]
+    fingerprint: str
+    
+    @property
+    def max_body_length(self) -> int:
+        """Edges in the longest rule body (how far one derivation reaches)."""
+        return max((len(rule.antecedent_relations) for rule in self.rules), default=1)
+    
+    def dispatch_table(self) -> Dict[RelationType, List[JoinPlan]]:
+        """Static plans grouped by the relation they scan."""
+        table: Dict[RelationType, List[JoinPlan]] = {}
+        for plan in self.plans:
+            if plan.shape != JoinShape.CHAIN:
+                table.setdefault(plan.scan_relation, []).append(plan)
+        return table
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "rules": [r.rule_id for r in self.rules],
+            "plans": [p.to_dict() for p in self.plans],
+        }
+    
+    def explain(self) -> str:
+        """Readable listing of the plans."""
+        lines = [f"Compiled rule set ({len(self.rules)} rules, {len(self.plans)} joins)"]
+        for plan in self.plans:
+            chain = " ∘ ".join(r.value for r in plan.relations)
+            rules = ", ".join(r.rule_id for r in plan.rules)
+            lines.append(f"  [{plan.shape.value}] {chain}: {rules}")
+        return "\n".join(lines)
+
+
+class RuleCompiler:
+    """
+    Compile rules into shared join plans.
+    
+    Example:
+        compiled = RuleCompiler.compile(rules)
+        print(compiled.explain())
+        
+        # Rules scanning IS_A edges
+        plans = compiled.dispatch_table()[RelationType.IS_A]
+    """
+    
+    @staticmethod
+    def shape_of(rule: InferenceRule) -> Optional[JoinShape]:
+        """Join shape for a rule, or None if it derives nothing."""
+        if rule.consequent_relation is None and rule.rule_type != RuleType.SYMMETRY:
+            return None
+        
+        shape = RULE_SHAPES.get(rule.rule_type)
+        arity = len(rule.antecedent_relations)
+        
+        if shape == JoinShape.SINGLE:
+            return shape if arity == 1 else None
+        if shape == JoinShape.TWO_HOP:
+            return shape if arity == 2 else None
+        if shape == JoinShape.CHAIN:
+            if arity == 2:
+                return JoinShape.TWO_HOP
+            return shape if arity > 2 else None
+        return None
+    
+    @staticmethod
+    def consequent_of(rule: InferenceRule) -> RelationType:
+        """Relation a rule derives (symmetry re-derives its own relation)."""
+        if rule.rule_type == RuleType.SYMMETRY:
+            return rule.antecedent_relations[0]
+        return rule.consequent_relation
+    
+    @classmethod
+    def compile(cls, rules: RuleBase, exclude: Optional[Set[str]] = None) -> CompiledRuleSet:
+        """
+        Compile the enabled rules of a RuleBase.
+        
+        Args:
+            rules: RuleBase to compile
+            exclude: Rule ids handled elsewhere (left out of the plans)
+        
+        Returns:
+            CompiledRuleSet
+        """
+        derivation_rules = []
+        plans: Dict[Tuple[JoinShape, Tuple[RelationType, ...]], JoinPlan] = {}
+        
+        for rule in rules.get_all_enabled_rules():
+            if exclude and rule.rule_id in exclude:
+                continue
+            shape = cls.shape_of(rule)
+            if shape is None:
+                continue
+            
+            derivation_rules.append(rule)
+            relations = tuple(rule.antecedent_relations)
+            plan = plans.get((shape, relations))
+            if plan is None:
+                plan = JoinPlan(shape=shape, relations=relations)
+                plans[(shape, relations)] = plan
+            
+            plan.rules.append(rule)
+            plan.consequents.append(cls.consequent_of(rule))
+        
+        return CompiledRuleSet(
+            rules=derivation_rules,
+            plans=list(plans.values()),
+            fingerprint=rules.fingerprint()
+        )
@@ -19,6 +19,8 @@ import time
 from ..graph import GraphStore, GraphNode, RelationType
 from ..trees import TreeStore
 from ..memory import UnifiedMemory, MemoryObject
+from .inference_cache import InferenceCache
+from .path_cache import PathCache
 from .inference_engine import InferenceEngine
 from .path_finder import PathFinder
 from .query_engine import QueryEngine
@@ -159,12 +161,15 @@ class SanTOKReasoner:
         self.memory = memory
         
         # Core reasoning components (all SanTOK-native)
-        self.inference_engine = InferenceEngine(memory.graph)
+        self.inference_engine = InferenceEngine(
+            memory.graph,
+            cache=InferenceCache.shared(memory)
+        )
         self.inference_engine.rules.add_builtin_rules()
         
-        self.path_finder = PathFinder(memory.graph)
+        self.path_finder = PathFinder(memory.graph, cache=PathCache.shared(memory.graph))
         self.query_engine = QueryEngine(memory)
-        self.contradiction_detector = ContradictionDetector(memory.graph)
+        self.contradiction_detector = ContradictionDetector.shared(memory.graph)
         
         # SanTOK-native verbalizer (NO GPT)
         self.verbalizer = SanTOKVerbalizer(memory)
@@ -299,7 +304,7 @@ class SanTOKReasoner:
         
         # 5. Check contradictions
         if self.config["check_contradictions"]:
-            report = self.contradiction_detector.detect_all()
+            report = self.contradiction_detector.detect_incremental()
             for cont in report.contradictions[:3]:
                 knowledge.contradictions.append({
                     "type": cont.contradiction_type.value,
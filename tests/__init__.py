@@ -0,0 +1,6 @@
+"""
+SanTOK Cognitive - Regression checks.
+
+Run from the repository root with:
+    python -m unittest discover -s tests -t ..
+"""
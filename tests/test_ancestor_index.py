@@ -0,0 +1,127 @@
+"""
+Tests for AncestorIndex.
+"""
+
+import random
+import unittest
+
+from ..graph import GraphStore, GraphNode, RelationType, AncestorIndex
+from ..reasoning import PathFinder
+
+
+NODES = 30
+
+
+def random_hierarchy(seed: int, edges: int = 45, cycles: int = 2) -> GraphStore:
+    """Mostly child -> parent edges (towards lower ids), plus a few back edges."""
+    rnd = random.Random(seed)
+    graph = GraphStore()
+    for node_id in range(NODES):
+        graph.add_node(GraphNode(node_id=node_id, text=f"node {node_id}"))
+    for _ in range(edges):
+        child, parent = sorted(rnd.sample(range(NODES), 2), reverse=True)
+        graph.add_edge(child, parent, rnd.choice([RelationType.IS_A, RelationType.PART_OF, RelationType.RELATED_TO]))
+    for _ in range(cycles):
+        parent, child = sorted(rnd.sample(range(NODES), 2), reverse=True)
+        graph.add_edge(child, parent, RelationType.IS_A)
+    return graph
+
+
+def brute_force_ancestors(graph: GraphStore, node_id: int) -> dict:
+    """Ancestor -> hop distance, by BFS up IS_A / PART_OF edges."""
+    distance = {}
+    frontier = [node_id]
+    hops = 0
+    while frontier:
+        hops += 1
+        next_frontier = []
+        for current in frontier:
+            for edge in graph.get_outgoing_edges(current):
+                if edge.relation_type in (RelationType.IS_A, RelationType.PART_OF) and edge.target_id not in distance:
+                    distance[edge.target_id] = hops
+                    next_frontier.append(edge.target_id)
+        frontier = next_frontier
+    return distance
+
+
+class TestAncestorIndex(unittest.TestCase):
+    """Index answers must match BFS, including after edits."""
+    
+    def _assert_matches(self, graph: GraphStore, index: AncestorIndex) -> None:
+        ancestors = {node_id: brute_force_ancestors(graph, node_id) for node_id in range(NODES)}
+        for node_id in range(NODES):
+            self.assertEqual(sorted(index.ancestors(node_id)), sorted(ancestors[node_id]), node_id)
+            self.assertGreaterEqual(index.height_bound(node_id), max(ancestors[node_id].values(), default=0))
+        
+        rnd = random.Random(len(ancestors))
+        for _ in range(25):
+            group = rnd.sample(range(NODES), rnd.randint(2, 4))
+            common = set.intersection(*(set(ancestors[n]) for n in group))
+            self.assertEqual(sorted(index.common_ancestors(group)), sorted(common), group)
+            lowest = {
+                c for c in common
+                if all(c not in ancestors[d] or d in ancestors[c] for d in common if d != c)
+            }
+            self.assertEqual(sorted(index.lowest_common_ancestors(group)), sorted(lowest), group)
+    
+    def test_matches_bfs(self):
+        for seed in range(4):
+            graph = random_hierarchy(seed)
+            self._assert_matches(graph, AncestorIndex(graph))
+    
+    def test_incremental_inserts(self):
+        rnd = random.Random(5)
+        graph = random_hierarchy(5, cycles=0)
+        index = AncestorIndex(graph)
+        index.ancestors(0)
+        for _ in range(15):
+            child, parent = sorted(rnd.sample(range(NODES), 2), reverse=True)
+            graph.add_edge(child, parent, RelationType.IS_A)
+            self._assert_matches(graph, index)
+        self.assertGreater(index.get_stats()["incremental_inserts"], 0)
+    
+    def test_removals_and_cycles(self):
+        rnd = random.Random(6)
+        graph = random_hierarchy(6)
+        index = AncestorIndex(graph)
+        self._assert_matches(graph, index)
+        for _ in range(6):
+            graph.remove_edge(rnd.choice(graph.get_all_edges()).edge_id)
+            parent, child = sorted(rnd.sample(range(NODES), 2), reverse=True)
+            graph.add_edge(child, parent, RelationType.PART_OF)
+            self._assert_matches(graph, index)
+    
+    def test_is_ancestor(self):
+        graph = random_hierarchy(7)
+        index = AncestorIndex(graph)
+        for node_id in range(NODES):
+            ancestors = brute_force_ancestors(graph, node_id)
+            for other in range(NODES):
+                self.assertEqual(index.is_ancestor(other, node_id), other in ancestors)
+    
+    def test_path_finder_depth_limit(self):
+        graph = random_hierarchy(9)
+        finder = PathFinder(graph)
+        ancestors = {node_id: brute_force_ancestors(graph, node_id) for node_id in range(NODES)}
+        rnd = random.Random(9)
+        for max_depth in (0, 1, 2, 10):
+            for _ in range(15):
+                group = rnd.sample(range(NODES), 2)
+                # The walk stops expanding past max_depth, so ancestors up to max_depth + 1 hops count
+                expected = set.intersection(*(
+                    {a for a, hops in ancestors[n].items() if hops <= max_depth + 1} for n in group
+                ))
+                found = {node.node_id for node in finder.find_common_ancestors(group, max_depth=max_depth)}
+                self.assertEqual(found, expected, (max_depth, group))
+    
+    
+    def test_shared_per_relation_set(self):
+        graph = random_hierarchy(8)
+        index = AncestorIndex.shared(graph)
+        self.assertIs(AncestorIndex.shared(graph), index)
+        self.assertIsNot(AncestorIndex.shared(graph, include_inferred=True), index)
+        self.assertIsNot(AncestorIndex.shared(graph, [RelationType.IS_A]), index)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+Tests for closure persistence and catch-up.
+"""
+
+import os
+import random
+import tempfile
+import unittest
+
+from ..graph import GraphStore, GraphNode, RelationType
+from ..reasoning import InferenceEngine
+from ..integration import CognitivePipeline
+
+
+RELATIONS = [RelationType.IS_A, RelationType.PART_OF, RelationType.CAUSES, RelationType.HAS_PART]
+
+
+def random_graph(seed: int, nodes: int = 12, edges: int = 24) -> GraphStore:
+    """Random graph over nodes 1..nodes with builtin-rule relations."""
+    rng = random.Random(seed)
+    graph = GraphStore()
+    for node_id in range(1, nodes + 1):
+        graph.add_node(GraphNode(node_id=node_id, text=f"node {node_id}"))
+    for _ in range(edges):
+        source, target = rng.sample(range(1, nodes + 1), 2)
+        graph.add_edge(source, target, rng.choice(RELATIONS), weight=round(rng.uniform(0.5, 1.0), 2))
+    return graph
+
+
+def make_engine(graph: GraphStore) -> InferenceEngine:
+    engine = InferenceEngine(graph)
+    engine.rules.add_builtin_rules()
+    return engine
+
+
+def fact_map(result):
+    """(source, target, relation) -> confidence for a result's facts."""
+    return {
+        (fact.source_id, fact.target_id, fact.relation): round(fact.confidence, 9)
+        for fact in result.inferred_facts
+    }
+
+
+class TestClosurePersistence(unittest.TestCase):
+    """save_closure()/load_closure() must agree with a fresh infer_all()."""
+    
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".pkl")
+        os.close(handle)
+    
+    def tearDown(self):
+        os.remove(self.path)
+    
+    def test_round_trip_warm_loads(self):
+        graph = random_graph(1)
+        expected = fact_map(make_engine(graph).infer_all())
+        saver = make_engine(graph)
+        saver.infer_all()
+        self.assertTrue(saver.save_closure(self.path))
+        
+        loader = make_engine(graph)
+        self.assertEqual(fact_map(loader.load_closure(self.path)), expected)
+        self.assertEqual(loader.get_stats()["closure"]["warm_loads"], 1)
+    
+    def test_other_graph_with_same_version_is_caught_up(self):
+        graph_a, graph_b = random_graph(2), random_graph(3)
+        self.assertEqual(graph_a.version, graph_b.version)
+        saver = make_engine(graph_a)
+        saver.infer_all()
+        saver.save_closure(self.path)
+        
+        loader = make_engine(graph_b)
+        loaded = fact_map(loader.load_closure(self.path))
+        self.assertEqual(loaded, fact_map(make_engine(graph_b).infer_all()))
+        self.assertEqual(loader.get_stats()["closure"]["warm_loads"], 0)
+    
+    def test_catch_up_after_edge_changes(self):
+        for seed in range(5):
+            graph = random_graph(10 + seed, nodes=30, edges=60)
+            saver = make_engine(graph)
+            saver.infer_all()
+            saver.save_closure(self.path)
+            
+            rng = random.Random(seed)
+            edge_ids = [edge.edge_id for edge in graph.get_all_edges()]
+            graph.remove_edge(rng.choice(edge_ids))
+            source, target = rng.sample(range(1, 31), 2)
+            graph.add_edge(source, target, rng.choice(RELATIONS))
+            
+            loader = make_engine(graph)
+            loaded = fact_map(loader.load_closure(self.path))
+            self.assertEqual(loaded, fact_map(make_engine(graph).infer_all()), f"seed {seed}")
+    
+    def test_in_memory_catch_up_matches_infer_all(self):
+        graph = random_graph(4, nodes=30, edges=60)
+        engine = make_engine(graph)
+        engine.infer_all()
+        edge_id = next(iter(graph.get_all_edges())).edge_id
+        graph.remove_edge(edge_id)
+        graph.add_edge(1, 2, RelationType.IS_A)
+        self.assertEqual(fact_map(engine.catch_up()), fact_map(make_engine(graph).infer_all()))
+    
+    def test_missing_file(self):
+        self.assertIsNone(make_engine(random_graph(5)).load_closure(self.path + ".missing"))
+
+
+class TestPipelineLoad(unittest.TestCase):
+    """CognitivePipeline.load() keeps externally installed components."""
+    
+    def test_llm_generator_survives_load(self):
+        pipeline = CognitivePipeline()
+        generator = lambda prompt: "answer"
+        pipeline.set_llm_generator(generator)
+        with tempfile.TemporaryDirectory() as directory:
+            pipeline.save(directory)
+            pipeline.load(directory)
+        self.assertIs(pipeline.reasoner._generator, generator)
+        self.assertTrue(pipeline.get_stats()["has_llm_generator"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,268 @@
+"""
+Tests for ContradictionDetector.
+"""
+
+import random
+import unittest
+
+from ..graph import GraphStore, GraphNode, RelationType
+from ..reasoning import ContradictionDetector, ContradictionType
+
+
+RELATIONS = [
+    RelationType.IS_A, RelationType.IS_A, RelationType.PART_OF, RelationType.CONTAINS,
+    RelationType.PRECEDES, RelationType.FOLLOWS, RelationType.CAUSES, RelationType.CAUSED_BY,
+    RelationType.OPPOSITE_OF, RelationType.SIMILAR_TO,
+]
+
+
+def random_graph(seed: int, nodes: int = 12, edges: int = 40) -> GraphStore:
+    """Small dense graph with conflicting relations, cycles and self-loops."""
+    rnd = random.Random(seed)
+    graph = GraphStore()
+    for node_id in range(nodes):
+        graph.add_node(GraphNode(node_id=node_id, text=f"node {node_id}"))
+    for _ in range(edges):
+        add_random_edge(graph, rnd)
+    return graph
+
+
+def add_random_edge(graph: GraphStore, rnd: random.Random) -> int:
+    nodes = graph.node_count
+    source = rnd.randrange(nodes)
+    target = source if rnd.random() < 0.05 else rnd.randrange(nodes)
+    return graph.add_edge(source, target, rnd.choice(RELATIONS))
+
+
+def signatures(report):
+    """Order-independent view of a report's contradictions."""
+    return sorted(
+        (c.contradiction_type.value, tuple(sorted(c.nodes)), tuple(sorted(c.edges)))
+        for c in report.contradictions
+    )
+
+
+class TestIncrementalDetection(unittest.TestCase):
+    """detect_incremental() must always report what detect_all() reports."""
+    
+    def test_matches_detect_all_under_edits(self):
+        for seed in range(4):
+            rnd = random.Random(seed)
+            graph = random_graph(seed)
+            detector = ContradictionDetector(graph)
+            self.assertEqual(signatures(detector.detect_incremental()), signatures(detector.detect_all()))
+            
+            for step in range(60):
+                if rnd.random() < 0.5 and graph.edge_count:
+                    graph.remove_edge(rnd.choice(graph.get_all_edges()).edge_id)
+                else:
+                    add_random_edge(graph, rnd)
+                if step % 3 == 0:
+                    self.assertEqual(
+                        signatures(detector.detect_incremental()),
+                        signatures(detector.detect_all()),
+                        (seed, step)
+                    )
+    
+    def test_checks_only_changed_edges(self):
+        graph = random_graph(9)
+        detector = ContradictionDetector(graph)
+        self.assertEqual(detector.detect_incremental().edges_checked, graph.edge_count)
+        graph.add_edge(0, 1, RelationType.PRECEDES)
+        graph.add_edge(0, 1, RelationType.FOLLOWS)
+        report = detector.detect_incremental()
+        self.assertEqual(report.edges_checked, 2)
+        self.assertIn(
+            ContradictionType.DIRECT_OPPOSITE,
+            [c.contradiction_type for c in report.contradictions if set(c.nodes) == {0, 1}]
+        )
+        self.assertEqual(detector.detect_incremental().edges_checked, 0)
+    
+    def test_type_conflict_follows_edits(self):
+        graph = random_graph(5, edges=0)
+        detector = ContradictionDetector(graph)
+        graph.add_edge(0, 1, RelationType.IS_A)
+        graph.add_edge(0, 2, RelationType.IS_A)
+        self.assertEqual(detector.detect_incremental().contradictions, [])
+        opposite = graph.add_edge(1, 2, RelationType.OPPOSITE_OF)
+        report = detector.detect_incremental()
+        self.assertEqual([c.contradiction_type for c in report.contradictions], [ContradictionType.TYPE_CONFLICT])
+        self.assertEqual(signatures(report), signatures(detector.detect_all()))
+        graph.remove_edge(opposite)
+        self.assertEqual(detector.detect_incremental().contradictions, [])
+    
+    
+    def test_duplicate_type_edges_report_one_conflict(self):
+        graph = random_graph(6, edges=0)
+        detector = ContradictionDetector(graph)
+        for target in (1, 1, 2, 0):
+            graph.add_edge(0, target, RelationType.IS_A)
+        graph.add_edge(1, 2, RelationType.OPPOSITE_OF)
+        graph.add_edge(0, 2, RelationType.OPPOSITE_OF)
+        expected = signatures(detector.detect_all())
+        self.assertEqual([kind for kind, _, _ in expected].count(ContradictionType.TYPE_CONFLICT.value), 1)
+        self.assertEqual(signatures(detector.detect_incremental()), expected)
+    
+    
+    def test_shared_per_graph(self):
+        graph = GraphStore()
+        self.assertIs(ContradictionDetector.shared(graph), ContradictionDetector.shared(graph))
+        self.assertIsNot(ContradictionDetector.shared(graph), ContradictionDetector.shared(GraphStore()))
+
+
+class TestCycleDetection(unittest.TestCase):
+    """Cycle reports are exactly the non-trivial SCCs of each acyclic relation."""
+    
+    def _brute_force_components(self, graph, relation):
+        edges = graph.get_edges_by_type(relation)
+        reach = {node.node_id: {node.node_id} for node in graph.get_all_nodes()}
+        changed = True
+        while changed:
+            changed = False
+            for edge in edges:
+                before = len(reach[edge.source_id])
+                reach[edge.source_id] |= reach[edge.target_id]
+                changed |= len(reach[edge.source_id]) != before
+        components = set()
+        for node_id, reachable in reach.items():
+            members = frozenset(other for other in reachable if node_id in reach[other])
+            looped = any(e.source_id == e.target_id == node_id for e in edges)
+            if len(members) > 1 or looped:
+                inside = frozenset(
+                    e.edge_id for e in edges if e.source_id in members and e.target_id in members
+                )
+                components.add((members, inside))
+        return components
+    
+    def test_matches_brute_force(self):
+        for seed in range(6):
+            graph = random_graph(100 + seed, edges=45)
+            detector = ContradictionDetector(graph)
+            cycles = [
+                c for c in detector.detect_all().contradictions
+                if c.contradiction_type == ContradictionType.CAUSAL_CYCLE
+            ]
+            for relation in ContradictionDetector.ACYCLIC_RELATIONS:
+                reported = {
+                    (frozenset(c.nodes), frozenset(c.edges)) for c in cycles
+                    if graph.get_edge(c.edges[0]).relation_type == relation
+                }
+                self.assertEqual(reported, self._brute_force_components(graph, relation), (seed, relation))
+    
+    def test_deep_cycle(self):
+        graph = GraphStore()
+        size = 20000
+        for node_id in range(size):
+            graph.add_node(GraphNode(node_id=node_id, text=f"node {node_id}"))
+        for node_id in range(size):
+            graph.add_edge(node_id, (node_id + 1) % size, RelationType.PRECEDES)
+        (cycle,) = ContradictionDetector(graph).detect_all().contradictions
+        self.assertEqual(len(cycle.nodes), size)
+        self.assertEqual(len(cycle.edges), size)
+        self.assertIn("more", cycle.description)
+
+
+class TestBatchChecks(unittest.TestCase):
+    """would_contradict_batch() equals checking and adding edges one by one."""
+    
+    def test_matches_sequential_checks(self):
+        for seed in range(5):
+            rnd = random.Random(seed)
+            proposed = []
+            for _ in range(80):
+                source = rnd.randrange(12)
+                target = source if rnd.random() < 0.05 else rnd.randrange(12)
+                proposed.append((source, target, rnd.choice(RELATIONS)))
+            
+            batch = ContradictionDetector(random_graph(200 + seed, edges=15)).would_contradict_batch(proposed)
+            
+            graph = random_graph(200 + seed, edges=15)
+            detector = ContradictionDetector(graph)
+            for position, (source, target, relation) in enumerate(proposed):
+                expected, contradiction = detector.would_contradict(source, target, relation)
+                if not expected:
+                    graph.add_edge(source, target, relation)
+                self.assertEqual(batch[position][0], expected, (seed, position))
+                if expected:
+                    self.assertEqual(
+                        batch[position][1].contradiction_type, contradiction.contradiction_type, (seed, position)
+                    )
+    
+    def test_rejected_edges_are_not_added(self):
+        graph = random_graph(1, edges=0)
+        verdicts = ContradictionDetector(graph).would_contradict_batch([
+            (0, 1, RelationType.IS_A),
+            (1, 0, RelationType.IS_A),      # closes a cycle: rejected
+            (1, 2, RelationType.IS_A),
+            (2, 1, RelationType.IS_A),      # closes a cycle: rejected
+            (0, 2, RelationType.IS_A),      # fine: 1 -> 0 was never added
+        ])
+        self.assertEqual([flag for flag, _ in verdicts], [False, True, False, True, False])
+        self.assertEqual(graph.edge_count, 0)
+
+
+class TestScopedDetection(unittest.TestCase):
+    """detect_around() reports the whole-graph contradictions of its region."""
+    
+    def _region(self, graph, seeds, radius):
+        distance = {seed: 0 for seed in seeds}
+        frontier = list(seeds)
+        for hop in range(radius):
+            next_frontier = []
+            for node_id in frontier:
+                for edge in graph.get_outgoing_edges(node_id) + graph.get_incoming_edges(node_id):
+                    for neighbor in (edge.source_id, edge.target_id):
+                        if neighbor not in distance:
+                            distance[neighbor] = hop + 1
+                            next_frontier.append(neighbor)
+            frontier = next_frontier
+        return distance
+    
+    def test_whole_graph_region_matches_detect_all(self):
+        graph = random_graph(7)
+        detector = ContradictionDetector(graph)
+        report = detector.detect_around(range(graph.node_count), radius=0)
+        self.assertTrue(report.complete)
+        self.assertEqual(signatures(report), signatures(detector.detect_all()))
+    
+    def test_region_matches_detect_all(self):
+        for seed in range(5):
+            graph = random_graph(300 + seed, nodes=15, edges=90)
+            detector = ContradictionDetector(graph)
+            everything = detector.detect_all().contradictions
+            for radius in (0, 1):
+                seeds = [seed, seed + 7]
+                region = self._region(graph, seeds, radius)
+                report = detector.detect_around(seeds, radius=radius)
+                
+                # Pair, self-loop and type conflicts belong to their first node (the edges' source)
+                expected = [
+                    c for c in everything
+                    if c.contradiction_type != ContradictionType.CAUSAL_CYCLE and c.nodes[0] in region
+                ]
+                found = [c for c in report.contradictions if c.contradiction_type != ContradictionType.CAUSAL_CYCLE]
+                self.assertEqual(
+                    sorted((c.contradiction_type.value, tuple(sorted(c.nodes))) for c in found),
+                    sorted((c.contradiction_type.value, tuple(sorted(c.nodes))) for c in expected),
+                    (seed, radius)
+                )
+                
+                # Cycles inside the region are parts of whole-graph cycles
+                cycles = [set(c.nodes) for c in everything if c.contradiction_type == ContradictionType.CAUSAL_CYCLE]
+                for contradiction in report.contradictions:
+                    if contradiction.contradiction_type == ContradictionType.CAUSAL_CYCLE:
+                        self.assertTrue(set(contradiction.nodes) <= set(region))
+                        self.assertTrue(any(set(contradiction.nodes) <= cycle for cycle in cycles))
+                
+                # Ordered by distance to the seeds
+                hops = [min(region[n] for n in c.nodes if n in region) for c in report.contradictions]
+                self.assertEqual(hops, sorted(hops))
+    
+    def test_expired_deadline(self):
+        graph = random_graph(8)
+        report = ContradictionDetector(graph).detect_around([0], radius=2, deadline_ms=0)
+        self.assertFalse(report.complete)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Tests for DerivationGraph.
+"""
+
+import unittest
+
+from ..graph import GraphStore, GraphNode, RelationType
+from ..reasoning import DerivationGraph, InferenceEngine
+
+
+class TestDerivationGraph(unittest.TestCase):
+    """Fact rows, provenance chains and premise storage."""
+    
+    def setUp(self):
+        self.graph = GraphStore()
+        for node_id in range(1, 6):
+            self.graph.add_node(GraphNode(node_id=node_id, text=f"node {node_id}"))
+        self.edge_ids = [
+            self.graph.add_edge(n, n + 1, RelationType.IS_A) for n in range(1, 5)
+        ]
+    
+    def test_keeps_most_confident_derivation(self):
+        dag = DerivationGraph(self.graph)
+        key = (1, 3, RelationType.IS_A)
+        fid, stored = dag.record(key, 0.5, "a", edge_premises=self.edge_ids[:1])
+        self.assertTrue(stored)
+        self.assertFalse(dag.record(key, 0.4, "b")[1])
+        self.assertEqual(dag.record(key, 0.8, "c")[0], fid)
+        self.assertEqual(dag.rule_id(fid), "c")
+        self.assertAlmostEqual(dag.confidence(fid), 0.8)
+    
+    def test_chain_expands_fact_premises(self):
+        dag = DerivationGraph(self.graph)
+        e1, e2, e3, _ = self.edge_ids
+        inner, _ = dag.record((1, 3, RelationType.IS_A), 0.9, "t", edge_premises=[e1, e2])
+        outer, _ = dag.record((1, 4, RelationType.IS_A), 0.8, "t", edge_premises=[e3], fact_premises=[inner])
+        self.assertEqual(
+            dag.chain(outer),
+            [(3, RelationType.IS_A, 4), (1, RelationType.IS_A, 2), (2, RelationType.IS_A, 3)]
+        )
+    
+    def test_replaced_premises_do_not_accumulate(self):
+        dag = DerivationGraph(self.graph)
+        keys = [(1, n, RelationType.IS_A) for n in range(2, 6)]
+        expected = {}
+        for step in range(1, 5001):
+            # Premise lists grow and shrink, so slices cannot always be reused
+            key = keys[step % 4]
+            expected[key] = self.edge_ids[:1 + (step // 4) % 4]
+            dag.record(key, step / 5001, "t", edge_premises=expected[key])
+        
+        self.assertLess(dag.get_stats()["premises"], 2 * DerivationGraph.COMPACT_MIN_ORPHANED + 16)
+        for key, edge_ids in expected.items():
+            premises = dag.premises(dag.get_id(key))
+            self.assertEqual(premises, [("edge", eid) for eid in edge_ids])
+    
+    def test_state_round_trip(self):
+        dag = DerivationGraph(self.graph)
+        dag.record((1, 3, RelationType.IS_A), 0.9, "t", edge_premises=self.edge_ids[:2])
+        loaded = DerivationGraph.from_state(self.graph, dag.to_state())
+        self.assertEqual(loaded.chain(0), dag.chain(0))
+        self.assertEqual(loaded.node_fact_ids(3), dag.node_fact_ids(3))
+
+
+class TestEngineDerivations(unittest.TestCase):
+    """Facts produced by the engine carry valid provenance chains."""
+    
+    def test_chains_are_graph_paths(self):
+        graph = GraphStore()
+        for node_id in range(1, 9):
+            graph.add_node(GraphNode(node_id=node_id, text=f"node {node_id}"))
+        for node_id in range(1, 8):
+            graph.add_edge(node_id, node_id + 1, RelationType.IS_A if node_id % 3 else RelationType.PART_OF)
+        graph.add_edge(2, 6, RelationType.HAS_PART)
+        
+        engine = InferenceEngine(graph)
+        engine.rules.add_builtin_rules()
+        facts = engine.infer_all().inferred_facts
+        self.assertTrue(facts)
+        for fact in facts:
+            chain = fact.get_chain()
+            self.assertTrue(chain, fact)
+            for source_id, relation, target_id in chain:
+                self.assertTrue(graph.has_edge_between(source_id, target_id, relation), fact)
+            ends = {node for source_id, _, target_id in chain for node in (source_id, target_id)}
+            self.assertIn(fact.source_id, ends)
+            self.assertIn(fact.target_id, ends)
+        self.assertEqual(len(engine.derivations), len(facts))
+
+
+if __name__ == "__main__":
+    unittest.main()
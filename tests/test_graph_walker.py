@@ -0,0 +1,221 @@
+"""
+Tests for SanTOKGraphWalker random walks and alias sampling.
+"""
+
+import random
+import unittest
+
+from ..graph import GraphStore, GraphNode, RelationType
+from ..algorithms import SanTOKGraphWalker
+
+
+RELATIONS = [RelationType.IS_A, RelationType.PART_OF, RelationType.CAUSES, RelationType.RELATED_TO]
+
+
+def random_graph(seed: int, nodes: int = 20, edges: int = 50) -> GraphStore:
+    """Random weighted graph with a few dead ends."""
+    rnd = random.Random(seed)
+    graph = GraphStore()
+    for node_id in range(nodes):
+        graph.add_node(GraphNode(node_id=node_id, text=f"node {node_id}"))
+    for _ in range(edges):
+        source, target = rnd.randrange(nodes - 3), rnd.randrange(nodes)
+        graph.add_edge(source, target, rnd.choice(RELATIONS), weight=rnd.choice([0.2, 0.5, 1.0]))
+    return graph
+
+
+def star_graph(weights: dict) -> GraphStore:
+    """Node 0 with one edge to each key of weights, weighted by its value."""
+    graph = GraphStore()
+    graph.add_node(GraphNode(node_id=0, text="hub"))
+    for target, weight in weights.items():
+        graph.add_node(GraphNode(node_id=target, text=f"leaf {target}"))
+        graph.add_edge(0, target, RelationType.IS_A, weight=weight)
+    return graph
+
+
+def expected_shares(walker: SanTOKGraphWalker, node_id: int) -> dict:
+    """Target -> probability of one random-walk step from node_id."""
+    weights = {}
+    for edge in walker.graph.get_outgoing_edges(node_id, walker.include_inferred):
+        weight = walker._transition_weight(edge)
+        weights[edge.target_id] = weights.get(edge.target_id, 0.0) + weight
+    total = sum(weights.values())
+    return {target: weight / total for target, weight in weights.items()}
+
+
+class TestBatchedWalks(unittest.TestCase):
+    """random_walks against the graph it walks."""
+    
+    def assert_valid_walks(self, walker: SanTOKGraphWalker, walks) -> None:
+        graph = walker.graph
+        for row in walks.tolist():
+            for current, following in zip(row, row[1:]):
+                if current == -1:
+                    self.assertEqual(following, -1)
+                    continue
+                edges = graph.get_outgoing_edges(current, walker.include_inferred)
+                walkable = {e.target_id for e in edges if walker._transition_weight(e) > 0}
+                if following == -1:
+                    self.assertFalse(walkable, f"walk stopped at {current} with edges left")
+                else:
+                    self.assertIn(following, walkable)
+    
+    def test_shape_and_starts(self):
+        walker = SanTOKGraphWalker(random_graph(1))
+        walks = walker.random_walks([0, 1, 2], steps=6, walks_per_node=4, seed=3)
+        self.assertEqual(walks.shape, (12, 7))
+        self.assertEqual(walks[:, 0].tolist(), [0] * 4 + [1] * 4 + [2] * 4)
+    
+    def test_steps_follow_edges(self):
+        for seed in range(5):
+            walker = SanTOKGraphWalker(random_graph(seed))
+            walks = walker.random_walks(range(20), steps=8, walks_per_node=5, seed=seed)
+            self.assert_valid_walks(walker, walks)
+    
+    def test_same_seed_same_walks(self):
+        walker = SanTOKGraphWalker(random_graph(2))
+        first = walker.random_walks(range(10), steps=10, walks_per_node=3, seed=42)
+        second = walker.random_walks(range(10), steps=10, walks_per_node=3, seed=42)
+        self.assertEqual(first.tolist(), second.tolist())
+        other = walker.random_walks(range(10), steps=10, walks_per_node=3, seed=43)
+        self.assertNotEqual(first.tolist(), other.tolist())
+    
+    def test_dead_ends_and_unknown_sources_pad(self):
+        graph = star_graph({1: 1.0})
+        walker = SanTOKGraphWalker(graph)
+        walks = walker.random_walks([0, 99], steps=3, seed=0)
+        self.assertEqual(walks.tolist(), [[0, 1, -1, -1], [-1, -1, -1, -1]])
+    
+    def test_zero_weight_edges_are_dead_ends(self):
+        walker = SanTOKGraphWalker(star_graph({1: 0.0, 2: 0.0}))
+        walks = walker.random_walks([0], steps=2, walks_per_node=3, seed=0)
+        self.assertEqual(walks.tolist(), [[0, -1, -1]] * 3)
+    
+    def test_step_distribution_follows_weights(self):
+        walker = SanTOKGraphWalker(star_graph({1: 0.1, 2: 0.3, 3: 0.6}))
+        walks = walker.random_walks([0], steps=1, walks_per_node=20000, seed=7)
+        counts = {target: int((walks[:, 1] == target).sum()) for target in (1, 2, 3)}
+        for target, share in expected_shares(walker, 0).items():
+            self.assertAlmostEqual(counts[target] / 20000, share, delta=0.02)
+    
+    def test_graph_edits_rebuild_arrays(self):
+        graph = star_graph({1: 1.0})
+        graph.add_node(GraphNode(node_id=2, text="new"))
+        walker = SanTOKGraphWalker(graph)
+        self.assertEqual(walker.random_walks([1], steps=1, seed=0).tolist(), [[1, -1]])
+        
+        graph.add_edge(1, 2, RelationType.IS_A)
+        self.assertEqual(walker.random_walks([1], steps=1, seed=0).tolist(), [[1, 2]])
+        
+        edge_id = graph.get_outgoing_edges(1)[0].edge_id
+        graph.remove_edge(edge_id)
+        self.assertEqual(walker.random_walks([1], steps=1, seed=0).tolist(), [[1, -1]])
+    
+    def test_inferred_overlay(self):
+        graph = star_graph({1: 1.0})
+        graph.add_node(GraphNode(node_id=2, text="inferred"))
+        plain = SanTOKGraphWalker(graph)
+        overlay = SanTOKGraphWalker(graph, include_inferred=True)
+        self.assertEqual(overlay.random_walks([1], steps=1, seed=0).tolist(), [[1, -1]])
+        
+        graph.add_inferred_edge(1, 2, RelationType.IS_A, confidence=0.8)
+        self.assertEqual(overlay.random_walks([1], steps=1, seed=0).tolist(), [[1, 2]])
+        self.assertEqual(plain.random_walks([1], steps=1, seed=0).tolist(), [[1, -1]])
+        
+        graph.add_inferred_edge(2, 0, RelationType.IS_A, confidence=0.5)
+        walks = overlay.random_walks(range(3), steps=6, walks_per_node=5, seed=1)
+        self.assert_valid_walks(overlay, walks)
+        self.assertEqual(walks[5, :3].tolist(), [1, 2, 0])
+
+
+class TestAliasSampling(unittest.TestCase):
+    """Alias tables behind random_walk: shares, sampling and invalidation."""
+    
+    def table_shares(self, table) -> dict:
+        """Target -> probability the alias table gives it."""
+        n = len(table.edges)
+        shares = {}
+        for i, edge in enumerate(table.edges):
+            for slot_edge, share in ((edge, table.prob[i]), (table.edges[table.alias[i]], 1.0 - table.prob[i])):
+                shares[slot_edge.target_id] = shares.get(slot_edge.target_id, 0.0) + share / n
+        return shares
+    
+    def test_tables_match_weights(self):
+        for seed in range(5):
+            walker = SanTOKGraphWalker(random_graph(seed))
+            for node_id in range(17):
+                table = walker._alias_table(node_id)
+                if table is None:
+                    self.assertFalse(walker.graph.get_outgoing_edges(node_id))
+                    continue
+                expected = expected_shares(walker, node_id)
+                actual = self.table_shares(table)
+                self.assertEqual(set(actual), set(expected))
+                for target, share in expected.items():
+                    self.assertAlmostEqual(actual[target], share, places=9)
+    
+    def test_sampling_follows_weights(self):
+        walker = SanTOKGraphWalker(star_graph({1: 0.1, 2: 0.3, 3: 0.6}))
+        random.seed(11)
+        counts = {1: 0, 2: 0, 3: 0}
+        for _ in range(20000):
+            counts[walker.random_walk(0, steps=1).path[1].node_id] += 1
+        for target, share in expected_shares(walker, 0).items():
+            self.assertAlmostEqual(counts[target] / 20000, share, delta=0.02)
+    
+    def test_zero_weight_table_stops_walk(self):
+        walker = SanTOKGraphWalker(star_graph({1: 0.0, 2: 0.0}))
+        self.assertEqual(walker._alias_table(0).total, 0.0)
+        self.assertEqual(walker.random_walk(0, steps=3).hops, 0)
+    
+    def test_edge_edits_drop_only_their_source(self):
+        graph = star_graph({1: 1.0, 2: 1.0})
+        graph.add_edge(1, 2, RelationType.IS_A)
+        walker = SanTOKGraphWalker(graph)
+        walker.random_walk(0, steps=1)
+        walker.random_walk(1, steps=1)
+        self.assertEqual(walker.get_stats()["alias_builds"], 2)
+        
+        graph.add_node(GraphNode(node_id=3, text="leaf 3"))
+        graph.add_edge(0, 3, RelationType.IS_A, weight=5.0)
+        walker.random_walk(1, steps=1)
+        stats = walker.get_stats()
+        self.assertEqual(stats["alias_invalidations"], 1)
+        self.assertEqual(stats["alias_tables"], 1)
+        self.assertEqual(stats["alias_builds"], 2)
+        
+        table = walker._alias_table(0)
+        self.assertEqual({edge.target_id for edge in table.edges}, {1, 2, 3})
+        self.assertAlmostEqual(self.table_shares(table)[3], 5.0 / 7.0)
+        
+        graph.remove_edge(graph.get_outgoing_edges(1)[0].edge_id)
+        self.assertEqual(walker.random_walk(1, steps=1).hops, 0)
+        self.assertEqual(walker.get_stats()["alias_invalidations"], 2)
+    
+    def test_overlay_changes_drop_tables(self):
+        graph = star_graph({1: 1.0})
+        graph.add_node(GraphNode(node_id=2, text="inferred"))
+        walker = SanTOKGraphWalker(graph, include_inferred=True)
+        self.assertEqual(walker.random_walk(1, steps=1).hops, 0)
+        
+        graph.add_inferred_edge(1, 2, RelationType.IS_A, confidence=0.8)
+        self.assertEqual([step.node_id for step in walker.random_walk(1, steps=1).path], [1, 2])
+    
+    def test_invalidate_alias_tables(self):
+        graph = star_graph({1: 1.0, 2: 1.0})
+        walker = SanTOKGraphWalker(graph)
+        walker.random_walk(0, steps=1)
+        
+        # In-place weight edits bump no version; only an explicit reset sees them
+        for edge in graph.get_outgoing_edges(0):
+            edge.weight = 1.0 if edge.target_id == 1 else 0.0
+        self.assertAlmostEqual(self.table_shares(walker._alias_table(0))[2], 0.5)
+        
+        walker.invalidate_alias_tables()
+        self.assertEqual(walker.get_stats()["alias_tables"], 0)
+        self.assertEqual(self.table_shares(walker._alias_table(0)), {1: 1.0, 2: 0.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
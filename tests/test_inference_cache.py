@@ -0,0 +1,91 @@
+"""
+Tests for InferenceCache.
+"""
+
+import unittest
+
+from ..graph import GraphStore, GraphNode, RelationType
+from ..memory import UnifiedMemory
+from ..reasoning import InferenceEngine, InferenceCache, HybridReasoner, SanTOKReasoner
+
+
+def fact_keys(result):
+    return {(f.source_id, f.target_id, f.relation) for f in result.inferred_facts}
+
+
+class TestInferenceCache(unittest.TestCase):
+    """Results are reused while graph and rules are unchanged, never after."""
+    
+    def setUp(self):
+        self.graph = GraphStore()
+        for node_id in range(1, 6):
+            self.graph.add_node(GraphNode(node_id=node_id, text=f"node {node_id}"))
+        for node_id in range(1, 4):
+            self.graph.add_edge(node_id, node_id + 1, RelationType.IS_A)
+        self.cache = InferenceCache()
+    
+    def _engine(self) -> InferenceEngine:
+        engine = InferenceEngine(self.graph, cache=self.cache)
+        engine.rules.add_builtin_rules()
+        return engine
+    
+    def test_second_engine_reuses_result(self):
+        first = self._engine().infer_all()
+        engine = self._engine()
+        self.assertIs(engine.infer_all(), first)
+        self.assertEqual(self.cache.get_stats()["hits"], 1)
+        # The reused facts are queryable on the second engine
+        self.assertTrue(engine.can_infer(1, 3, RelationType.IS_A)[0])
+    
+    def test_graph_change_invalidates(self):
+        engine = self._engine()
+        before = engine.infer_all()
+        self.graph.add_edge(4, 5, RelationType.IS_A)
+        after = engine.infer_all()
+        self.assertIsNot(after, before)
+        self.assertIn((3, 5, RelationType.IS_A), fact_keys(after))
+        
+        self.graph.remove_edge(next(
+            e.edge_id for e in self.graph.get_all_edges() if e.source_id == 4
+        ))
+        self.assertEqual(fact_keys(engine.infer_all()), fact_keys(before))
+    
+    def test_rule_change_invalidates(self):
+        engine = self._engine()
+        before = engine.infer_all()
+        engine.rules.create_custom_rule("is_a_3", [RelationType.IS_A] * 3, RelationType.RELATED_TO)
+        after = engine.infer_all()
+        self.assertIsNot(after, before)
+        self.assertIn((1, 4, RelationType.RELATED_TO), fact_keys(after))
+    
+    def test_parameters_are_part_of_key(self):
+        engine = self._engine()
+        self.assertIsNot(engine.infer_all(min_confidence=0.5), engine.infer_all(min_confidence=0.1))
+    
+    def test_partial_results_are_not_cached(self):
+        engine = self._engine()
+        partial = engine.infer_all(max_new_facts=1)
+        self.assertFalse(partial.reached_fixpoint)
+        self.assertEqual(len(self.cache), 0)
+        self.assertTrue(engine.infer_all().reached_fixpoint)
+    
+    def test_lru_bound(self):
+        cache = InferenceCache(max_entries=2)
+        for version in range(3):
+            cache.put((0, version, "", ()), object())
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get((0, 0, "", ())))
+
+
+class TestSharedCache(unittest.TestCase):
+    """Reasoners built on the same memory share one cache."""
+    
+    def test_reasoners_share_cache(self):
+        memory = UnifiedMemory()
+        self.assertIs(InferenceCache.shared(memory), InferenceCache.shared(memory))
+        self.assertIsNot(InferenceCache.shared(memory), InferenceCache.shared(UnifiedMemory()))
+        self.assertIs(HybridReasoner(memory).inference.cache, SanTOKReasoner(memory).inference_engine.cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
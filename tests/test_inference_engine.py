@@ -0,0 +1,419 @@
+"""
+Regression checks for InferenceEngine.
+"""
+
+import itertools
+import random
+import unittest
+
+from ..graph import GraphStore, GraphNode, RelationType
+from ..reasoning import InferenceEngine
+
+
+def make_graph(edges, nodes=None) -> GraphStore:
+    """Graph over nodes 1..n from (source, target, relation, weight) tuples."""
+    graph = GraphStore()
+    count = nodes or max(max(s, t) for s, t, _, _ in edges)
+    for node_id in range(1, count + 1):
+        graph.add_node(GraphNode(node_id=node_id, text=f"node {node_id}"))
+    for source, target, relation, weight in edges:
+        graph.add_edge(source, target, relation, weight=weight)
+    return graph
+
+
+def brute_force_best(graph, source, target, relation, decay, max_depth) -> float:
+    """Best confidence over simple paths of at most max_depth hops (0.0 if none)."""
+    best = 0.0
+    stack = [(source, 1.0, 0, {source})]
+    while stack:
+        node, confidence, hops, seen = stack.pop()
+        if node == target and hops >= 2:
+            best = max(best, confidence)
+        if hops == max_depth:
+            continue
+        for edge in graph.get_outgoing_edges(node):
+            if edge.relation_type != relation or edge.target_id in seen:
+                continue
+            factor = decay if hops else 1.0
+            stack.append((edge.target_id, confidence * factor * edge.weight, hops + 1, seen | {edge.target_id}))
+    return best
+
+
+def random_edges(seed, nodes, count, relations, weights=(1.0, 0.8, 0.5)):
+    """Random (source, target, relation, weight) tuples without self-loops."""
+    rnd = random.Random(seed)
+    edges = []
+    while len(edges) < count:
+        source, target = rnd.randint(1, nodes), rnd.randint(1, nodes)
+        if source != target:
+            edges.append((source, target, rnd.choice(relations), rnd.choice(weights)))
+    return edges
+
+
+def fact_map(result):
+    """(source, target, relation) -> (confidence, rule_id) for a result's facts."""
+    return {
+        (f.source_id, f.target_id, f.relation): (round(f.confidence, 9), f.rule_id)
+        for f in result.inferred_facts
+    }
+
+
+class TestEquivalenceConfidence(unittest.TestCase):
+    """Equivalence classes must not cap pairs by the weakest edge in the class."""
+    
+    def _engine(self, use_equivalence_classes: bool) -> InferenceEngine:
+        graph = GraphStore()
+        for node_id in (1, 2, 3):
+            graph.add_node(GraphNode(node_id=node_id, text=f"node {node_id}"))
+        graph.add_edge(1, 2, RelationType.RELATED_TO, weight=0.9)
+        graph.add_edge(2, 3, RelationType.RELATED_TO, weight=0.2)
+        
+        engine = InferenceEngine(graph, use_equivalence_classes=use_equivalence_classes)
+        engine.rules.add_equivalence_rules(RelationType.RELATED_TO)
+        engine.infer_all()
+        return engine
+    
+    def test_direct_edge_keeps_its_weight(self):
+        for use_classes in (True, False):
+            ok, fact = self._engine(use_classes).can_infer(2, 1, RelationType.RELATED_TO, 0.3)
+            self.assertTrue(ok)
+            self.assertAlmostEqual(fact.confidence, 0.9)
+    
+    def test_two_hop_pair_matches_pairwise_facts(self):
+        with_classes = self._engine(True).can_infer(1, 3, RelationType.RELATED_TO, 0.1)[1]
+        pairwise = self._engine(False).can_infer(1, 3, RelationType.RELATED_TO, 0.1)[1]
+        self.assertAlmostEqual(with_classes.confidence, pairwise.confidence)
+        self.assertEqual(with_classes.depth, 2)
+
+
+class TestTransitiveCanInfer(unittest.TestCase):
+    """can_infer must score the most confident path, whatever the edge order."""
+    
+    STRONG = [(1, 2, RelationType.IS_A, 1.0), (2, 3, RelationType.IS_A, 1.0), (3, 4, RelationType.IS_A, 1.0)]
+    WEAK = [(1, 5, RelationType.IS_A, 0.1), (5, 6, RelationType.IS_A, 1.0), (6, 4, RelationType.IS_A, 1.0)]
+    
+    def _engine(self, edges) -> InferenceEngine:
+        engine = InferenceEngine(make_graph(edges))
+        engine.rules.add_builtin_rules()
+        return engine
+    
+    def test_independent_of_insertion_order(self):
+        for edges in (self.STRONG + self.WEAK, self.WEAK + self.STRONG):
+            ok, fact = self._engine(edges).can_infer(1, 4, RelationType.IS_A, 0.5)
+            self.assertTrue(ok)
+            self.assertAlmostEqual(fact.confidence, 0.95 ** 2)
+            self.assertEqual([step[0] for step in fact.chain], [1, 2, 3])
+    
+    def test_respects_max_depth(self):
+        # transitive_causes has max_depth=3
+        chain = [(n, n + 1, RelationType.CAUSES, 1.0) for n in range(1, 6)]
+        engine = self._engine(chain)
+        self.assertTrue(engine.can_infer(1, 4, RelationType.CAUSES, 0.1)[0])
+        self.assertFalse(engine.can_infer(1, 5, RelationType.CAUSES, 0.1)[0])
+    
+    def test_matches_brute_force(self):
+        weights = [1.0, 0.9, 0.6, 0.3]
+        edges = [
+            (source, target, RelationType.IS_A, weights[(source * 7 + target) % 4])
+            for source, target in itertools.permutations(range(1, 7), 2)
+            if (source * 3 + target) % 4 == 0
+        ]
+        engine = self._engine(edges)
+        graph = engine.graph
+        for source, target in itertools.permutations(range(1, 7), 2):
+            if graph.has_edge_between(source, target, RelationType.IS_A):
+                continue
+            ok, fact = engine.can_infer(source, target, RelationType.IS_A, 0.2)
+            expected = brute_force_best(graph, source, target, RelationType.IS_A, 0.95, 10)
+            self.assertEqual(ok, expected >= 0.2, (source, target))
+            if ok:
+                self.assertAlmostEqual(fact.confidence, expected)
+
+
+class TestInferBest(unittest.TestCase):
+    """infer_best keeps the most confident derivation, within each rule's max_depth."""
+    
+    def _engine(self, edges, nodes=None) -> InferenceEngine:
+        engine = InferenceEngine(make_graph(edges, nodes))
+        engine.rules.add_builtin_rules()
+        return engine
+    
+    def test_transitive_facts_match_brute_force(self):
+        rnd = random.Random(5)
+        edges = [
+            (rnd.randint(1, 9), rnd.randint(1, 9), RelationType.IS_A, rnd.choice([1.0, 0.8, 0.5]))
+            for _ in range(18)
+        ]
+        engine = self._engine(edges, nodes=9)
+        facts = {
+            (f.source_id, f.target_id): f.confidence
+            for f in engine.infer_best(min_confidence=0.2).inferred_facts
+            if f.rule_id == "transitive_is_a"
+        }
+        graph = engine.graph
+        for source, target in itertools.permutations(range(1, 10), 2):
+            if graph.has_edge_between(source, target, RelationType.IS_A):
+                continue
+            expected = brute_force_best(graph, source, target, RelationType.IS_A, 0.95, 10)
+            if expected >= 0.2:
+                self.assertAlmostEqual(facts.pop((source, target)), expected)
+        self.assertEqual(facts, {})
+    
+    def test_respects_max_depth(self):
+        # transitive_causes has max_depth=3: 1 -> 4 is derived, 1 -> 5 is not
+        chain = [(n, n + 1, RelationType.CAUSES, 1.0) for n in range(1, 7)]
+        keys = {
+            (f.source_id, f.target_id)
+            for f in self._engine(chain).infer_best().inferred_facts
+            if f.relation == RelationType.CAUSES
+        }
+        self.assertIn((1, 4), keys)
+        self.assertNotIn((1, 5), keys)
+        self.assertTrue(all(target - source <= 3 for source, target in keys))
+    
+    def test_covers_infer_all(self):
+        rnd = random.Random(9)
+        relations = [RelationType.IS_A, RelationType.PART_OF, RelationType.HAS_PART, RelationType.CAUSES]
+        edges = [
+            (rnd.randint(1, 12), rnd.randint(1, 12), rnd.choice(relations), rnd.choice([1.0, 0.7]))
+            for _ in range(30)
+        ]
+        engine = self._engine(edges, nodes=12)
+        closure = {
+            (f.source_id, f.target_id, f.relation): f.confidence
+            for f in engine.infer_all(min_confidence=0.1).inferred_facts
+        }
+        best = {
+            (f.source_id, f.target_id, f.relation): f.confidence
+            for f in engine.infer_best(min_confidence=0.1).inferred_facts
+        }
+        for key, confidence in closure.items():
+            self.assertGreaterEqual(best[key], confidence - 1e-9, key)
+
+
+class TestVirtualInheritance(unittest.TestCase):
+    """Virtual inheritance must answer like the materialized inheritance facts."""
+    
+    def _engines(self, edges, nodes=None):
+        engines = []
+        for virtual in (False, True):
+            engine = InferenceEngine(make_graph(edges, nodes), virtual_inheritance=virtual)
+            engine.rules.add_builtin_rules()
+            engine.infer_all()
+            engines.append(engine)
+        return engines
+    
+    def test_inherits_from_direct_parents_only(self):
+        edges = [
+            (1, 2, RelationType.IS_A, 1.0),
+            (2, 3, RelationType.IS_A, 1.0),
+            (3, 4, RelationType.HAS_PART, 1.0),
+        ]
+        for engine in self._engines(edges):
+            self.assertFalse(engine.can_infer(1, 4, RelationType.HAS_PART)[0])
+            self.assertTrue(engine.can_infer(2, 4, RelationType.HAS_PART)[0])
+    
+    def test_matches_materialized(self):
+        rnd = random.Random(13)
+        relations = [RelationType.IS_A, RelationType.HAS_PART, RelationType.USES]
+        edges = [
+            (rnd.randint(1, 10), rnd.randint(1, 10), rnd.choice(relations), rnd.choice([1.0, 0.6]))
+            for _ in range(35)
+        ]
+        materialized, virtual = self._engines(edges, nodes=10)
+        for source, target in itertools.permutations(range(1, 11), 2):
+            for relation in (RelationType.HAS_PART, RelationType.USES):
+                self.assertEqual(
+                    materialized.can_infer(source, target, relation, 0.3)[0],
+                    virtual.can_infer(source, target, relation, 0.3)[0],
+                    (source, target, relation)
+                )
+        for node_id in range(1, 11):
+            self.assertEqual(
+                {(f.source_id, f.target_id, f.relation) for f in materialized.get_inferred_relations(node_id)},
+                {(f.source_id, f.target_id, f.relation) for f in virtual.get_inferred_relations(node_id, min_confidence=0.1)},
+                node_id
+            )
+
+
+class TestParallelInference(unittest.TestCase):
+    """Parallel infer_all must produce exactly the serial result."""
+    
+    def test_matches_serial(self):
+        relations = [RelationType.IS_A, RelationType.PART_OF, RelationType.HAS_PART, RelationType.CAUSES]
+        graph = make_graph(random_edges(21, 40, 120, relations), nodes=40)
+        serial = InferenceEngine(graph)
+        serial.rules.add_builtin_rules()
+        parallel = InferenceEngine(graph)
+        parallel.rules.add_builtin_rules()
+        self.assertEqual(
+            fact_map(parallel.infer_all(parallel=True, max_workers=2)),
+            fact_map(serial.infer_all())
+        )
+
+
+class TestChainRules(unittest.TestCase):
+    """N-hop CHAIN rules derive exactly the facts of their relation walks."""
+    
+    CHAIN = [RelationType.USES, RelationType.ENABLES, RelationType.CAUSES, RelationType.PART_OF]
+    
+    def _brute_force(self, graph, min_confidence, decay):
+        best = {}
+        stack = [(edge.source_id, edge.target_id, edge.weight, 1) for edge in graph.get_all_edges()
+                 if edge.relation_type == self.CHAIN[0]]
+        while stack:
+            source, node, confidence, hops = stack.pop()
+            if hops == len(self.CHAIN):
+                if source != node and not graph.has_edge_between(source, node, RelationType.CAUSES):
+                    if confidence * decay >= min_confidence:
+                        key = (source, node)
+                        best[key] = max(best.get(key, 0.0), confidence * decay)
+                continue
+            for edge in graph.get_outgoing_edges(node):
+                if edge.relation_type == self.CHAIN[hops]:
+                    stack.append((source, edge.target_id, confidence * edge.weight, hops + 1))
+        return best
+    
+    def test_matches_brute_force(self):
+        for seed in range(4):
+            graph = make_graph(random_edges(30 + seed, 10, 60, self.CHAIN), nodes=10)
+            engine = InferenceEngine(graph)
+            engine.rules.create_custom_rule("chain", self.CHAIN, RelationType.CAUSES, confidence_decay=0.9)
+            facts = {
+                (f.source_id, f.target_id): f.confidence
+                for f in engine.infer_all(min_confidence=0.2).inferred_facts
+            }
+            expected = self._brute_force(graph, 0.2, 0.9)
+            self.assertEqual(set(facts), set(expected), f"seed {seed}")
+            for key, confidence in expected.items():
+                self.assertAlmostEqual(facts[key], confidence)
+    
+    def test_premises_follow_chain_order(self):
+        edges = [(n, n + 1, relation, 1.0) for n, relation in enumerate(self.CHAIN, start=1)]
+        engine = InferenceEngine(make_graph(edges))
+        engine.rules.create_custom_rule("chain", self.CHAIN, RelationType.CAUSES)
+        (fact,) = engine.infer_all().inferred_facts
+        self.assertEqual((fact.source_id, fact.target_id), (1, 5))
+        self.assertEqual([relation for _, relation, _ in fact.get_chain()], self.CHAIN)
+
+
+class TestAnytimeInference(unittest.TestCase):
+    """Budgeted runs return a subset of the full closure and flag truncation."""
+    
+    def setUp(self):
+        relations = [RelationType.IS_A, RelationType.PART_OF, RelationType.CAUSES, RelationType.PRECEDES]
+        self.graph = make_graph(random_edges(41, 30, 90, relations), nodes=30)
+        self.full = self._engine().infer_all()
+        self.keys = {(f.source_id, f.target_id, f.relation) for f in self.full.inferred_facts}
+    
+    def _engine(self) -> InferenceEngine:
+        engine = InferenceEngine(self.graph)
+        engine.rules.add_builtin_rules()
+        return engine
+    
+    def test_fact_budget(self):
+        for budget in (1, 5, len(self.keys) // 2):
+            result = self._engine().infer_all(max_new_facts=budget)
+            keys = [(f.source_id, f.target_id, f.relation) for f in result.inferred_facts]
+            self.assertEqual(len(keys), budget)
+            self.assertEqual(len(set(keys)), budget)
+            self.assertLessEqual(set(keys), self.keys)
+            self.assertFalse(result.reached_fixpoint)
+    
+    def test_budget_not_reached(self):
+        result = self._engine().infer_all(max_new_facts=len(self.keys))
+        self.assertTrue(result.reached_fixpoint)
+        self.assertEqual({(f.source_id, f.target_id, f.relation) for f in result.inferred_facts}, self.keys)
+    
+    def test_expired_deadline(self):
+        result = self._engine().infer_all(deadline_ms=0)
+        self.assertFalse(result.reached_fixpoint)
+        self.assertLessEqual(
+            {(f.source_id, f.target_id, f.relation) for f in result.inferred_facts}, self.keys
+        )
+    
+    def test_generous_deadline_matches_full_run(self):
+        result = self._engine().infer_all(deadline_ms=60000)
+        self.assertTrue(result.reached_fixpoint)
+        self.assertEqual({(f.source_id, f.target_id, f.relation) for f in result.inferred_facts}, self.keys)
+
+
+class TestInferLocal(unittest.TestCase):
+    """Facts derived around seeds match the global closure."""
+    
+    def setUp(self):
+        relations = [RelationType.IS_A, RelationType.PART_OF, RelationType.HAS_PART, RelationType.USES]
+        self.engine = InferenceEngine(make_graph(random_edges(51, 40, 100, relations), nodes=40))
+        self.engine.rules.add_builtin_rules()
+        self.full = fact_map(self.engine.infer_all())
+    
+    def test_seed_facts_match_infer_all(self):
+        for seed in range(1, 41, 3):
+            result = self.engine.infer_local([seed])
+            self.assertTrue(result.reached_fixpoint)
+            local = fact_map(result)
+            for key, value in self.full.items():
+                if key[0] == seed:
+                    self.assertEqual(local.get(key), value, key)
+            for key in local:
+                self.assertIn(key, self.full)
+    
+    def test_leaves_global_facts_untouched(self):
+        self.engine.infer_local([1, 2])
+        self.assertEqual(fact_map(self.engine.infer_all()), self.full)
+    
+    def test_short_radius_is_flagged(self):
+        truncated = [seed for seed in range(1, 41) if not self.engine.infer_local([seed], radius=1).reached_fixpoint]
+        self.assertTrue(truncated)
+    
+    def test_max_facts_keeps_closest(self):
+        seed = max(range(1, 41), key=lambda n: len(self.engine.infer_local([n]).inferred_facts))
+        result = self.engine.infer_local([seed])
+        top = self.engine.infer_local([seed], max_facts=3).inferred_facts
+        self.assertEqual(
+            [(f.source_id, f.target_id, f.relation) for f in top],
+            [(f.source_id, f.target_id, f.relation) for f in result.inferred_facts][:3]
+        )
+        self.assertTrue(all(seed in (f.source_id, f.target_id) for f in top))
+
+
+class TestInferenceProfile(unittest.TestCase):
+    """Profiled runs derive the same facts and account for every one."""
+    
+    def setUp(self):
+        relations = [RelationType.IS_A, RelationType.PART_OF, RelationType.HAS_PART, RelationType.CAUSES]
+        self.graph = make_graph(random_edges(61, 25, 70, relations), nodes=25)
+    
+    def _engine(self) -> InferenceEngine:
+        engine = InferenceEngine(self.graph)
+        engine.rules.add_builtin_rules()
+        return engine
+    
+    def test_same_facts_as_unprofiled(self):
+        profiled = self._engine().infer_all(profile=True)
+        self.assertIsNotNone(profiled.profile)
+        self.assertEqual(fact_map(profiled), fact_map(self._engine().infer_all()))
+    
+    def test_counts_add_up(self):
+        result = self._engine().infer_all(profile=True)
+        profile = result.profile
+        produced = {rule_id: rule.produced for rule_id, rule in profile.rules.items() if rule.produced}
+        self.assertEqual(sum(produced.values()), len(result.inferred_facts))
+        derived_by = {}
+        for fact in result.inferred_facts:
+            derived_by[fact.rule_id] = derived_by.get(fact.rule_id, 0) + 1
+        self.assertEqual(produced, derived_by)
+        for rule in profile.rules.values():
+            for step in rule.iterations:
+                self.assertEqual(step.candidates, step.produced + step.rejected_duplicate + step.rejected_budget)
+            self.assertIn(rule.rule_id, profile.joins[rule.join].rules)
+        self.assertIn("transitive_is_a", profile.report())
+    
+    def test_fact_budget_is_reported(self):
+        profile = self._engine().explain_analyze(max_new_facts=3)
+        self.assertEqual(sum(rule.produced for rule in profile.rules.values()), 3)
+        self.assertGreater(sum(rule.rejected_budget for rule in profile.rules.values()), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
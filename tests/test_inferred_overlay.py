@@ -0,0 +1,101 @@
+"""
+Tests for the inferred-edge overlay.
+"""
+
+import unittest
+
+from ..graph import GraphStore, GraphNode, RelationType
+from ..reasoning import InferenceEngine, PathFinder
+
+
+def chain_graph(length: int) -> GraphStore:
+    """1 -IS_A-> 2 -IS_A-> ... -> length."""
+    graph = GraphStore()
+    for node_id in range(1, length + 1):
+        graph.add_node(GraphNode(node_id=node_id, text=f"node {node_id}"))
+    for node_id in range(1, length):
+        graph.add_edge(node_id, node_id + 1, RelationType.IS_A)
+    return graph
+
+
+class TestOverlayEdges(unittest.TestCase):
+    """Overlay edges are kept apart from base edges."""
+    
+    def setUp(self):
+        self.graph = chain_graph(4)
+    
+    def test_visible_only_when_requested(self):
+        edge_id = self.graph.add_inferred_edge(1, 3, RelationType.IS_A, 0.8, "r")
+        self.assertLess(edge_id, 0)
+        self.assertEqual(self.graph.edge_count, 3)
+        self.assertNotIn(3, [e.target_id for e in self.graph.get_outgoing_edges(1)])
+        inferred = [e for e in self.graph.get_outgoing_edges(1, include_inferred=True) if e.inferred]
+        self.assertEqual([(e.target_id, e.weight, e.rule_id) for e in inferred], [(3, 0.8, "r")])
+        self.assertEqual([e.edge_id for e in self.graph.get_incoming_edges(3, include_inferred=True) if e.inferred], [edge_id])
+        self.assertFalse(self.graph.has_edge_between(1, 3, RelationType.IS_A))
+    
+    def test_one_edge_per_key_keeps_best_confidence(self):
+        first = self.graph.add_inferred_edge(1, 3, RelationType.IS_A, 0.5, "a")
+        self.assertEqual(self.graph.add_inferred_edge(1, 3, RelationType.IS_A, 0.9, "b"), first)
+        version = self.graph.overlay_version
+        self.graph.add_inferred_edge(1, 3, RelationType.IS_A, 0.7, "c")
+        self.assertEqual(self.graph.overlay_version, version)
+        edge = self.graph.get_inferred_edge(first)
+        self.assertEqual((edge.weight, edge.rule_id), (0.9, "b"))
+        self.assertEqual(self.graph.inferred_edge_count, 1)
+    
+    def test_remove_and_replace(self):
+        edge_id = self.graph.add_inferred_edge(1, 3, RelationType.IS_A, 0.5)
+        self.assertIsNone(self.graph.add_inferred_edge(1, 99, RelationType.IS_A, 0.5))
+        self.assertTrue(self.graph.remove_inferred_edge(edge_id))
+        self.assertFalse(self.graph.remove_inferred_edge(edge_id))
+        self.assertEqual(self.graph.get_outgoing_edges(1, include_inferred=True), self.graph.get_outgoing_edges(1))
+        
+        count = self.graph.set_inferred_edges([(2, 4, RelationType.IS_A, 0.9, "r")], tag="t")
+        self.assertEqual(count, 1)
+        self.assertEqual(self.graph.inferred_tag, (self.graph.version, "t"))
+        self.graph.clear_inferred_edges()
+        self.assertEqual(self.graph.get_inferred_edges(), [])
+        self.assertIsNone(self.graph.inferred_tag)
+
+
+class TestMaterialize(unittest.TestCase):
+    """materialize() publishes the closure and is rebuilt only when stale."""
+    
+    def setUp(self):
+        self.graph = chain_graph(5)
+        self.engine = InferenceEngine(self.graph)
+        self.engine.rules.add_builtin_rules()
+    
+    def _overlay_keys(self):
+        return {(e.source_id, e.target_id, e.relation_type) for e in self.graph.get_inferred_edges()}
+    
+    def test_overlay_matches_closure(self):
+        count = self.engine.materialize()
+        facts = {(f.source_id, f.target_id, f.relation) for f in self.engine.infer_all().inferred_facts}
+        self.assertEqual(count, len(facts))
+        self.assertEqual(self._overlay_keys(), facts)
+    
+    def test_rebuilt_only_after_changes(self):
+        self.engine.materialize()
+        version = self.graph.overlay_version
+        self.engine.materialize()
+        self.assertEqual(self.graph.overlay_version, version)
+        
+        self.graph.remove_edge(next(e.edge_id for e in self.graph.get_all_edges() if e.source_id == 2))
+        self.engine.materialize()
+        self.assertNotEqual(self.graph.overlay_version, version)
+        self.assertNotIn((1, 3, RelationType.IS_A), self._overlay_keys())
+        self.assertIn((3, 5, RelationType.IS_A), self._overlay_keys())
+    
+    def test_path_finder_follows_overlay(self):
+        self.engine.materialize()
+        base = PathFinder(self.graph).find_shortest_path(1, 3)
+        overlay = PathFinder(self.graph, include_inferred=True).find_shortest_path(1, 3)
+        self.assertEqual(len(base.edges), 2)
+        self.assertEqual(len(overlay.edges), 1)
+        self.assertTrue(overlay.edges[0].inferred)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+Tests for LandmarkIndex.
+"""
+
+import heapq
+import random
+import unittest
+
+from ..graph import GraphStore, GraphNode, RelationType, LandmarkIndex
+from ..reasoning import PathFinder
+
+
+INF = float("inf")
+
+
+def random_graph(seed: int, nodes: int = 40, edges: int = 60) -> GraphStore:
+    """Random graph with a few components and weighted edges."""
+    rnd = random.Random(seed)
+    graph = GraphStore()
+    for node_id in range(nodes):
+        graph.add_node(GraphNode(node_id=node_id, text=f"node {node_id}"))
+    for _ in range(edges):
+        source, target = rnd.sample(range(nodes), 2)
+        graph.add_edge(source, target, rnd.choice([RelationType.IS_A, RelationType.RELATED_TO]),
+                       weight=rnd.choice([0.5, 1.0, 3.0]))
+    return graph
+
+
+def distances(graph: GraphStore, source: int, cost=None):
+    """Dijkstra over edges read in both directions."""
+    dist = {source: 0.0}
+    heap = [(0.0, source)]
+    while heap:
+        score, node_id = heapq.heappop(heap)
+        if score > dist[node_id]:
+            continue
+        for edge in graph.get_outgoing_edges(node_id) + graph.get_incoming_edges(node_id):
+            neighbor = edge.target_id if edge.source_id == node_id else edge.source_id
+            step = cost(edge) if cost else 1.0
+            if score + step < dist.get(neighbor, INF):
+                dist[neighbor] = score + step
+                heapq.heappush(heap, (score + step, neighbor))
+    return dist
+
+
+class TestLandmarkIndex(unittest.TestCase):
+    """Bounds must bracket the true distance, before and after edits."""
+    
+    def _assert_bounds(self, graph, index, cost=None):
+        for landmark in index.landmarks:
+            # Distances from a landmark are stored exactly
+            exact = distances(graph, landmark, cost)
+            for node_id in range(graph.node_count):
+                if node_id in exact:
+                    self.assertAlmostEqual(index.lower_bound(landmark, node_id), exact[node_id])
+                    self.assertAlmostEqual(index.upper_bound(landmark, node_id), exact[node_id])
+        for a in range(0, graph.node_count, 3):
+            dist = distances(graph, a, cost)
+            for b in range(graph.node_count):
+                lower, upper = index.distance_bounds(a, b)
+                true = dist.get(b, INF)
+                self.assertLessEqual(lower, true + 1e-9, (a, b))
+                self.assertGreaterEqual(upper, true - 1e-9, (a, b))
+                if index.disconnected(a, b):
+                    self.assertEqual(true, INF, (a, b))
+    
+    def test_bounds_hop_count(self):
+        for seed in range(3):
+            graph = random_graph(seed)
+            self._assert_bounds(graph, LandmarkIndex(graph, num_landmarks=4))
+    
+    def test_bounds_with_cost(self):
+        graph = random_graph(7)
+        cost = PathFinder(graph)._edge_cost
+        self._assert_bounds(graph, LandmarkIndex(graph, num_landmarks=4, cost=cost), cost)
+    
+    def test_incremental_inserts_and_removals(self):
+        rnd = random.Random(11)
+        graph = random_graph(11)
+        index = LandmarkIndex(graph, num_landmarks=4)
+        self._assert_bounds(graph, index)
+        for _ in range(5):
+            for _ in range(4):
+                source, target = rnd.sample(range(graph.node_count), 2)
+                graph.add_edge(source, target, RelationType.IS_A)
+            for edge in rnd.sample(graph.get_all_edges(), 4):
+                graph.remove_edge(edge.edge_id)
+            self._assert_bounds(graph, index)
+        # Kept up to date without full rebuilds
+        self.assertEqual(index.get_stats()["rebuilds"], 1)
+    
+    def test_landmark_search_stays_optimal(self):
+        graph = random_graph(13, edges=80)
+        plain = PathFinder(graph)
+        guided = PathFinder(graph)
+        guided.use_landmarks(num_landmarks=4)
+        for source in range(0, 40, 5):
+            for target in range(40):
+                expected = plain.find_best_path(source, target)
+                found = guided.find_best_path(source, target)
+                self.assertEqual(found is None, expected is None, (source, target))
+                if expected is not None:
+                    self.assertAlmostEqual(found.score, expected.score)
+
+
+if __name__ == "__main__":
+    unittest.main()
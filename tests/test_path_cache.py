@@ -0,0 +1,110 @@
+"""
+Tests for PathCache.
+"""
+
+import random
+import unittest
+
+from ..graph import GraphStore, GraphNode, RelationType
+from ..reasoning import PathFinder, PathCache
+
+
+def path_ids(path):
+    return None if path is None else [node.node_id for node in path.nodes]
+
+
+class TestPathCache(unittest.TestCase):
+    """Cached answers are reused until the graph or overlay changes."""
+    
+    def setUp(self):
+        self.graph = GraphStore()
+        for node_id in range(6):
+            self.graph.add_node(GraphNode(node_id=node_id, text=f"node {node_id}"))
+        self.chain = [self.graph.add_edge(n, n + 1, RelationType.IS_A) for n in range(4)]
+        self.cache = PathCache()
+        self.finder = PathFinder(self.graph, cache=self.cache)
+    
+    def test_repeated_query_hits(self):
+        first = self.finder.find_best_path(0, 4)
+        second = self.finder.find_best_path(0, 4)
+        self.assertEqual(self.cache.get_stats()["hits"], 1)
+        self.assertEqual(path_ids(second), path_ids(first))
+        # Callers get copies
+        second.nodes.clear()
+        self.assertEqual(path_ids(self.finder.find_best_path(0, 4)), [0, 1, 2, 3, 4])
+    
+    def test_no_path_is_cached(self):
+        self.assertIsNone(self.finder.find_shortest_path(0, 5))
+        self.assertIsNone(self.finder.find_shortest_path(0, 5))
+        self.assertEqual(self.cache.get_stats()["hits"], 1)
+    
+    def test_graph_changes_invalidate(self):
+        self.assertEqual(path_ids(self.finder.find_shortest_path(0, 4)), [0, 1, 2, 3, 4])
+        shortcut = self.graph.add_edge(0, 3, RelationType.IS_A)
+        self.assertEqual(path_ids(self.finder.find_shortest_path(0, 4)), [0, 3, 4])
+        self.graph.remove_edge(shortcut)
+        self.graph.remove_edge(self.chain[1])
+        self.assertIsNone(self.finder.find_shortest_path(0, 4))
+        self.graph.add_edge(4, 5, RelationType.IS_A)
+        self.graph.add_edge(1, 5, RelationType.IS_A)
+        self.assertEqual(path_ids(self.finder.find_best_path(0, 4)), [0, 1, 5, 4])
+    
+    def test_filter_is_part_of_key(self):
+        self.graph.add_edge(0, 4, RelationType.RELATED_TO)
+        self.assertEqual(path_ids(self.finder.find_shortest_path(0, 4)), [0, 4])
+        restricted = self.finder.find_shortest_path(0, 4, relation_types=[RelationType.IS_A])
+        self.assertEqual(path_ids(restricted), [0, 1, 2, 3, 4])
+    
+    def test_overlay_changes_invalidate_overlay_queries_only(self):
+        overlay_finder = PathFinder(self.graph, include_inferred=True, cache=self.cache)
+        self.finder.find_shortest_path(0, 4)
+        overlay_finder.find_shortest_path(0, 4)
+        self.graph.add_inferred_edge(0, 4, RelationType.IS_A, 0.9)
+        self.assertEqual(path_ids(overlay_finder.find_shortest_path(0, 4)), [0, 4])
+        hits = self.cache.get_stats()["hits"]
+        self.assertEqual(path_ids(self.finder.find_shortest_path(0, 4)), [0, 1, 2, 3, 4])
+        self.assertEqual(self.cache.get_stats()["hits"], hits + 1)
+    
+    def test_common_ancestors(self):
+        self.graph.add_edge(5, 2, RelationType.IS_A)
+        self.assertEqual(sorted(n.node_id for n in self.finder.find_common_ancestors([0, 5])), [2, 3, 4])
+        self.graph.remove_edge(self.chain[2])
+        self.assertEqual(sorted(n.node_id for n in self.finder.find_common_ancestors([0, 5])), [2])
+    
+    def test_matches_uncached_finder(self):
+        rnd = random.Random(4)
+        uncached = PathFinder(self.graph)
+        for step in range(40):
+            source, target = rnd.sample(range(6), 2)
+            if step % 4 == 0:
+                self.graph.add_edge(source, target, rnd.choice([RelationType.IS_A, RelationType.CAUSES]))
+            elif step % 4 == 1 and self.graph.edge_count:
+                self.graph.remove_edge(rnd.choice(self.graph.get_all_edges()).edge_id)
+            for _ in range(2):
+                expected = uncached.find_best_path(source, target)
+                found = self.finder.find_best_path(source, target)
+                self.assertEqual(found is None, expected is None)
+                if expected is not None:
+                    self.assertAlmostEqual(found.score, expected.score)
+    
+    def test_bounded(self):
+        cache = PathCache(max_entries=3)
+        finder = PathFinder(self.graph, cache=cache)
+        for target in range(1, 6):
+            finder.find_shortest_path(0, target)
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.get_stats()["evictions"], 2)
+        
+        small = PathCache(max_bytes=2 * PathCache.ENTRY_BYTES)
+        finder = PathFinder(self.graph, cache=small)
+        for target in range(1, 6):
+            finder.find_shortest_path(0, target)
+        self.assertLessEqual(small.get_stats()["bytes"], 2 * PathCache.ENTRY_BYTES)
+    
+    def test_shared_per_graph(self):
+        self.assertIs(PathCache.shared(self.graph), PathCache.shared(self.graph))
+        self.assertIsNot(PathCache.shared(self.graph), PathCache.shared(GraphStore()))
+
+
+if __name__ == "__main__":
+    unittest.main()
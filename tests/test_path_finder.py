@@ -0,0 +1,153 @@
+"""
+Tests for PathFinder.
+"""
+
+import heapq
+import random
+import unittest
+
+from ..graph import GraphStore, GraphNode, RelationType
+from ..reasoning import PathFinder
+
+
+RELATIONS = [RelationType.IS_A, RelationType.PART_OF, RelationType.RELATED_TO, RelationType.CAUSES]
+
+
+def random_graph(seed: int, nodes: int = 20, edges: int = 35) -> GraphStore:
+    """Sparse random multigraph with weighted edges."""
+    rnd = random.Random(seed)
+    graph = GraphStore()
+    for node_id in range(nodes):
+        graph.add_node(GraphNode(node_id=node_id, text=f"node {node_id}"))
+    for _ in range(edges):
+        source, target = rnd.sample(range(nodes), 2)
+        graph.add_edge(source, target, rnd.choice(RELATIONS), weight=rnd.choice([0.5, 1.0, 2.0]))
+    return graph
+
+
+def brute_force_distances(finder: PathFinder, source: int, relation_types=None):
+    """Plain Dijkstra over the finder's undirected weighted view."""
+    allowed = frozenset(relation_types) if relation_types else None
+    dist = {source: 0.0}
+    heap = [(0.0, source)]
+    while heap:
+        score, node_id = heapq.heappop(heap)
+        if score > dist[node_id]:
+            continue
+        for neighbor_id, _, cost in finder._weighted_neighbors(node_id, allowed):
+            if score + cost < dist.get(neighbor_id, float("inf")):
+                dist[neighbor_id] = score + cost
+                heapq.heappush(heap, (score + cost, neighbor_id))
+    return dist
+
+
+def brute_force_paths(neighbors, source, target):
+    """Costs and edge-id tuples of every loopless path, cheapest first."""
+    found = []
+    stack = [(source, 0.0, (), {source})]
+    while stack:
+        node_id, cost, edges, seen = stack.pop()
+        if node_id == target:
+            found.append((cost, edges))
+            continue
+        for neighbor_id, edge, edge_cost in neighbors(node_id):
+            if neighbor_id not in seen:
+                stack.append((neighbor_id, cost + edge_cost, edges + (edge.edge_id,), seen | {neighbor_id}))
+    return sorted(found)
+
+
+class PathAssertions(unittest.TestCase):
+    """Shared checks for ReasoningPath results."""
+    
+    def assertValidPath(self, finder, path, source, target):
+        ids = [node.node_id for node in path.nodes]
+        self.assertEqual((ids[0], ids[-1]), (source, target))
+        self.assertEqual(len(path.edges), len(ids) - 1)
+        for (a, b), edge in zip(zip(ids, ids[1:]), path.edges):
+            self.assertEqual({a, b}, {edge.source_id, edge.target_id})
+        self.assertAlmostEqual(path.score, sum(finder._edge_cost(edge) for edge in path.edges))
+
+
+class TestBestPath(PathAssertions):
+    """Bidirectional Dijkstra returns an optimal, well-formed path."""
+    
+    def test_matches_dijkstra(self):
+        for seed in range(4):
+            graph = random_graph(seed)
+            finder = PathFinder(graph)
+            for source in range(0, 20, 3):
+                dist = brute_force_distances(finder, source)
+                for target in range(20):
+                    path = finder.find_best_path(source, target)
+                    if target not in dist:
+                        self.assertIsNone(path, (seed, source, target))
+                        continue
+                    self.assertValidPath(finder, path, source, target)
+                    self.assertAlmostEqual(path.score, dist[target], msg=(seed, source, target))
+    
+    def test_relation_filter(self):
+        graph = random_graph(5, edges=50)
+        finder = PathFinder(graph)
+        allowed = [RelationType.IS_A, RelationType.PART_OF]
+        dist = brute_force_distances(finder, 0, allowed)
+        for target in range(20):
+            path = finder.find_best_path(0, target, relation_types=allowed)
+            self.assertEqual(path is not None, target in dist)
+            if path is not None:
+                self.assertAlmostEqual(path.score, dist[target])
+                self.assertTrue(all(edge.relation_type in allowed for edge in path.edges))
+    
+    def test_same_node_and_missing_node(self):
+        finder = PathFinder(random_graph(1))
+        path = finder.find_best_path(3, 3)
+        self.assertEqual(([node.node_id for node in path.nodes], path.edges, path.score), ([3], [], 0))
+        self.assertIsNone(finder.find_best_path(3, 99))
+
+
+class TestKBestPaths(PathAssertions):
+    """Yen's algorithm returns the k cheapest loopless paths."""
+    
+    def test_matches_enumeration(self):
+        for seed in range(4):
+            graph = random_graph(10 + seed, nodes=9, edges=15)
+            finder = PathFinder(graph)
+            for source, target in ((0, 8), (1, 5), (2, 7)):
+                expected = brute_force_paths(finder._weighted_neighbors, source, target)
+                paths = finder.find_k_best_paths(source, target, k=6)
+                self.assertEqual(len(paths), min(6, len(expected)), (seed, source, target))
+                for path, (cost, _) in zip(paths, expected):
+                    self.assertValidPath(finder, path, source, target)
+                    self.assertAlmostEqual(path.score, cost)
+                    ids = [node.node_id for node in path.nodes]
+                    self.assertEqual(len(ids), len(set(ids)))
+                signatures = {tuple(edge.edge_id for edge in path.edges) for path in paths}
+                self.assertEqual(len(signatures), len(paths))
+                if paths:
+                    self.assertAlmostEqual(paths[0].score, finder.find_best_path(source, target).score)
+    
+    def test_parallel_edges_are_distinct_paths(self):
+        graph = random_graph(0, nodes=3, edges=0)
+        graph.add_edge(0, 1, RelationType.IS_A)
+        graph.add_edge(0, 1, RelationType.IS_A, weight=2.0)
+        graph.add_edge(1, 2, RelationType.IS_A)
+        scores = [path.score for path in PathFinder(graph).find_k_best_paths(0, 2, k=5)]
+        self.assertEqual(scores, [1.0, 1.5])
+    
+    def test_graph_store_hop_count(self):
+        graph = random_graph(21, nodes=8, edges=22)
+        
+        def outgoing(node_id):
+            return [(edge.target_id, edge, 1.0) for edge in graph.get_outgoing_edges(node_id)]
+        
+        for source, target in ((0, 7), (3, 4)):
+            expected = [cost for cost, _ in brute_force_paths(outgoing, source, target)][:5]
+            self.assertTrue(expected)
+            paths = graph.find_k_best_paths(source, target, k=5)
+            self.assertEqual([len(path) - 1 for path in paths], expected)
+            for path in paths:
+                for (node, edge), (next_node, _) in zip(path, path[1:]):
+                    self.assertEqual((edge.source_id, edge.target_id), (node.node_id, next_node.node_id))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+"""
+Tests for ReachabilityIndex.
+"""
+
+import random
+import unittest
+
+from ..graph import GraphStore, GraphNode, RelationType, ReachabilityIndex
+from ..reasoning import ContradictionDetector
+
+
+def brute_force_reaches(graph: GraphStore, relation: RelationType, source: int, target: int) -> bool:
+    """Plain DFS along one relation."""
+    if source == target:
+        return True
+    seen, stack = {source}, [source]
+    while stack:
+        node = stack.pop()
+        for edge in graph.get_outgoing_edges(node):
+            if edge.relation_type != relation or edge.target_id in seen:
+                continue
+            if edge.target_id == target:
+                return True
+            seen.add(edge.target_id)
+            stack.append(edge.target_id)
+    return False
+
+
+def random_graph(seed: int, nodes: int, edges: int) -> GraphStore:
+    """Random graph, mostly IS_A edges (with cycles and self-loops)."""
+    rnd = random.Random(seed)
+    graph = GraphStore()
+    for node_id in range(nodes):
+        graph.add_node(GraphNode(node_id=node_id, text=f"node {node_id}"))
+    for _ in range(edges):
+        relation = RelationType.IS_A if rnd.random() < 0.8 else RelationType.PART_OF
+        graph.add_edge(rnd.randrange(nodes), rnd.randrange(nodes), relation)
+    return graph
+
+
+class TestReachabilityIndex(unittest.TestCase):
+    """Index answers must match a DFS on small random graphs, including cycles."""
+    
+    NODES = 30
+    
+    def _random_graph(self, seed: int, edges: int) -> GraphStore:
+        return random_graph(seed, self.NODES, edges)
+    
+    def _assert_matches(self, graph: GraphStore, index: ReachabilityIndex) -> None:
+        for source in range(self.NODES):
+            for target in range(self.NODES):
+                self.assertEqual(
+                    index.reaches(source, target),
+                    brute_force_reaches(graph, RelationType.IS_A, source, target),
+                    (source, target)
+                )
+    
+    def test_matches_dfs(self):
+        for seed in range(5):
+            graph = self._random_graph(seed, 40)
+            self._assert_matches(graph, ReachabilityIndex(graph, RelationType.IS_A))
+    
+    def test_incremental_inserts(self):
+        rnd = random.Random(7)
+        graph = self._random_graph(7, 20)
+        index = ReachabilityIndex(graph, RelationType.IS_A)
+        index.reaches(0, 1)
+        for _ in range(30):
+            graph.add_edge(rnd.randrange(self.NODES), rnd.randrange(self.NODES), RelationType.IS_A)
+        self._assert_matches(graph, index)
+    
+    def test_edge_removal_invalidates(self):
+        graph = self._random_graph(3, 45)
+        index = ReachabilityIndex(graph, RelationType.IS_A)
+        self._assert_matches(graph, index)
+        for edge in graph.get_edges_by_type(RelationType.IS_A)[::3]:
+            graph.remove_edge(edge.edge_id)
+        self._assert_matches(graph, index)
+    
+    def test_path_follows_relation(self):
+        graph = self._random_graph(11, 40)
+        index = ReachabilityIndex(graph, RelationType.IS_A)
+        for source in range(self.NODES):
+            for target in range(self.NODES):
+                path = index.path(source, target)
+                if source == target or not index.reaches(source, target):
+                    continue
+                self.assertEqual(path[0].source_id, source)
+                self.assertEqual(path[-1].target_id, target)
+                for before, after in zip(path, path[1:]):
+                    self.assertEqual(before.target_id, after.source_id)
+                self.assertTrue(all(edge.relation_type == RelationType.IS_A for edge in path))
+    
+    def test_shared_per_graph_and_relation(self):
+        graph = self._random_graph(1, 10)
+        index = ReachabilityIndex.shared(graph, RelationType.IS_A)
+        self.assertIs(ReachabilityIndex.shared(graph, RelationType.IS_A), index)
+        self.assertIsNot(ReachabilityIndex.shared(graph, RelationType.PART_OF), index)
+        self.assertIsNot(ReachabilityIndex.shared(self._random_graph(1, 10), RelationType.IS_A), index)
+
+
+class TestChangeLog(unittest.TestCase):
+    """GraphStore.changes_since() reports mutations after a version."""
+    
+    def test_changes_since(self):
+        graph = GraphStore()
+        for node_id in range(3):
+            graph.add_node(GraphNode(node_id=node_id, text=f"node {node_id}"))
+        version = graph.version
+        edge_id = graph.add_edge(0, 1, RelationType.IS_A)
+        graph.remove_edge(edge_id)
+        changes = graph.changes_since(version)
+        self.assertEqual([op for _, op, _ in changes], ["add_edge", "remove_edge"])
+        self.assertEqual([item.edge_id for _, _, item in changes], [edge_id, edge_id])
+        self.assertEqual(graph.changes_since(graph.version), [])
+    
+    def test_truncated_log(self):
+        graph = GraphStore()
+        graph.add_node(GraphNode(node_id=0, text="node 0"))
+        version = graph.version
+        for _ in range(GraphStore.CHANGE_LOG_SIZE + 1):
+            graph.remove_edge(graph.add_edge(0, 0, RelationType.RELATED_TO))
+        self.assertIsNone(graph.changes_since(version))
+
+
+class TestCycleChecks(unittest.TestCase):
+    """would_contradict() flags exactly the edges that close a cycle."""
+    
+    def test_matches_dfs(self):
+        rnd = random.Random(17)
+        graph = GraphStore()
+        for node_id in range(20):
+            graph.add_node(GraphNode(node_id=node_id, text=f"node {node_id}"))
+        for _ in range(25):
+            source, target = sorted(rnd.sample(range(20), 2))
+            graph.add_edge(source, target, RelationType.IS_A)
+        detector = ContradictionDetector(graph)
+        
+        for round_ in range(2):
+            for source in range(20):
+                for target in range(20):
+                    if source == target:
+                        continue
+                    closes_cycle = brute_force_reaches(graph, RelationType.IS_A, target, source)
+                    self.assertEqual(
+                        detector.would_contradict(source, target, RelationType.IS_A)[0],
+                        closes_cycle,
+                        (round_, source, target)
+                    )
+            for edge in graph.get_edges_by_type(RelationType.IS_A)[::2]:
+                graph.remove_edge(edge.edge_id)
+
+
+class TestReachabilityOverlay(unittest.TestCase):
+    """Overlay answers match a DFS over base plus temporary edges."""
+    
+    NODES = 26
+    
+    def test_matches_dfs_with_extra_edges(self):
+        for seed in range(4):
+            rnd = random.Random(seed)
+            # The last node is isolated, so extra edges may touch unindexed nodes
+            graph = random_graph(seed, self.NODES - 1, 25)
+            graph.add_node(GraphNode(node_id=self.NODES - 1, text="isolated"))
+            overlay = ReachabilityIndex(graph, RelationType.IS_A).overlay()
+            combined = GraphStore()
+            for node in graph.get_all_nodes():
+                combined.add_node(GraphNode(node_id=node.node_id, text=node.text))
+            for edge in graph.get_edges_by_type(RelationType.IS_A):
+                combined.add_edge(edge.source_id, edge.target_id, RelationType.IS_A)
+            
+            nodes = range(self.NODES)
+            for _ in range(12):
+                source, target = rnd.choice(nodes), rnd.choice(nodes)
+                overlay.add_edge(source, target)
+                combined.add_edge(source, target, RelationType.IS_A)
+                for a in nodes:
+                    for b in nodes:
+                        self.assertEqual(
+                            overlay.reaches(a, b),
+                            brute_force_reaches(combined, RelationType.IS_A, a, b),
+                            (seed, a, b)
+                        )
+            # The base graph is untouched
+            self.assertEqual(graph.edge_count, 25)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Tests for RuleCompiler.
+"""
+
+import random
+import unittest
+
+from ..graph import GraphStore, GraphNode, RelationType
+from ..reasoning import (
+    InferenceEngine, RuleBase, RuleCompiler, JoinShape, InferenceRule, RuleType,
+)
+
+
+class TestRuleCompiler(unittest.TestCase):
+    """Rules are grouped into shared join plans and dispatched by relation."""
+    
+    def setUp(self):
+        self.rules = RuleBase()
+        self.rules.add_builtin_rules()
+    
+    def test_rules_with_same_join_share_a_plan(self):
+        self.rules.create_custom_rule("is_a_related", [RelationType.IS_A] * 2, RelationType.RELATED_TO)
+        compiled = RuleCompiler.compile(self.rules)
+        plan = next(
+            p for p in compiled.plans
+            if p.shape == JoinShape.TWO_HOP and p.relations == (RelationType.IS_A, RelationType.IS_A)
+        )
+        rule_ids = [rule.rule_id for rule in plan.rules]
+        self.assertIn("transitive_is_a", rule_ids)
+        self.assertIn("is_a_related", rule_ids)
+        self.assertEqual(len(compiled.plans), len({(p.shape, p.relations) for p in compiled.plans}))
+    
+    def test_dispatch_table_groups_by_scan_relation(self):
+        self.rules.create_custom_rule("long_chain", [RelationType.USES] * 3, RelationType.USES)
+        compiled = RuleCompiler.compile(self.rules)
+        table = compiled.dispatch_table()
+        for relation, plans in table.items():
+            for plan in plans:
+                self.assertEqual(plan.scan_relation, relation)
+                self.assertNotEqual(plan.shape, JoinShape.CHAIN)
+        dispatched = sum(len(plans) for plans in table.values())
+        chains = sum(1 for p in compiled.plans if p.shape == JoinShape.CHAIN)
+        self.assertEqual(dispatched + chains, len(compiled.plans))
+        self.assertEqual(compiled.max_body_length, 3)
+    
+    def test_shapes(self):
+        def rule(rule_type, arity):
+            return InferenceRule("r", rule_type, antecedent_relations=[RelationType.IS_A] * arity,
+                                 consequent_relation=RelationType.IS_A)
+        self.assertEqual(RuleCompiler.shape_of(rule(RuleType.INVERSE, 1)), JoinShape.SINGLE)
+        self.assertEqual(RuleCompiler.shape_of(rule(RuleType.CHAIN, 2)), JoinShape.TWO_HOP)
+        self.assertEqual(RuleCompiler.shape_of(rule(RuleType.CHAIN, 4)), JoinShape.CHAIN)
+        self.assertIsNone(RuleCompiler.shape_of(rule(RuleType.TRANSITIVITY, 3)))
+        self.assertIsNone(RuleCompiler.shape_of(rule(RuleType.CONTRADICTION, 2)))
+    
+    def test_disabled_and_excluded_rules_are_left_out(self):
+        self.rules.get_rule("transitive_is_a").enabled = False
+        compiled = RuleCompiler.compile(self.rules, exclude={"transitive_part_of"})
+        rule_ids = {rule.rule_id for rule in compiled.rules}
+        self.assertNotIn("transitive_is_a", rule_ids)
+        self.assertNotIn("transitive_part_of", rule_ids)
+    
+    def test_engine_recompiles_when_rules_change(self):
+        engine = InferenceEngine(GraphStore(), rules=self.rules)
+        compiled = engine.compile_rules()
+        self.assertIs(engine.compile_rules(), compiled)
+        self.rules.create_custom_rule("extra", [RelationType.USES] * 2, RelationType.USES)
+        self.assertIsNot(engine.compile_rules(), compiled)
+
+
+class TestCompiledEvaluation(unittest.TestCase):
+    """Shared joins derive the same facts as running each rule on its own."""
+    
+    def test_union_of_single_rule_runs(self):
+        rnd = random.Random(3)
+        relations = [RelationType.IS_A, RelationType.PART_OF, RelationType.HAS_PART, RelationType.CAUSES]
+        graph = GraphStore()
+        for node_id in range(1, 16):
+            graph.add_node(GraphNode(node_id=node_id, text=f"node {node_id}"))
+        for _ in range(50):
+            source, target = rnd.sample(range(1, 16), 2)
+            graph.add_edge(source, target, rnd.choice(relations), weight=rnd.choice([1.0, 0.7]))
+        
+        rules = RuleBase()
+        rules.add_builtin_rules()
+        engine = InferenceEngine(graph, rules=rules, use_equivalence_classes=False)
+        combined = {
+            (f.source_id, f.target_id, f.relation)
+            for f in engine.infer_all(min_confidence=0.1).inferred_facts
+        }
+        
+        separate = set()
+        for rule in rules.get_all_enabled_rules():
+            single = RuleBase()
+            single.add_rule(rule)
+            result = InferenceEngine(graph, rules=single, use_equivalence_classes=False).infer_all(min_confidence=0.1)
+            separate.update((f.source_id, f.target_id, f.relation) for f in result.inferred_facts)
+        self.assertTrue(combined)
+        self.assertEqual(combined, separate)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -87,7 +87,7 @@ class KnowledgeValidator:
         """
         self.memory = memory
         self.graph = memory.graph
-        self.contradiction_detector = ContradictionDetector(self.graph)
+        self.contradiction_detector = ContradictionDetector.shared(self.graph)
     
     def validate(
         self,
@@ -129,7 +129,7 @@ class KnowledgeValidator:
         """Check for contradictions."""
         issues = []
         
-        report = self.contradiction_detector.detect_all()
+        report = self.contradiction_detector.detect_incremental()
         
         for cont in report.contradictions:
             issues.append(ValidationIssue(